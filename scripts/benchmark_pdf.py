@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark building dashboard PDFs from a single screenshot vs. vertical tiles.
+
+The timings cover both capturing the screenshots and building the PDF, as the tiles
+are streamed into the PDF one page at a time while they are captured. With
+``--dashboard-id`` the dashboard is captured by the configured webdriver, as for
+reports; otherwise a synthetic dashboard with ``--charts`` charts is drawn with PIL,
+so that no browser is needed.
+
+    python scripts/benchmark_pdf.py --charts 100
+    python scripts/benchmark_pdf.py --dashboard-id 1 --username admin
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from io import BytesIO
+from math import ceil
+from typing import Optional
+
+import click
+from PIL import Image, ImageDraw
+
+CHARTS_PER_ROW = 4
+ROW_HEIGHT = 400
+
+
+def draw_dashboard(charts: int, width: int, top: int, height: int) -> bytes:
+    """
+    Draw the ``[top, top + height)`` slice of a synthetic dashboard as a PNG.
+    """
+    img = Image.new("RGBA", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+    chart_width = width // CHARTS_PER_ROW
+    for chart in range(charts):
+        row, col = divmod(chart, CHARTS_PER_ROW)
+        y = row * ROW_HEIGHT - top
+        if y + ROW_HEIGHT < 0 or y > height:
+            continue
+        x = col * chart_width
+        draw.rectangle((x + 8, y + 8, x + chart_width - 8, y + ROW_HEIGHT - 8), "gray")
+        for bar in range(10):
+            bar_height = (chart * 37 + bar * 53) % (ROW_HEIGHT - 60)
+            draw.rectangle(
+                (
+                    x + 20 + bar * (chart_width - 40) // 10,
+                    y + ROW_HEIGHT - 20 - bar_height,
+                    x + 10 + (bar + 1) * (chart_width - 40) // 10,
+                    y + ROW_HEIGHT - 20,
+                ),
+                "steelblue",
+            )
+    buf = BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def measure(name: str, capture: Callable[[], Iterable[bytes]]) -> None:
+    """
+    Time capturing the screenshots returned by ``capture`` and building their PDF.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.utils.pdf import build_pdf_from_screenshots
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    pdf = build_pdf_from_screenshots(capture())
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    click.echo(
+        f"{name:>8}: {duration:.2f}s, peak traced memory {peak / 2**20:.1f} MiB, "
+        f"pdf size {len(pdf) / 2**20:.1f} MiB"
+    )
+
+
+def benchmark_synthetic(charts: int, width: int, tile_height: int) -> None:
+    height = ceil(charts / CHARTS_PER_ROW) * ROW_HEIGHT
+    click.echo(f"Synthetic dashboard: {charts} charts, {width}x{height} pixels")
+
+    def single() -> Iterator[bytes]:
+        yield draw_dashboard(charts, width, 0, height)
+
+    def tiled() -> Iterator[bytes]:
+        for top in range(0, height, tile_height):
+            yield draw_dashboard(charts, width, top, min(tile_height, height - top))
+
+    measure("single", single)
+    measure("tiled", tiled)
+
+
+def benchmark_dashboard(dashboard_id: int, username: str, tile_height: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset import db, security_manager
+    from superset.models.dashboard import Dashboard
+    from superset.utils.screenshots import DashboardScreenshot
+    from superset.utils.urls import get_url_path
+
+    dashboard = db.session.query(Dashboard).filter_by(id=dashboard_id).one()
+    user = security_manager.find_user(username)
+    url = get_url_path("Superset.dashboard", dashboard_id_or_slug=dashboard.id)
+    screenshot = DashboardScreenshot(url, dashboard.digest)
+    click.echo(f"Dashboard {dashboard.dashboard_title}: {len(dashboard.slices)} charts")
+
+    def single() -> Iterator[bytes]:
+        if img := screenshot.get_screenshot(user=user):
+            yield img
+
+    measure("single", single)
+    measure(
+        "tiled",
+        lambda: screenshot.get_tiled_screenshots(user=user, tile_height=tile_height),
+    )
+
+
+@click.command()
+@click.option("--charts", default=100, help="Number of charts on the dashboard")
+@click.option("--width", default=1600, help="Dashboard width, in pixels")
+@click.option("--tile-height", default=2000, help="Tile height, in pixels")
+@click.option("--dashboard-id", type=int, help="Capture this dashboard instead")
+@click.option("--username", default="admin", help="User to capture the dashboard as")
+def main(
+    charts: int,
+    width: int,
+    tile_height: int,
+    dashboard_id: Optional[int],
+    username: str,
+) -> None:
+    if dashboard_id is None:
+        benchmark_synthetic(charts, width, tile_height)
+    else:
+        benchmark_dashboard(dashboard_id, username, tile_height)
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
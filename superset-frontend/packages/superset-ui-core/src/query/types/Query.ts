@@ -310,6 +310,7 @@ export type Query = {
   extra: {
     progress: string | null;
     errors?: SupersetError[];
+    partial_results_key?: string | null;
   };
   id: string;
   isDataPreview: boolean;
@@ -357,6 +358,8 @@ export type QueryResults = {
     query: { limit: number };
     query_id?: number;
   };
+  // the rows fetched so far by a running query
+  partialResults?: QueryResults['results'] | null;
 };
 
 export type QueryResponse = Query & QueryResults;
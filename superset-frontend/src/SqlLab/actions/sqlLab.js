@@ -87,6 +87,7 @@ export const START_QUERY = 'START_QUERY';
 export const STOP_QUERY = 'STOP_QUERY';
 export const REQUEST_QUERY_RESULTS = 'REQUEST_QUERY_RESULTS';
 export const QUERY_SUCCESS = 'QUERY_SUCCESS';
+export const QUERY_PARTIAL_RESULTS = 'QUERY_PARTIAL_RESULTS';
 export const QUERY_FAILED = 'QUERY_FAILED';
 export const CLEAR_INACTIVE_QUERIES = 'CLEAR_INACTIVE_QUERIES';
 export const CLEAR_QUERY_RESULTS = 'CLEAR_QUERY_RESULTS';
@@ -252,6 +253,10 @@ export function querySuccess(query, results) {
   return { type: QUERY_SUCCESS, query, results };
 }
 
+export function queryPartialResults(query, results) {
+  return { type: QUERY_PARTIAL_RESULTS, query, results };
+}
+
 export function queryFailed(query, msg, link, errors) {
   return function (dispatch) {
     const eventData = {
@@ -327,6 +332,24 @@ export function fetchQueryResults(query, displayLimit, timeoutInMs) {
   };
 }
 
+// fetches the rows published so far by a running query, if any
+export function fetchPartialQueryResults(query, displayLimit) {
+  return function (dispatch) {
+    const queryParams = rison.encode({
+      key: query.extra.partial_results_key,
+      rows: displayLimit || null,
+    });
+    return SupersetClient.get({
+      endpoint: `/api/v1/sqllab/results/?q=${queryParams}`,
+      parseMethod: 'json-bigint',
+    })
+      .then(({ json }) => dispatch(queryPartialResults(query, json)))
+      .catch(() => {
+        // the query finished meanwhile, its final results will be fetched
+      });
+  };
+}
+
 export function runQuery(query) {
   return function (dispatch) {
     dispatch(startQuery(query));
@@ -241,6 +241,51 @@ describe('async actions', () => {
     });
   });
 
+  describe('fetchPartialQueryResults', () => {
+    const partialQuery = {
+      ...query,
+      extra: { partial_results_key: 'partial:1:abc' },
+    };
+
+    it('fetches the partial results', () => {
+      expect.assertions(2);
+
+      fetchMock.get(
+        fetchQueryEndpoint,
+        { status: 'running', data: [] },
+        { overwriteRoutes: true },
+      );
+      const store = mockStore({});
+      return store
+        .dispatch(actions.fetchPartialQueryResults(partialQuery))
+        .then(() => {
+          expect(fetchMock.lastUrl(fetchQueryEndpoint)).toContain(
+            'partial:1:abc',
+          );
+          expect(store.getActions().map(a => a.type)).toEqual([
+            actions.QUERY_PARTIAL_RESULTS,
+          ]);
+        });
+    });
+
+    it('ignores fetch errors', () => {
+      expect.assertions(1);
+
+      fetchMock.get(
+        fetchQueryEndpoint,
+        { throws: { message: 'error text' } },
+        { overwriteRoutes: true },
+      );
+
+      const store = mockStore({});
+      return store
+        .dispatch(actions.fetchPartialQueryResults(partialQuery))
+        .then(() => {
+          expect(store.getActions()).toEqual([]);
+        });
+    });
+  });
+
   describe('runQuery without query params', () => {
     const makeRequest = () => {
       const request = actions.runQuery(query);
@@ -298,6 +298,32 @@ describe('ResultSet', () => {
     expect(progressBar).toBeInTheDocument();
   });
 
+  test('should fetch and render the partial results of a running query', async () => {
+    const { getByTestId } = setup(
+      { ...mockedProps, queryId: runningQuery.id },
+      mockStore({
+        ...initialState,
+        sqlLab: {
+          ...initialState.sqlLab,
+          queries: {
+            [runningQuery.id]: {
+              ...runningQuery,
+              extra: { progress: null, partial_results_key: 'partial:1:abc' },
+              partialResults: queries[0].results,
+            },
+          },
+        },
+      }),
+    );
+    expect(getByTestId('progress-bar')).toBeInTheDocument();
+    expect(getByTestId('table-container')).toBeInTheDocument();
+    await waitFor(() =>
+      expect(
+        fetchMock.calls('glob:*/api/v1/sqllab/results/*')[0][0],
+      ).toContain('partial'),
+    );
+  });
+
   test('should render fetching w/ 100 progress query', async () => {
     const { getByRole, getByText } = setup(
       mockedProps,
@@ -68,6 +68,7 @@ import {
   addQueryEditor,
   clearQueryResults,
   CtasEnum,
+  fetchPartialQueryResults,
   fetchQueryResults,
   reFetchQueryResults,
   reRunQuery,
@@ -197,6 +198,7 @@ const ResultSet = ({
         'isDataPreview',
         'progress',
         'extra',
+        'partialResults',
       ]),
     shallowEqual,
   );
@@ -240,6 +242,16 @@ const ResultSet = ({
     if (query.resultsKey && query.resultsKey !== prevQuery?.resultsKey) {
       fetchResults(query);
     }
+    // the partial results are republished under the same key as rows arrive
+    const partialResultsKey = query.extra?.partial_results_key;
+    if (
+      query.state === QueryState.Running &&
+      partialResultsKey &&
+      (partialResultsKey !== prevQuery?.extra?.partial_results_key ||
+        query.rows !== prevQuery?.rows)
+    ) {
+      dispatch(fetchPartialQueryResults(query, displayLimit));
+    }
   }, [query, cache]);
 
   const calculateAlertRefHeight = (alertElement: HTMLElement | null) => {
@@ -746,6 +758,29 @@ const ResultSet = ({
 
   const progressMsg = query?.extra?.progress ?? null;
 
+  const { partialResults } = query;
+  if (query.state === QueryState.Running && partialResults?.data?.length) {
+    // Accounts for offset needed for height of the progress message and bar
+    const progressHeight = 90;
+    return (
+      <ResultContainer>
+        <div>
+          {progressMsg && <Alert type="success" message={progressMsg} />}
+        </div>
+        <div>{progressBar}</div>
+        <ResultTable
+          data={partialResults.data}
+          queryId={query.id}
+          orderedColumnKeys={partialResults.columns.map(col => col.column_name)}
+          height={height - progressHeight}
+          filterText={searchText}
+          expandedColumns={[]}
+          allowHTML={getItem(LocalStorageKeys.SqllabIsRenderHtmlEnabled, true)}
+        />
+      </ResultContainer>
+    );
+  }
+
   return (
     <ResultlessStyles>
       <div>{!progressBar && <Loading position="normal" />}</div>
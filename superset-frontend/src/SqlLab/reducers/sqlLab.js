@@ -371,6 +371,7 @@ export default function sqlLabReducer(state = {}, action) {
         tempTable: action?.results?.query?.tempTable,
         errorMessage: null,
         cached: false,
+        partialResults: null,
       };
 
       const resultsKey = action?.results?.query?.resultsKey;
@@ -380,6 +381,18 @@ export default function sqlLabReducer(state = {}, action) {
 
       return alterInObject(state, 'queries', action.query, alts);
     },
+    [actions.QUERY_PARTIAL_RESULTS]() {
+      // ignore partial results fetched after the query finished
+      if (
+        state.queries[action.query.id]?.state !== QueryState.Running ||
+        action.results.status !== QueryState.Running
+      ) {
+        return state;
+      }
+      return alterInObject(state, 'queries', action.query, {
+        partialResults: action.results,
+      });
+    },
     [actions.QUERY_FAILED]() {
       if (action.query.state === QueryState.Stopped) {
         return state;
@@ -390,6 +403,7 @@ export default function sqlLabReducer(state = {}, action) {
         errorMessage: action.msg,
         endDttm: now(),
         link: action.link,
+        partialResults: null,
       };
       return alterInObject(state, 'queries', action.query, alts);
     },
@@ -481,6 +481,31 @@ describe('sqlLabReducer', () => {
     it('should refresh queries when polling returns empty', () => {
       newState = sqlLabReducer(newState, actions.refreshQueries({}));
     });
+    it('should keep the partial results of a running query', () => {
+      newState = sqlLabReducer(newState, {
+        type: actions.START_QUERY,
+        query,
+      });
+      const partialResults = { status: 'running', data: [{ a: 1 }] };
+      newState = sqlLabReducer(
+        newState,
+        actions.queryPartialResults(query, partialResults),
+      );
+      expect(newState.queries.abcd.partialResults).toBe(partialResults);
+
+      newState = sqlLabReducer(
+        newState,
+        actions.querySuccess(query, { status: 'success', data: [] }),
+      );
+      expect(newState.queries.abcd.partialResults).toBeNull();
+
+      // partial results fetched after the query finished are ignored
+      newState = sqlLabReducer(
+        newState,
+        actions.queryPartialResults(query, partialResults),
+      );
+      expect(newState.queries.abcd.partialResults).toBeNull();
+    });
   });
   describe('CLEAR_INACTIVE_QUERIES', () => {
     let newState;
@@ -54,6 +54,14 @@ class AsyncEventsRestApi(BaseSupersetApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Milliseconds to wait for new events before returning an empty
+              result (long-polling). Capped by the server, ignored when
+              long-polling is disabled
+            schema:
+                type: integer
           responses:
             200:
               description: Async event results
@@ -93,7 +101,10 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            timeout = request.args.get("timeout", 0, type=int)
+            events = async_query_manager.read_events(
+                async_channel_id, last_event_id, timeout
+            )
 
         except AsyncQueryTokenException:
             return self.response_401()
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import uuid
 from typing import Any, Literal, Optional, Union
 
@@ -112,6 +113,9 @@ class AsyncQueryManager:
         self._jwt_cookie_domain: Optional[str]
         self._jwt_cookie_samesite: Optional[Literal["None", "Lax", "Strict"]] = None
         self._jwt_secret: str
+        self._long_poll_timeout: int = 0
+        self._long_poll_slots: Optional[threading.BoundedSemaphore] = None
+        self._job_dedup_timeout: int = 0
         self._load_chart_data_into_cache_job: Any = None
         # pylint: disable=invalid-name
         self._load_explore_json_into_cache_job: Any = None
@@ -146,6 +150,12 @@ class AsyncQueryManager:
         self._jwt_cookie_samesite = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE"]
         self._jwt_cookie_domain = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN"]
         self._jwt_secret = config["GLOBAL_ASYNC_QUERIES_JWT_SECRET"]
+        self._long_poll_timeout = config["GLOBAL_ASYNC_QUERIES_LONG_POLL_TIMEOUT"]
+        self._job_dedup_timeout = config["GLOBAL_ASYNC_QUERIES_JOB_DEDUP_TIMEOUT"]
+        if self._long_poll_timeout > 0:
+            self._long_poll_slots = threading.BoundedSemaphore(
+                config["GLOBAL_ASYNC_QUERIES_LONG_POLL_MAX_WAITERS"]
+            )
 
         if config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
@@ -239,32 +249,136 @@ class AsyncQueryManager:
         channel_id: str,
         form_data: dict[str, Any],
         user_id: Optional[int] = None,
+        dedup_key: Optional[str] = None,
     ) -> dict[str, Any]:
+        """
+        Enqueue a job loading chart data into the cache.
+
+        When a `dedup_key` identifying the results is provided and a job with the
+        same key is already in flight, no new job is enqueued; instead the new job
+        is attached to the in-flight one, and is notified on its own channel when
+        the in-flight job completes.
+        """
         # pylint: disable=import-outside-toplevel
         from superset import security_manager
 
+        job_metadata = self.init_job(channel_id, user_id)
+        task_metadata = job_metadata
+        if dedup_key and self._job_dedup_timeout > 0:
+            if not self._register_job(dedup_key, job_metadata):
+                logger.debug("Attached job %s to an in-flight job", job_metadata)
+                return job_metadata
+            task_metadata = {**job_metadata, "dedup_key": dedup_key}
+
         # if it's guest user, we want to pass the guest token to the celery task
         # chart data cache key is calculated based on the current user
         # this way we can keep the cache key consistent between sync and async command
         # so that it can be looked up consistently
-        job_metadata = self.init_job(channel_id, user_id)
         self._load_chart_data_into_cache_job.delay(
-            {**job_metadata, "guest_token": guest_user.guest_token}
+            {**task_metadata, "guest_token": guest_user.guest_token}
             if (guest_user := security_manager.get_current_guest_user_if_guest())
-            else job_metadata,
+            else task_metadata,
             form_data,
         )
         return job_metadata
 
+    def _get_redis(self) -> redis.Redis:  # type: ignore
+        if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
+            return self._cache._cache  # pylint: disable=protected-access
+        return self._cache
+
+    def _get_job_dedup_keys(self, dedup_key: str) -> tuple[str, str]:
+        job_key = f"{self._stream_prefix}job-{dedup_key}"
+        return job_key, f"{job_key}-waiters"
+
+    def _register_job(self, dedup_key: str, job_metadata: dict[str, Any]) -> bool:
+        """
+        Register a job in the in-flight registry.
+
+        :returns: True if no job with the same key is in flight and the job needs
+            to be enqueued, False if it was attached to the in-flight job
+        """
+        client = self._get_redis()
+        job_key, waiters_key = self._get_job_dedup_keys(dedup_key)
+        if client.set(
+            job_key, job_metadata["job_id"], nx=True, ex=self._job_dedup_timeout
+        ):
+            return True
+
+        waiter = json.dumps(job_metadata)
+        pipeline = client.pipeline()
+        pipeline.rpush(waiters_key, waiter)
+        pipeline.expire(waiters_key, self._job_dedup_timeout)
+        pipeline.exists(job_key)
+        *_, in_flight = pipeline.execute()
+        if in_flight:
+            return False
+
+        # the in-flight job completed in the meantime, run the job on its own
+        client.lrem(waiters_key, 1, waiter)
+        return True
+
+    def _release_job(self, dedup_key: str) -> list[dict[str, Any]]:
+        """
+        Remove a job from the in-flight registry.
+
+        :returns: the metadata of the jobs that were attached to it
+        """
+        job_key, waiters_key = self._get_job_dedup_keys(dedup_key)
+        pipeline = self._get_redis().pipeline()
+        pipeline.delete(job_key)
+        pipeline.lrange(waiters_key, 0, -1)
+        pipeline.delete(waiters_key)
+        _, waiters, _ = pipeline.execute()
+        return [json.loads(waiter) for waiter in waiters]
+
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self,
+        channel: str,
+        last_id: Optional[str],
+        timeout: int = 0,
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel that were added after `last_id`.
+
+        :param channel: the async channel id
+        :param last_id: the id of the last event received by the client
+        :param timeout: if positive and long-polling is enabled, wait up to this
+            many milliseconds (capped by `GLOBAL_ASYNC_QUERIES_LONG_POLL_TIMEOUT`)
+            for new events using `XREAD BLOCK` instead of returning right away.
+            When all long-polling slots of the worker are taken, the events are
+            read without waiting.
+        """
         if not self._cache:
             raise CacheBackendNotInitialized("Cache backend not initialized")
 
         stream_name = f"{self._stream_prefix}{channel}"
-        start_id = increment_id(last_id) if last_id else "-"
-        results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        timeout = min(timeout, self._long_poll_timeout)
+        if (
+            timeout > 0
+            and self._long_poll_slots
+            # a non-blocking acquire can't be used as a context manager
+            and self._long_poll_slots.acquire(  # pylint: disable=consider-using-with
+                blocking=False
+            )
+        ):
+            try:
+                # XREAD returns the entries after the given id, "0-0" being the
+                # start of the stream
+                streams = self._cache.xread(
+                    {stream_name: last_id or "0-0"},
+                    self.MAX_EVENT_COUNT,
+                    timeout,
+                )
+            finally:
+                self._long_poll_slots.release()
+            results = [entry for _, entries in streams or [] for entry in entries]
+        else:
+            start_id = increment_id(last_id) if last_id else "-"
+            results = self._cache.xrange(
+                stream_name, start_id, "+", self.MAX_EVENT_COUNT
+            )
+
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
             decoded_results = [
@@ -294,6 +408,9 @@ class AsyncQueryManager:
         if "job_id" not in job_metadata:
             raise AsyncQueryJobException("No job ID specified")
 
+        # the dedup key is internal to the job, don't expose it in events
+        job_metadata = job_metadata.copy()
+        dedup_key = job_metadata.pop("dedup_key", None)
         updates = {"status": status, **kwargs}
         event_data = {"data": json.dumps({**job_metadata, **updates})}
 
@@ -305,3 +422,8 @@ class AsyncQueryManager:
 
         self._cache.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
         self._cache.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+
+        # notify the jobs that were attached to this one while it was in flight
+        if dedup_key and status in (self.STATUS_DONE, self.STATUS_ERROR):
+            for waiter in self._release_job(dedup_key):
+                self.update_job(waiter, status, **kwargs)
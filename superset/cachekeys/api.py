@@ -16,7 +16,7 @@
 # under the License.
 import logging
 
-from flask import request, Response
+from flask import current_app, request, Response
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -28,6 +28,8 @@ from superset.cachekeys.schemas import CacheInvalidationRequestSchema
 from superset.connectors.sqla.models import SqlaTable
 from superset.extensions import cache_manager, db, event_logger, stats_logger_manager
 from superset.models.cache import CacheKey
+from superset.utils.cache_generation import bump_generation
+from superset.utils.cache_index import DatasourceCacheKeyIndex
 from superset.views.base_api import BaseSupersetModelRestApi, statsd_metrics
 
 logger = logging.getLogger(__name__)
@@ -93,6 +95,21 @@ class CacheRestApi(BaseSupersetModelRestApi):
             if ds_obj:
                 datasource_uids.add(ds_obj.uid)
 
+        if current_app.config["DATASOURCE_CACHE_GENERATIONS"]:
+            for datasource_uid in datasource_uids:
+                bump_generation(datasource_uid)
+
+        if current_app.config["STORE_CACHE_KEYS_IN_CACHE_BACKEND"]:
+            invalidated = DatasourceCacheKeyIndex(cache_manager.data_cache).invalidate(
+                datasource_uids
+            )
+            stats_logger_manager.instance.gauge("invalidated_cache", invalidated)
+            logger.info(
+                "Invalidated %s indexed cache keys for %s datasources",
+                invalidated,
+                len(datasource_uids),
+            )
+
         cache_key_objs = (
             db.session.query(CacheKey)
             .filter(CacheKey.datasource_uid.in_(datasource_uids))
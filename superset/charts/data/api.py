@@ -340,7 +340,9 @@ class ChartDataRestApi(ChartRestApi):
         except AsyncQueryTokenException:
             return self.response_401()
 
-        result = async_command.run(form_data, get_user_id())
+        result = async_command.run(
+            form_data, get_user_id(), query_context=command.query_context
+        )
         return self.response(202, **result)
 
     def _send_chart_response(
@@ -27,7 +27,7 @@ for these chart types.
 """
 
 from io import StringIO
-from typing import Any, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
@@ -58,6 +58,189 @@ def get_column_key(label: tuple[str, ...], metrics: list[str]) -> tuple[Any, ...
     return tuple(parts)
 
 
+def get_vectorized_aggfunc(aggfunc: str, df: pd.DataFrame) -> Optional[str]:
+    """
+    Return the name of the pandas aggregation equivalent to ``aggfunc``, if any.
+
+    The named aggregations are computed by pandas in a single pass over each group,
+    but they're only equivalent to the functions in ``pivot_v2_aggfunc_map`` when
+    all the columns are numeric; object columns may still contain the temporary
+    placeholder used for null values.
+    """
+    if aggfunc not in pivot_v2_vectorized_aggfunc_map:
+        return None
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+        return None
+    return pivot_v2_vectorized_aggfunc_map[aggfunc]
+
+
+def get_pivot_aggfunc(aggfunc: str, df: pd.DataFrame) -> Union[str, Callable[..., Any]]:
+    """
+    Return the aggregation used to pivot the metrics in ``df``.
+    """
+    return get_vectorized_aggfunc(aggfunc, df) or pivot_v2_aggfunc_map[aggfunc]
+
+
+def get_subtotal_name(
+    subgroup: tuple[Any, ...],
+    nlevels: int,
+    metric_name: str,
+) -> tuple[Any, ...]:
+    """
+    Return the label of the subtotal of a given subgroup.
+
+    The subtotal of the empty subgroup is the overall total, eg:
+
+        () => ('Total (Sum)', '', '')
+        ('boy',) => ('boy', 'Subtotal', '')
+    """
+    depth = nlevels - len(subgroup) - 1
+    total = metric_name if not subgroup else __("Subtotal")
+    return tuple([*subgroup, total, *([""] * depth)])
+
+
+def get_subtotal_order(
+    labels: pd.MultiIndex,
+    positions: dict[tuple[Any, ...], int],
+) -> list[int]:
+    """
+    Return the order of the labels interleaved with the positions of the subtotals.
+
+    Each subtotal follows the last element of its group, closing the deepest groups
+    first, and the overall total comes last.
+    """
+    nlevels = labels.nlevels
+    order: list[int] = []
+    previous: Optional[tuple[Any, ...]] = None
+    for position, label in enumerate(labels):
+        if previous is not None:
+            common = 0
+            while common < nlevels - 1 and previous[common] == label[common]:
+                common += 1
+            order.extend(
+                positions[previous[:level]] for level in range(nlevels - 1, common, -1)
+            )
+        order.append(position)
+        previous = label
+    if previous is not None:
+        order.extend(positions[previous[:level]] for level in range(nlevels - 1, 0, -1))
+    order.append(positions[()])
+    return order
+
+
+def add_subtotals(
+    df: pd.DataFrame,
+    aggfunc: str,
+    metric_name: str,
+    axis: int,
+) -> pd.DataFrame:
+    """
+    Add the overall total and the subtotals of every group along an axis.
+
+    Each level of subtotals is computed with a single grouped aggregation, and the
+    subtotals are then interleaved with the original rows (or columns), so that each
+    subtotal follows the last element of its group and the overall total comes last.
+
+    :param df: A pivoted dataframe, with a ``MultiIndex`` in both axes
+    :param aggfunc: A named pandas aggregation, eg, ``sum``
+    :param metric_name: The label of the overall total
+    :param axis: Add subtotals as rows (0) or as columns (1)
+    """
+    frame = df if axis == 0 else df.T
+    labels = frame.index
+    nlevels = labels.nlevels
+
+    subtotals: list[pd.DataFrame] = []
+    positions: dict[tuple[Any, ...], int] = {}
+    for level in range(nlevels):
+        if level == 0:
+            aggregated = frame.agg(aggfunc).to_frame().T
+            subgroups: list[tuple[Any, ...]] = [()]
+        else:
+            aggregated = frame.groupby(level=list(range(level)), sort=False).agg(
+                aggfunc
+            )
+            subgroups = [
+                subgroup if isinstance(subgroup, tuple) else (subgroup,)
+                for subgroup in aggregated.index
+            ]
+        aggregated.index = pd.MultiIndex.from_tuples(
+            [
+                get_subtotal_name(subgroup, nlevels, metric_name)
+                for subgroup in subgroups
+            ]
+        )
+        for subgroup in subgroups:
+            positions[subgroup] = len(labels) + len(positions)
+        subtotals.append(aggregated)
+
+    frame = pd.concat([frame, *subtotals]).iloc[get_subtotal_order(labels, positions)]
+    if axis == 0:
+        return frame
+
+    # inserting columns keeps the names of the levels and the types of the columns,
+    # which are mixed when transposing
+    frame = frame.T.astype(df.dtypes.to_dict())
+    frame.columns.names = labels.names
+    return frame
+
+
+def add_subtotals_by_group(
+    df: pd.DataFrame,
+    aggfunc: str,
+    metric_name: str,
+    axis: int,
+    replace_nan: bool = True,
+) -> pd.DataFrame:
+    """
+    Add the overall total and the subtotals of every group along an axis.
+
+    This is the fallback of ``add_subtotals`` for aggregations that can't be
+    vectorized, or for dataframes with non-numeric values; each subtotal is computed
+    and inserted separately, starting from the overall group and iterating deeper
+    into subgroups.
+    """
+    groups = df.index if axis == 0 else df.columns
+    nlevels = groups.nlevels
+
+    if axis == 1:
+        if replace_nan:
+            for col in df.columns:
+                # we need to replace the temporary placeholder with either a string
+                # or np.nan, depending on the column type so that they can sum
+                # correctly
+                if pd.api.types.is_numeric_dtype(df[col]):
+                    df[col].replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
+                else:
+                    df[col].replace("SUPERSET_PANDAS_NAN", "nan", inplace=True)
+        else:
+            # when we applied metrics on rows, we switched the columns and rows
+            # so checking column type doesn't apply. Replace everything with np.nan
+            df.replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
+
+    for level in range(nlevels):
+        subgroups = {group[:level] for group in groups}
+        for subgroup in subgroups:
+            name = get_subtotal_name(subgroup, nlevels, metric_name)
+            if axis == 1:
+                slice_ = df.columns.get_loc(subgroup)
+                subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
+                # insert column after subgroup
+                df.insert(int(slice_.stop), name, subtotal)
+            else:
+                slice_ = df.index.get_loc(subgroup)
+                subtotal = pivot_v2_aggfunc_map[aggfunc](
+                    df.iloc[slice_, :].apply(pd.to_numeric, errors="coerce"), axis=0
+                )
+                subtotal.name = name
+                # insert row after subgroup
+                df = pd.concat(
+                    [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
+                )
+
+    return df
+
+
 def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-statements, too-many-branches
     df: pd.DataFrame,
     rows: list[str],
@@ -93,7 +276,7 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
             index=rows,
             columns=columns,
             values=metrics,
-            aggfunc=pivot_v2_aggfunc_map[aggfunc],
+            aggfunc=get_pivot_aggfunc(aggfunc, df[metrics]),
             margins=False,
         )
     else:
@@ -150,50 +333,18 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
         df.columns = pd.MultiIndex.from_tuples([(str(i),) for i in df.columns])
 
     if show_rows_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.columns
-        if not apply_metrics_on_rows:
-            for col in df.columns:
-                # we need to replace the temporary placeholder with either a string
-                # or np.nan, depending on the column type so that they can sum correctly
-                if pd.api.types.is_numeric_dtype(df[col]):
-                    df[col].replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
-                else:
-                    df[col].replace("SUPERSET_PANDAS_NAN", "nan", inplace=True)
+        if vectorized_aggfunc := get_vectorized_aggfunc(aggfunc, df):
+            df = add_subtotals(df, vectorized_aggfunc, metric_name, axis=1)
         else:
-            # when we applied metrics on rows, we switched the columns and rows
-            # so checking column type doesn't apply. Replace everything with np.nan
-            df.replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
-        for level in range(df.columns.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                slice_ = df.columns.get_loc(subgroup)
-                subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
-                depth = df.columns.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal_name = tuple([*subgroup, total, *([""] * depth)])
-                # insert column after subgroup
-                df.insert(int(slice_.stop), subtotal_name, subtotal)
+            df = add_subtotals_by_group(
+                df, aggfunc, metric_name, axis=1, replace_nan=not apply_metrics_on_rows
+            )
 
     if rows and show_columns_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.index
-        for level in range(df.index.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                slice_ = df.index.get_loc(subgroup)
-                subtotal = pivot_v2_aggfunc_map[aggfunc](
-                    df.iloc[slice_, :].apply(pd.to_numeric, errors="coerce"), axis=0
-                )
-                depth = df.index.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal.name = tuple([*subgroup, total, *([""] * depth)])
-                # insert row after subgroup
-                df = pd.concat(
-                    [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
-                )
+        if vectorized_aggfunc := get_vectorized_aggfunc(aggfunc, df):
+            df = add_subtotals(df, vectorized_aggfunc, metric_name, axis=0)
+        else:
+            df = add_subtotals_by_group(df, aggfunc, metric_name, axis=0)
 
     # if we want to apply the metrics on the rows we need to pivot the
     # dataframe back
@@ -241,6 +392,23 @@ pivot_v2_aggfunc_map = {
     "Count as Fraction of Columns": pd.Series.count,
 }
 
+# aggregations that pandas can compute for all groups at once, when the values
+# are numeric
+pivot_v2_vectorized_aggfunc_map = {
+    "Count": "count",
+    "Sum": "sum",
+    "Average": "mean",
+    "Median": "median",
+    "Minimum": "min",
+    "Maximum": "max",
+    "Sum as Fraction of Total": "sum",
+    "Sum as Fraction of Rows": "sum",
+    "Sum as Fraction of Columns": "sum",
+    "Count as Fraction of Total": "count",
+    "Count as Fraction of Rows": "count",
+    "Count as Fraction of Columns": "count",
+}
+
 
 def pivot_table_v2(
     df: pd.DataFrame,
@@ -992,6 +992,17 @@ class ChartDataExtrasSchema(Schema):
         },
         allow_none=True,
     )
+    sample_percent = fields.Float(
+        metadata={
+            "description": "Compute the result from a random sample of about this "
+            "percentage of the rows of a physical dataset, scaling up `SUM` and "
+            "`COUNT` metrics. Only supported by engines with `TABLESAMPLE`. "
+            "Default: the `sample_percent` of the dataset `extra`, if any.",
+            "example": 1,
+        },
+        validate=validate.Range(min=0, max=100, min_inclusive=False),
+        allow_none=True,
+    )
 
 
 class AnnotationLayerSchema(Schema):
@@ -1487,6 +1498,22 @@ class ChartDataResponseResult(Schema):
         required=False,
         allow_none=True,
     )
+    post_processing_stats = fields.List(
+        fields.Dict(),
+        metadata={
+            "description": "Duration and memory footprint of each post processing "
+            "step. Empty when the result is served from cache"
+        },
+        required=False,
+    )
+    sample_percent = fields.Float(
+        metadata={
+            "description": "The percentage of the rows of the dataset that were "
+            "sampled, or null if the result was computed from all the rows"
+        },
+        required=False,
+        allow_none=True,
+    )
 
 
 class ChartDataResponseSchema(Schema):
@@ -53,6 +53,66 @@ def set_database_uri(database_name: str, uri: str, skip_create: bool) -> None:
     database_utils.get_or_create_db(database_name, uri, not skip_create)
 
 
+@click.command()
+@with_appcontext
+@click.option("--database_name", "-d", required=True, help="Database name to sync")
+@click.option("--catalog", "-c", help="Only sync the datasets of this catalog")
+@click.option(
+    "--schema",
+    "-s",
+    "schemas",
+    multiple=True,
+    help="Only sync the datasets of this schema, can be repeated",
+)
+@click.option(
+    "--batch_size",
+    "-b",
+    default=100,
+    help="Number of datasets committed at a time",
+)
+@click.option(
+    "--parallelism",
+    "-p",
+    default=1,
+    help="Number of schemas synced concurrently",
+)
+def sync_dataset_metadata(
+    database_name: str,
+    catalog: Optional[str],
+    schemas: tuple[str, ...],
+    batch_size: int,
+    parallelism: int,
+) -> None:
+    """Refreshes the columns and metrics of all physical datasets of a database"""
+    # pylint: disable=import-outside-toplevel
+    from superset import db
+    from superset.commands.dataset.sync_metadata import SyncDatasetsMetadataCommand
+    from superset.models.core import Database
+
+    database = (
+        db.session.query(Database).filter_by(database_name=database_name).one_or_none()
+    )
+    if not database:
+        click.secho(f"Database {database_name} not found", fg="red")
+        sys.exit(1)
+
+    result = SyncDatasetsMetadataCommand(
+        database.id,
+        catalog=catalog,
+        schemas=list(schemas) or None,
+        batch_size=batch_size,
+        max_workers=parallelism,
+    ).run()
+    click.secho(
+        f"Synced {result.synced} datasets ({result.modified} modified)",
+        fg="green",
+    )
+    for table in result.missing:
+        click.secho(f"Table {table} no longer exists", fg="yellow")
+    for table in result.failed:
+        click.secho(f"Failed to sync {table}", fg="red")
+
+
 @click.command()
 @with_appcontext
 @transaction()
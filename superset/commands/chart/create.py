@@ -31,7 +31,10 @@ from superset.commands.chart.exceptions import (
     DashboardsForbiddenError,
     DashboardsNotFoundValidationError,
 )
-from superset.commands.utils import get_datasource_by_id
+from superset.commands.utils import (
+    get_datasource_by_id,
+    precompute_chart_fields,
+)
 from superset.daos.chart import ChartDAO
 from superset.daos.dashboard import DashboardDAO
 from superset.utils.decorators import on_error, transaction
@@ -48,7 +51,9 @@ class CreateChartCommand(CreateMixin, BaseCommand):
         self.validate()
         self._properties["last_saved_at"] = datetime.now()
         self._properties["last_saved_by"] = g.user
-        return ChartDAO.create(attributes=self._properties)
+        chart = ChartDAO.create(attributes=self._properties)
+        precompute_chart_fields(chart)
+        return chart
 
     def validate(self) -> None:
         exceptions = []
@@ -19,11 +19,34 @@ from typing import Any, Optional
 
 from flask import Request
 
+from superset.common.query_context import QueryContext
 from superset.extensions import async_query_manager
+from superset.utils.hashing import md5_sha_from_dict
 
 logger = logging.getLogger(__name__)
 
 
+def get_dedup_key(query_context: QueryContext) -> Optional[str]:
+    """
+    Build a key identifying the results of a query context for the current user,
+    used to deduplicate async jobs computing the same results. The query cache keys
+    account for the datasource, its changes and row level security.
+    """
+    try:
+        return md5_sha_from_dict(
+            {
+                "query_context": query_context.cache_key(),
+                "queries": [
+                    query_context.query_cache_key(query)
+                    for query in query_context.queries
+                ],
+            }
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to compute the async job dedup key", exc_info=True)
+        return None
+
+
 class CreateAsyncChartDataJobCommand:
     _async_channel_id: str
 
@@ -32,7 +55,13 @@ class CreateAsyncChartDataJobCommand:
             request
         )
 
-    def run(self, form_data: dict[str, Any], user_id: Optional[int]) -> dict[str, Any]:
+    def run(
+        self,
+        form_data: dict[str, Any],
+        user_id: Optional[int],
+        query_context: Optional[QueryContext] = None,
+    ) -> dict[str, Any]:
+        dedup_key = get_dedup_key(query_context) if query_context else None
         return async_query_manager.submit_chart_data_job(
-            self._async_channel_id, form_data, user_id
+            self._async_channel_id, form_data, user_id, dedup_key=dedup_key
         )
@@ -33,7 +33,12 @@ from superset.commands.chart.exceptions import (
     DashboardsNotFoundValidationError,
     DatasourceTypeUpdateRequiredValidationError,
 )
-from superset.commands.utils import get_datasource_by_id, update_tags, validate_tags
+from superset.commands.utils import (
+    get_datasource_by_id,
+    precompute_chart_fields,
+    update_tags,
+    validate_tags,
+)
 from superset.daos.chart import ChartDAO
 from superset.daos.dashboard import DashboardDAO
 from superset.exceptions import SupersetSecurityException
@@ -69,7 +74,9 @@ class UpdateChartCommand(UpdateMixin, BaseCommand):
             self._properties["last_saved_at"] = datetime.now()
             self._properties["last_saved_by"] = g.user
 
-        return ChartDAO.update(self._model, self._properties)
+        chart = ChartDAO.update(self._model, self._properties)
+        precompute_chart_fields(chart)
+        return chart
 
     def validate(self) -> None:
         exceptions: list[ValidationError] = []
@@ -15,12 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import time
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from functools import partial
 from typing import Any, Optional, TypedDict
 
 import pandas as pd
 from flask_babel import lazy_gettext as _
+from sqlalchemy import MetaData, Table as DBTable
 from werkzeug.datastructures import FileStorage
 
 from superset import db
@@ -34,6 +37,7 @@ from superset.commands.database.exceptions import (
 )
 from superset.connectors.sqla.models import SqlaTable
 from superset.daos.database import DatabaseDAO
+from superset.extensions import stats_logger_manager
 from superset.models.core import Database
 from superset.sql_parse import Table
 from superset.utils.core import get_user
@@ -60,6 +64,13 @@ class FileMetadata(TypedDict, total=False):
     items: list[FileMetadataItem]
 
 
+class UploadReport(TypedDict):
+    chunks: int
+    rows: int
+    duration_ms: float
+    rows_per_second: float
+
+
 class BaseDataReader:
     """
     Base class for reading data from a file and uploading it to a database
@@ -76,35 +87,154 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a file as a sequence of DataFrames, so that large files can be uploaded
+        without loading them in memory at once. Readers that can't parse their files
+        incrementally yield a single DataFrame.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
         database: Database,
         table_name: str,
         schema_name: Optional[str],
-    ) -> None:
-        self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
+    ) -> UploadReport:
+        """
+        Upload a file to the database one chunk at a time. The first chunk creates
+        (or replaces) the table according to the `already_exists` option, subsequent
+        chunks are appended to it. Engines that can't append to a table get all the
+        chunks at once. If a chunk fails after the table was created by the upload,
+        the partial table is dropped.
+
+        :return: report with the number of chunks and rows uploaded, and throughput
+        :throws DatabaseUploadFailed: if there is an error reading or uploading
+        """
+        start = time.perf_counter()
+        report = UploadReport(chunks=0, rows=0, duration_ms=0, rows_per_second=0)
+        already_exists = self._options.get("already_exists", "fail")
+        chunks: Iterable[pd.DataFrame] = self.file_to_dataframe_chunks(file)
+        if not database.db_engine_spec.supports_file_upload_append:
+            buffered = list(chunks)
+            chunks = [pd.concat(buffered)] if buffered else []
+
+        dtypes: Optional[pd.Series] = None
+        try:
+            for df in chunks:
+                if dtypes is None:
+                    dtypes = df.dtypes
+                else:
+                    df = self._coerce_chunk(df, dtypes)
+                self._dataframe_to_database(
+                    df,
+                    database,
+                    table_name,
+                    schema_name,
+                    already_exists=already_exists
+                    if report["chunks"] == 0
+                    else "append",
+                )
+                report["chunks"] += 1
+                report["rows"] += len(df)
+                logger.debug(
+                    "Uploaded chunk %d of %s (%d rows so far)",
+                    report["chunks"],
+                    table_name,
+                    report["rows"],
+                )
+        except DatabaseUploadFailed:
+            # rows appended to an existing table can't be told apart from its data
+            if report["chunks"] and already_exists != "append":
+                self._drop_table(database, table_name, schema_name)
+            raise
+
+        duration = time.perf_counter() - start
+        report["duration_ms"] = duration * 1000
+        report["rows_per_second"] = report["rows"] / duration if duration else 0
+        stats_logger_manager.instance.timing("upload.duration", duration)
+        stats_logger_manager.instance.gauge("upload.rows", report["rows"])
+        logger.info(
+            "Uploaded %d rows in %d chunks to %s (%.0f rows/s)",
+            report["rows"],
+            report["chunks"],
+            table_name,
+            report["rows_per_second"],
         )
+        return report
 
-    def _dataframe_to_database(
+    @staticmethod
+    def _coerce_chunk(df: pd.DataFrame, dtypes: pd.Series) -> pd.DataFrame:
+        """
+        Cast the columns of a chunk to the types inferred from the first chunk,
+        which were used to create the table. Columns that can't be cast are widened
+        instead: integers followed by missing values become nullable integers, and
+        other columns become objects, leaving the conversion to the database.
+        """
+        for column, dtype in dtypes.items():
+            if column not in df.columns or df[column].dtype == dtype:
+                continue
+            candidates: list[Any] = [dtype]
+            if pd.api.types.is_integer_dtype(dtype):
+                candidates.append("Int64")
+            for candidate in candidates:
+                try:
+                    df[column] = df[column].astype(candidate)
+                    break
+                except (TypeError, ValueError):
+                    continue
+            else:
+                logger.warning(
+                    "Column %s can't be cast to %s, uploading it as object",
+                    column,
+                    dtype,
+                )
+                df[column] = df[column].astype(object)
+        return df
+
+    @staticmethod
+    def _drop_table(
+        database: Database,
+        table_name: str,
+        schema_name: Optional[str],
+    ) -> None:
+        """
+        Drop a table left partially uploaded by a failed upload.
+        """
+        try:
+            with database.get_sqla_engine(schema=schema_name) as engine:
+                DBTable(table_name, MetaData(), schema=schema_name).drop(
+                    engine,
+                    checkfirst=True,
+                )
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to drop the partial table %s", table_name)
+
+    def _dataframe_to_database(  # pylint: disable=too-many-arguments
         self,
         df: pd.DataFrame,
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        already_exists: Optional[str] = None,
     ) -> None:
         """
         Upload DataFrame to database
 
         :param df:
+        :param already_exists: overrides the `already_exists` option
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
         try:
             data_table = Table(table=table_name, schema=schema_name)
             to_sql_kwargs = {
                 "chunksize": READ_CHUNK_SIZE,
-                "if_exists": self._options.get("already_exists", "fail"),
+                "if_exists": already_exists
+                or self._options.get("already_exists", "fail"),
                 "index": self._options.get("dataframe_index", False),
             }
             if self._options.get("index_label") and self._options.get(
@@ -146,12 +276,17 @@ class UploadCommand(BaseCommand):
         self._reader = reader
 
     @transaction(on_error=partial(on_error, reraise=DatabaseUploadSaveMetadataFailed))
-    def run(self) -> None:
+    def run(self) -> Optional[UploadReport]:
         self.validate()
         if not self._model:
-            return
+            return None
 
-        self._reader.read(self._file, self._model, self._table_name, self._schema)
+        report = self._reader.read(
+            self._file,
+            self._model,
+            self._table_name,
+            self._schema,
+        )
 
         sqla_table = (
             db.session.query(SqlaTable)
@@ -173,6 +308,7 @@ class UploadCommand(BaseCommand):
             db.session.add(sqla_table)
 
         sqla_table.fetch_metadata()
+        return report
 
     def validate(self) -> None:
         self._model = DatabaseDAO.find_by_id(self._model_id)
@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from io import BytesIO
 from pathlib import Path
 from typing import Any, IO, Optional
@@ -71,6 +71,28 @@ class ColumnarReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading Columnar file")) from ex
 
+    def _read_buffer_chunks(self, buffer: IO[bytes]) -> Iterator[pd.DataFrame]:
+        """
+        Read a Parquet file one row group at a time.
+
+        :param buffer: The Parquet file to read
+        :return: iterator of pandas DataFrames, one per row group
+        """
+        try:
+            parquet_file = pq.ParquetFile(buffer)
+            columns = self._options.get("columns_read") or None
+            if parquet_file.num_row_groups == 0:
+                # an empty file still has a schema to create the table with
+                yield parquet_file.read(columns=columns).to_pandas()
+            for index in range(parquet_file.num_row_groups):
+                yield parquet_file.read_row_group(index, columns=columns).to_pandas()
+        except (ArrowException, ValueError) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except Exception as ex:
+            raise DatabaseUploadFailed(_("Error reading Columnar file")) from ex
+
     @staticmethod
     def _yield_files(file: FileStorage) -> Generator[IO[bytes], None, None]:
         """
@@ -114,6 +136,16 @@ class ColumnarReader(BaseDataReader):
             self._read_buffer_to_dataframe(buffer) for buffer in self._yield_files(file)
         )
 
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read Columnar file as a sequence of DataFrames, one per Parquet row group
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        for buffer in self._yield_files(file):
+            yield from self._read_buffer_chunks(buffer)
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         column_names = set()
         try:
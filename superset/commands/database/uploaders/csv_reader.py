@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from typing import Any, Optional
 
 import pandas as pd
@@ -30,7 +31,8 @@ from superset.commands.database.uploaders.base import (
 
 logger = logging.getLogger(__name__)
 
-READ_CSV_CHUNK_SIZE = 1000
+# Number of rows parsed, and uploaded to the database, at a time
+READ_CSV_CHUNK_SIZE = 100_000
 ROWS_TO_READ_METADATA = 2
 
 
@@ -62,18 +64,35 @@ class CSVReader(BaseDataReader):
 
     @staticmethod
     def _read_csv(file: FileStorage, kwargs: dict[str, Any]) -> pd.DataFrame:
+        if "chunksize" in kwargs:
+            try:
+                return pd.concat(CSVReader._read_csv_chunks(file, kwargs))
+            except ValueError as ex:
+                raise DatabaseUploadFailed(
+                    message=_("Parsing error: %(error)s", error=str(ex))
+                ) from ex
+        return next(CSVReader._read_csv_chunks(file, kwargs))
+
+    @staticmethod
+    def _read_csv_chunks(
+        file: FileStorage, kwargs: dict[str, Any]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parse a CSV file lazily, one chunk of `chunksize` rows at a time, or in a
+        single DataFrame if `chunksize` isn't set.
+        """
         try:
             if "chunksize" in kwargs:
-                return pd.concat(
-                    pd.read_csv(
-                        filepath_or_buffer=file.stream,
-                        **kwargs,
-                    )
+                with pd.read_csv(
+                    filepath_or_buffer=file.stream,
+                    **kwargs,
+                ) as reader:
+                    yield from reader
+            else:
+                yield pd.read_csv(
+                    filepath_or_buffer=file.stream,
+                    **kwargs,
                 )
-            return pd.read_csv(
-                filepath_or_buffer=file.stream,
-                **kwargs,
-            )
         except (
             pd.errors.ParserError,
             pd.errors.EmptyDataError,
@@ -93,7 +112,19 @@ class CSVReader(BaseDataReader):
         :return: pandas DataFrame
         :throws DatabaseUploadFailed: if there is an error reading the file
         """
-        kwargs = {
+        return self._read_csv(file, self._read_csv_kwargs())
+
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file as a sequence of DataFrames of `READ_CSV_CHUNK_SIZE` rows
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        return self._read_csv_chunks(file, self._read_csv_kwargs())
+
+    def _read_csv_kwargs(self) -> dict[str, Any]:
+        return {
             "chunksize": READ_CSV_CHUNK_SIZE,
             "encoding": "utf-8",
             "header": self._options.get("header_row", 0),
@@ -118,7 +149,6 @@ class CSVReader(BaseDataReader):
             if self._options.get("column_data_types")
             else None,
         }
-        return self._read_csv(file, kwargs)
 
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
@@ -30,7 +30,9 @@ from superset.commands.dataset.exceptions import (
     DatasetInvalidError,
     TableNotFoundValidationError,
 )
+from superset.connectors.sqla.utils import format_physical_columns
 from superset.daos.dataset import DatasetDAO
+from superset.databases.utils import get_table_reflection
 from superset.exceptions import SupersetSecurityException
 from superset.extensions import security_manager
 from superset.sql_parse import Table
@@ -48,7 +50,19 @@ class CreateDatasetCommand(CreateMixin, BaseCommand):
         self.validate()
 
         dataset = DatasetDAO.create(attributes=self._properties)
-        dataset.fetch_metadata()
+        columns = None
+        if not dataset.sql:
+            # share the reflection cached by the table metadata endpoint
+            reflection = get_table_reflection(
+                dataset.database,
+                Table(dataset.table_name, dataset.schema or None, dataset.catalog),
+            )
+            columns = format_physical_columns(
+                dataset.database,
+                [column.copy() for column in reflection["columns"]],
+                bool(dataset.normalize_columns),
+            )
+        dataset.fetch_metadata(columns)
         return dataset
 
     def validate(self) -> None:
@@ -202,3 +202,14 @@ class DatasetForbiddenDataURI(ImportFailedError):
 class WarmUpCacheTableNotFoundError(CommandException):
     status = 404
     message = _("The provided table was not found in the provided database")
+
+
+class DatasetExtractNotAllowedError(CommandException):
+    status = 422
+    message = _(
+        "Extracts are not enabled for this dataset, or its SQL uses Jinja templating."
+    )
+
+
+class DatasetExtractRefreshFailedError(CommandException):
+    message = _("Dataset extract could not be refreshed.")
@@ -0,0 +1,153 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import os
+import re
+import tempfile
+import time
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from flask import current_app
+from sqlalchemy.sql import literal_column, select
+
+from superset.commands.base import BaseCommand
+from superset.commands.dataset.exceptions import (
+    DatasetExtractNotAllowedError,
+    DatasetExtractRefreshFailedError,
+    DatasetNotFoundError,
+)
+from superset.connectors.sqla.models import SqlaTable
+from superset.daos.dataset import DatasetDAO
+from superset.utils.core import GenericDataType
+
+logger = logging.getLogger(__name__)
+
+# the rendered SQL of a templated dataset may depend on the user or the request
+JINJA_PATTERN = re.compile(r"{{|{%")
+
+
+def get_schema(table: pa.Table, dataset: SqlaTable) -> pa.Schema:
+    """
+    Return the schema of the extract of a dataset from its first chunk.
+
+    The type of a column that has only nulls in the first chunk cannot be inferred,
+    so it's taken from the generic type of the dataset column, and the column is
+    stored as strings otherwise, which the values of later chunks can be cast to.
+    """
+    types = {
+        GenericDataType.NUMERIC: pa.float64(),
+        GenericDataType.BOOLEAN: pa.bool_(),
+    }
+    columns = {column.column_name: column for column in dataset.columns}
+    schema = table.schema
+    for index, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            column = columns.get(field.name)
+            type_ = types.get(column.type_generic) if column else None
+            schema = schema.set(index, field.with_type(type_ or pa.string()))
+    return schema
+
+
+class RefreshDatasetExtractCommand(BaseCommand):
+    """
+    Materialize all the rows of a dataset to its Parquet extract.
+
+    The rows are streamed from the database of the dataset in chunks of
+    `DATASET_EXTRACT_CHUNK_SIZE` rows to a temporary file, which then replaces the
+    previous extract atomically so that queries never read a partial extract. Row
+    level security filters are not applied: they are applied when the extract is
+    queried.
+    """
+
+    def __init__(self, model_id: int):
+        self._model_id = model_id
+        self._model: Optional[SqlaTable] = None
+
+    def run(self) -> int:
+        """
+        :returns: The number of rows in the extract
+        """
+        self.validate()
+        assert self._model
+        start_time = time.time()
+        path = self._model.extract_path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path),
+            prefix=f".{self._model.uuid}",
+            suffix=".tmp",
+        )
+        os.close(tmp_fd)
+
+        rows = 0
+        try:
+            writer: Optional[pq.ParquetWriter] = None
+            try:
+                for df in self._model.database.get_df_chunks(
+                    self.get_sql(),
+                    self._model.catalog,
+                    self._model.schema or None,
+                    chunk_size=current_app.config["DATASET_EXTRACT_CHUNK_SIZE"],
+                ):
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(
+                            tmp_path, get_schema(table, self._model)
+                        )
+                    writer.write_table(table.cast(writer.schema))
+                    rows += table.num_rows
+            finally:
+                if writer is not None:
+                    writer.close()
+            os.replace(tmp_path, path)
+        except Exception as ex:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise DatasetExtractRefreshFailedError() from ex
+
+        logger.info(
+            "Extracted %d rows of dataset %s to %s (%.2fs)",
+            rows,
+            self._model.id,
+            path,
+            time.time() - start_time,
+        )
+        return rows
+
+    def get_sql(self) -> str:
+        """
+        Return the query selecting all the rows of the dataset.
+        """
+        assert self._model
+        from_clause, cte = self._model.get_from_clause()
+        sql = self._model.database.compile_sqla_query(
+            select([literal_column("*")]).select_from(from_clause),
+            self._model.catalog,
+            self._model.schema or None,
+        )
+        return f"{cte}\n{sql}" if cte else sql
+
+    def validate(self) -> None:
+        self._model = DatasetDAO.find_by_id(self._model_id, skip_base_filter=True)
+        if not self._model:
+            raise DatasetNotFoundError()
+        if self._model.extract_settings is None or (
+            self._model.sql and JINJA_PATTERN.search(self._model.sql)
+        ):
+            raise DatasetExtractNotAllowedError()
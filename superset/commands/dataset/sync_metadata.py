@@ -0,0 +1,255 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from flask import current_app
+
+from superset import db
+from superset.commands.base import BaseCommand
+from superset.commands.database.exceptions import DatabaseNotFoundError
+from superset.connectors.sqla.models import SqlaTable
+from superset.connectors.sqla.utils import format_physical_columns
+from superset.daos.database import DatabaseDAO
+from superset.models.core import Database
+from superset.sql_parse import Table
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine.reflection import Inspector
+
+    from superset.db_engine_specs.base import MetricType
+    from superset.superset_typing import ResultSetColumnType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncDatasetsMetadataResult:
+    synced: int = 0
+    modified: int = 0
+    missing: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    def merge(self, other: "SyncDatasetsMetadataResult") -> None:
+        self.synced += other.synced
+        self.modified += other.modified
+        self.missing.extend(other.missing)
+        self.failed.extend(other.failed)
+
+
+# pylint: disable=consider-using-transaction
+class SyncDatasetsMetadataCommand(BaseCommand):
+    """
+    Refresh the columns and metrics of all the physical datasets of a database.
+
+    Rather than inspecting every table on its own, the columns of a whole schema
+    are fetched in a single catalog query when the engine spec implements
+    `get_schema_columns`, falling back to one inspection per table otherwise.
+    Changes are committed in batches, and schemas can be synced in parallel.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        database_id: int,
+        catalog: str | None = None,
+        schemas: list[str] | None = None,
+        batch_size: int = 100,
+        max_workers: int = 1,
+    ):
+        """
+        :param database_id: The database whose datasets are synced
+        :param catalog: Only sync the datasets of this catalog
+        :param schemas: Only sync the datasets of these schemas
+        :param batch_size: Number of datasets merged per commit
+        :param max_workers: Number of schemas synced concurrently
+        """
+        self._database_id = database_id
+        self._catalog = catalog
+        self._schemas = schemas
+        self._batch_size = max(batch_size, 1)
+        self._max_workers = max(max_workers, 1)
+        self._database: Database | None = None
+
+    def run(self) -> SyncDatasetsMetadataResult:
+        self.validate()
+        start_time = time.time()
+
+        query = db.session.query(
+            SqlaTable.id,
+            SqlaTable.catalog,
+            SqlaTable.schema,
+        ).filter(
+            SqlaTable.database_id == self._database_id,
+            SqlaTable.sql.is_(None),
+        )
+        if self._catalog is not None:
+            query = query.filter(SqlaTable.catalog == self._catalog)
+        if self._schemas:
+            query = query.filter(SqlaTable.schema.in_(self._schemas))
+
+        groups: dict[tuple[str | None, str | None], list[int]] = defaultdict(list)
+        for dataset_id, catalog, schema in query:
+            groups[(catalog, schema or None)].append(dataset_id)
+
+        result = SyncDatasetsMetadataResult()
+        if self._max_workers == 1 or len(groups) <= 1:
+            for (catalog, schema), dataset_ids in groups.items():
+                result.merge(self._sync_schema(catalog, schema, dataset_ids))
+        else:
+            app = current_app._get_current_object()  # pylint: disable=protected-access
+
+            def sync_in_context(
+                catalog: str | None,
+                schema: str | None,
+                dataset_ids: list[int],
+            ) -> SyncDatasetsMetadataResult:
+                with app.app_context():
+                    try:
+                        return self._sync_schema(catalog, schema, dataset_ids)
+                    finally:
+                        db.session.remove()
+
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                futures = [
+                    executor.submit(sync_in_context, catalog, schema, dataset_ids)
+                    for (catalog, schema), dataset_ids in groups.items()
+                ]
+                for future in futures:
+                    result.merge(future.result())
+
+        logger.info(
+            "Synced %d datasets (%d modified, %d missing, %d failed) "
+            "in %d schemas (%.2fs)",
+            result.synced,
+            result.modified,
+            len(result.missing),
+            len(result.failed),
+            len(groups),
+            time.time() - start_time,
+        )
+        return result
+
+    def _sync_schema(  # pylint: disable=too-many-locals
+        self,
+        catalog: str | None,
+        schema: str | None,
+        dataset_ids: list[int],
+    ) -> SyncDatasetsMetadataResult:
+        """
+        Sync the datasets of a single schema, sharing one inspector between them.
+        """
+        result = SyncDatasetsMetadataResult()
+        database = db.session.query(Database).get(self._database_id)
+        db_engine_spec = database.db_engine_spec
+        pending = list(dataset_ids)
+
+        try:
+            with database.get_inspector(catalog=catalog, schema=schema) as inspector:
+                relations = db_engine_spec.get_table_names(
+                    database, inspector, schema
+                ) | db_engine_spec.get_view_names(database, inspector, schema)
+                schema_columns = db_engine_spec.get_schema_columns(
+                    inspector, schema, database.schema_options
+                )
+
+                while pending:
+                    batch_result = SyncDatasetsMetadataResult()
+                    datasets = (
+                        db.session.query(SqlaTable)
+                        .filter(SqlaTable.id.in_(pending[: self._batch_size]))
+                        .all()
+                    )
+                    for dataset in datasets:
+                        table = Table(dataset.table_name, schema, catalog)
+                        if dataset.table_name not in relations:
+                            batch_result.missing.append(str(table))
+                            continue
+                        try:
+                            columns, metrics = self._get_dataset_metadata(
+                                database, inspector, dataset, table, schema_columns
+                            )
+                        except Exception:  # pylint: disable=broad-except
+                            logger.warning(
+                                "Failed to fetch the metadata of %s",
+                                table,
+                                exc_info=True,
+                            )
+                            batch_result.failed.append(str(table))
+                            continue
+
+                        metadata = dataset.fetch_metadata(columns, metrics)
+                        batch_result.synced += 1
+                        if metadata.added or metadata.removed or metadata.modified:
+                            batch_result.modified += 1
+
+                    db.session.commit()
+                    for dataset in datasets:
+                        db.session.expunge(dataset)
+                    result.merge(batch_result)
+                    pending = pending[self._batch_size :]
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Failed to sync the metadata of schema %s", schema, exc_info=True
+            )
+            db.session.rollback()
+            result.failed.extend(
+                str(Table(table_name, schema, catalog))
+                for (table_name,) in db.session.query(SqlaTable.table_name).filter(
+                    SqlaTable.id.in_(pending)
+                )
+            )
+
+        return result
+
+    @staticmethod
+    def _get_dataset_metadata(
+        database: Database,
+        inspector: Inspector,
+        dataset: SqlaTable,
+        table: Table,
+        schema_columns: dict[str, list[ResultSetColumnType]] | None,
+    ) -> tuple[list[ResultSetColumnType], list[MetricType]]:
+        """
+        Fetch the columns and metrics of a dataset, using the columns read for the
+        whole schema when available.
+        """
+        db_engine_spec = database.db_engine_spec
+        if schema_columns is not None and dataset.table_name in schema_columns:
+            columns = schema_columns[dataset.table_name]
+        else:
+            columns = db_engine_spec.get_columns(
+                inspector, table, database.schema_options
+            )
+        columns = format_physical_columns(
+            database,
+            columns,
+            bool(dataset.normalize_columns),
+        )
+        return columns, db_engine_spec.get_metrics(database, inspector, table)
+
+    def validate(self) -> None:
+        self._database = DatabaseDAO.find_by_id(
+            self._database_id, skip_base_filter=True
+        )
+        if not self._database:
+            raise DatabaseNotFoundError()
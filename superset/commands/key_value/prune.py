@@ -0,0 +1,83 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import time
+
+from superset import db
+from superset.commands.base import BaseCommand
+from superset.daos.key_value import KeyValueDAO
+from superset.key_value.types import KeyValueResource
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=consider-using-transaction
+class KeyValuePruneExpiredCommand(BaseCommand):
+    """
+    Command to delete expired entries of a key-value resource in bounded batches.
+
+    Every batch is committed separately so that locks are held briefly and the
+    progress made so far is kept if a later batch fails.
+    """
+
+    def __init__(
+        self,
+        resource: KeyValueResource,
+        batch_size: int = 999,
+        max_batches: int | None = None,
+    ):
+        """
+        :param resource: The resource to prune
+        :param batch_size: Maximum number of entries deleted per statement
+        :param max_batches: Maximum number of batches per run, unlimited if None
+        """
+        self.resource = resource
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+
+    def run(self) -> int:
+        """
+        Executes the prune command
+
+        :returns: The number of deleted entries
+        """
+        total_deleted = 0
+        batches = 0
+        start_time = time.time()
+
+        while self.max_batches is None or batches < self.max_batches:
+            deleted = KeyValueDAO.delete_expired_entries(
+                self.resource,
+                batch_size=self.batch_size,
+            )
+            db.session.commit()
+            total_deleted += deleted
+            batches += 1
+            if not deleted or deleted < self.batch_size:
+                break
+
+        logger.info(
+            "Pruned %s expired %s entries in %d batches (%.2fs)",
+            total_deleted,
+            self.resource.value,
+            batches,
+            time.time() - start_time,
+        )
+        return total_deleted
+
+    def validate(self) -> None:
+        pass
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 from uuid import UUID
@@ -223,10 +224,11 @@ class BaseReportState:
             **kwargs,
         )
 
-    def _get_screenshots(self) -> list[bytes]:
+    def _get_screenshot(
+        self,
+    ) -> tuple[Any, Union[ChartScreenshot, DashboardScreenshot]]:
         """
-        Get chart or dashboard screenshots
-        :raises: ReportScheduleScreenshotFailedError
+        Get the user to take the chart or dashboard screenshot as, and the screenshot
         """
         url = self._get_url()
         _, username = get_executor(
@@ -259,6 +261,14 @@ class BaseReportState:
                 window_size=window_size,
                 thumb_size=app.config["WEBDRIVER_WINDOW"]["dashboard"],
             )
+        return user, screenshot
+
+    def _get_screenshots(self) -> list[bytes]:
+        """
+        Get chart or dashboard screenshots
+        :raises: ReportScheduleScreenshotFailedError
+        """
+        user, screenshot = self._get_screenshot()
         try:
             image = screenshot.get_screenshot(user=user)
         except SoftTimeLimitExceeded as ex:
@@ -272,15 +282,39 @@ class BaseReportState:
             raise ReportScheduleScreenshotFailedError()
         return [image]
 
+    def _get_tiled_screenshots(self) -> Iterator[bytes]:
+        """
+        Yield the vertical tiles of a dashboard screenshot as they are captured
+        :raises: ReportScheduleScreenshotFailedError
+        """
+        user, screenshot = self._get_screenshot()
+        assert isinstance(screenshot, DashboardScreenshot)
+        tiles = 0
+        try:
+            for tile in screenshot.get_tiled_screenshots(user=user):
+                tiles += 1
+                yield tile
+        except SoftTimeLimitExceeded as ex:
+            logger.warning("A timeout occurred while taking a screenshot.")
+            raise ReportScheduleScreenshotTimeout() from ex
+        except Exception as ex:
+            raise ReportScheduleScreenshotFailedError(
+                f"Failed taking a screenshot {str(ex)}"
+            ) from ex
+        if not tiles:
+            raise ReportScheduleScreenshotFailedError()
+
     def _get_pdf(self) -> bytes:
         """
         Get chart or dashboard pdf
+
+        Dashboards are captured as tiles with ``SCREENSHOT_TILED_ENABLED``, which are
+        added to the pdf one page at a time as they are captured.
         :raises: ReportSchedulePdfFailedError
         """
-        screenshots = self._get_screenshots()
-        pdf = build_pdf_from_screenshots(screenshots)
-
-        return pdf
+        if app.config["SCREENSHOT_TILED_ENABLED"] and not self._report_schedule.chart:
+            return build_pdf_from_screenshots(self._get_tiled_screenshots())
+        return build_pdf_from_screenshots(self._get_screenshots())
 
     def _get_csv_data(self) -> bytes:
         url = self._get_url(result_format=ChartDataResultFormat.CSV)
@@ -17,7 +17,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast, TypedDict
+from collections.abc import Iterator
+from itertools import chain
+from typing import cast, TypedDict
 
 import pandas as pd
 from flask_babel import gettext as __
@@ -25,7 +27,12 @@ from flask_babel import gettext as __
 from superset import app, db, results_backend, results_backend_use_msgpack
 from superset.commands.base import BaseCommand
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
-from superset.exceptions import SupersetErrorException, SupersetSecurityException
+from superset.exceptions import (
+    SupersetErrorException,
+    SupersetErrorsException,
+    SupersetException,
+    SupersetSecurityException,
+)
 from superset.models.sql_lab import Query
 from superset.sql_parse import ParsedQuery
 from superset.sqllab.limiting_factor import LimitingFactor
@@ -39,8 +46,8 @@ logger = logging.getLogger(__name__)
 
 class SqlExportResult(TypedDict):
     query: Query
-    count: int
-    data: list[Any]
+    count: int | None
+    data: str | Iterator[str]
 
 
 class SqlResultExportCommand(BaseCommand):
@@ -85,6 +92,13 @@ class SqlResultExportCommand(BaseCommand):
     def run(
         self,
     ) -> SqlExportResult:
+        """
+        Export the results of the query as CSV.
+
+        Results kept in the results backend are converted at once. Otherwise the
+        query is re-run and ``data`` is an iterator streaming the CSV in chunks,
+        whose ``count`` is only known once it has been consumed.
+        """
         self.validate()
         blob = None
         if results_backend and self._query.results_key:
@@ -108,34 +122,79 @@ class SqlResultExportCommand(BaseCommand):
             )
 
             logger.info("Using pandas to convert to CSV")
+            csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
+
+            return {
+                "query": self._query,
+                "count": len(df.index),
+                "data": csv_data,
+            }
+
+        logger.info("Streaming a query into CSV")
+        if self._query.select_sql:
+            sql = self._query.select_sql
+            limit = None
         else:
-            logger.info("Running a query to turn into CSV")
-            if self._query.select_sql:
-                sql = self._query.select_sql
-                limit = None
-            else:
-                sql = self._query.executed_sql
-                limit = ParsedQuery(
-                    sql,
-                    engine=self._query.database.db_engine_spec.engine,
-                ).limit
-            if limit is not None and self._query.limiting_factor in {
-                LimitingFactor.QUERY,
-                LimitingFactor.DROPDOWN,
-                LimitingFactor.QUERY_AND_DROPDOWN,
-            }:
-                # remove extra row from `increased_limit`
-                limit -= 1
-            df = self._query.database.get_df(
+            sql = self._query.executed_sql
+            limit = ParsedQuery(
                 sql,
-                self._query.catalog,
-                self._query.schema,
-            )[:limit]
+                engine=self._query.database.db_engine_spec.engine,
+            ).limit
+        if limit is not None and self._query.limiting_factor in {
+            LimitingFactor.QUERY,
+            LimitingFactor.DROPDOWN,
+            LimitingFactor.QUERY_AND_DROPDOWN,
+        }:
+            # remove extra row from `increased_limit`
+            limit -= 1
+
+        result: SqlExportResult = {"query": self._query, "count": None, "data": ""}
+        chunks = self._stream_csv(sql, limit, result)
+        # run the query and fetch the first chunk before the response starts, so
+        # that errors are returned as such instead of ending the stream
+        try:
+            first_chunk = next(chunks)
+        except StopIteration:
+            first_chunk = ""
+        except SupersetException:
+            raise
+        except Exception as ex:  # pylint: disable=broad-except
+            raise SupersetErrorsException(
+                self._query.database.db_engine_spec.extract_errors(ex)
+            ) from ex
+        result["data"] = chain([first_chunk], chunks)
+        return result
 
-        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
+    def _stream_csv(
+        self,
+        sql: str,
+        limit: int | None,
+        result: SqlExportResult,
+    ) -> Iterator[str]:
+        """
+        Re-run the query and yield the results as CSV, one chunk of rows at a time.
+
+        The ``count`` of the result is set once all the rows have been streamed.
+        """
+        database = self._query.database
+        if limit is not None and len(database.db_engine_spec.parse_sql(sql)) == 1:
+            # push the limit down to the database rather than discarding rows
+            sql = database.apply_limit_to_sql(sql, limit)
+
+        count = 0
+        for df in database.get_df_chunks(
+            sql,
+            self._query.catalog,
+            self._query.schema,
+            chunk_size=config["SQLLAB_CSV_EXPORT_CHUNK_SIZE"],
+            limit=limit,
+        ):
+            yield csv.df_to_escaped_csv(
+                df,
+                index=False,
+                header=count == 0,
+                **config["CSV_EXPORT"],
+            )
+            count += len(df.index)
 
-        return {
-            "query": self._query,
-            "count": len(df.index),
-            "data": csv_data,
-        }
+        result["count"] = count
@@ -26,7 +26,10 @@ from superset.commands.base import BaseCommand
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SerializationError, SupersetErrorException
 from superset.models.sql_lab import Query
-from superset.sqllab.utils import apply_display_max_row_configuration_if_require
+from superset.sqllab.utils import (
+    apply_display_max_row_configuration_if_require,
+    get_partial_results_query_id,
+)
 from superset.utils import core as utils
 from superset.utils.dates import now_as_float
 from superset.views.utils import _deserialize_results_payload
@@ -82,9 +85,7 @@ class SqlExecutionResultsCommand(BaseCommand):
                 status=410,
             )
 
-        self._query = (
-            db.session.query(Query).filter_by(results_key=self._key).one_or_none()
-        )
+        self._query = self._get_query()
         if self._query is None:
             raise SupersetErrorException(
                 SupersetError(
@@ -98,6 +99,18 @@ class SqlExecutionResultsCommand(BaseCommand):
                 status=404,
             )
 
+    def _get_query(self) -> Query | None:
+        """
+        Return the query the results belong to, which is a running query for the
+        partial results it published so far.
+        """
+        if (query_id := get_partial_results_query_id(self._key)) is not None:
+            query = db.session.query(Query).filter_by(id=query_id).one_or_none()
+            if query and query.extra.get("partial_results_key") == self._key:
+                return query
+            return None
+        return db.session.query(Query).filter_by(results_key=self._key).one_or_none()
+
     def run(
         self,
     ) -> dict[str, Any]:
@@ -108,7 +121,10 @@ class SqlExecutionResultsCommand(BaseCommand):
         )
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                max_rows=self._rows,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
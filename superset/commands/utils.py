@@ -16,11 +16,13 @@
 # under the License.
 from __future__ import annotations
 
+import logging
 from collections import Counter
 from typing import Optional, TYPE_CHECKING
 
 from flask import g
 from flask_appbuilder.security.sqla.models import Role, User
+from flask_caching.backends import NullCache
 
 from superset import security_manager
 from superset.commands.exceptions import (
@@ -33,11 +35,15 @@ from superset.commands.exceptions import (
 from superset.daos.datasource import DatasourceDAO
 from superset.daos.exceptions import DatasourceNotFound
 from superset.daos.tag import TagDAO
+from superset.extensions import cache_manager
 from superset.tags.models import ObjectType, Tag, TagType
 from superset.utils.core import DatasourceType, get_user_id
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource
+    from superset.models.slice import Slice
+
+logger = logging.getLogger(__name__)
 
 
 def populate_owner_list(
@@ -185,3 +191,28 @@ def update_tags(
         TagDAO.create_custom_tagged_objects(
             object_type, object_id, [tag.name for tag in tags_to_add]
         )
+
+
+def precompute_chart_fields(chart: Slice) -> None:
+    """
+    Compute and cache the fields a chart requires from its dataset when the chart is
+    saved, so that they don't need to be computed when trimming the datasets payload
+    of the dashboards containing the chart.
+
+    :param chart: The saved chart
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import BaseDatasource
+
+    # the fields are cached in the cache defined by `CACHE_CONFIG`
+    if isinstance(cache_manager.cache.cache, NullCache):
+        return
+
+    try:
+        BaseDatasource.get_slice_required_fields(chart)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Unable to compute the fields required by chart %s",
+            chart.id,
+            exc_info=True,
+        )
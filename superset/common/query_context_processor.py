@@ -33,6 +33,7 @@ from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
 from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.common.utils.rollup_cache import RollupCache
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
@@ -51,6 +52,7 @@ from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
 from superset.utils import csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.cache_generation import get_generation, RLS_GENERATION
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -201,6 +203,8 @@ class QueryContextProcessor:
             "from_dttm": query_obj.from_dttm,
             "to_dttm": query_obj.to_dttm,
             "label_map": label_map,
+            "post_processing_stats": cache.post_processing_stats,
+            "sample_percent": cache.sample_percent,
         }
 
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
@@ -210,12 +214,21 @@ class QueryContextProcessor:
         datasource = self._qc_datasource
         extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
 
+        if config["DATASOURCE_CACHE_GENERATIONS"] and not isinstance(datasource, Query):
+            # the generations are bumped whenever the datasource or the RLS filters
+            # change, which spares reading the filters to compute the key
+            kwargs["generation"] = get_generation(datasource.uid)
+            kwargs["rls_generation"] = get_generation(RLS_GENERATION)
+            rls = security_manager.get_rls_roles_cache_key(datasource)
+        else:
+            kwargs["changed_on"] = datasource.changed_on
+            rls = security_manager.get_rls_cache_key(datasource)
+
         cache_key = (
             query_obj.cache_key(
                 datasource=datasource.uid,
                 extra_cache_keys=extra_cache_keys,
-                rls=security_manager.get_rls_cache_key(datasource),
-                changed_on=datasource.changed_on,
+                rls=rls,
                 **kwargs,
             )
             if query_obj
@@ -235,7 +248,7 @@ class QueryContextProcessor:
             # todo(hugh): add logic to manage all sip68 models here
             result = query_context.datasource.exc_query(query_object.to_dict())
         else:
-            result = query_context.datasource.query(query_object.to_dict())
+            result = self._query_datasource(query_object)
             query = result.query + ";\n\n"
 
         df = result.df
@@ -260,6 +273,7 @@ class QueryContextProcessor:
                 df = query_object.exec_post_processing(df)
             except InvalidPostProcessingError as ex:
                 raise QueryObjectValidationError(ex.message) from ex
+            result.post_processing_stats = query_object.post_processing_stats
 
         result.df = df
         result.query = query
@@ -267,6 +281,26 @@ class QueryContextProcessor:
         result.to_dttm = query_object.to_dttm
         return result
 
+    def _query_datasource(self, query_object: QueryObject) -> QueryResult:
+        """
+        Query the datasource, or roll up the result from a cached finer-grained one
+        when the roll-up cache is enabled
+        """
+        if not config["ROLLUP_CACHE_ENABLED"]:
+            return self._qc_datasource.query(query_object.to_dict())
+
+        rollup_cache = RollupCache(
+            self._qc_datasource,
+            self.query_cache_key,
+            self.get_cache_timeout(),
+        )
+        if not self._query_context.force and (result := rollup_cache.get(query_object)):
+            return result
+
+        result = self._qc_datasource.query(query_object.to_dict())
+        rollup_cache.add(query_object, result)
+        return result
+
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
         # todo: should support "python_date_format" and "get_column" in each datasource
         def _get_timestamp_format(
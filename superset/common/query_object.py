@@ -28,14 +28,14 @@ from pandas import DataFrame
 
 from superset import feature_flag_manager
 from superset.common.chart_data import ChartDataResultType
+from superset.common.utils.post_processing_pipeline import PostProcessingPipeline
 from superset.exceptions import (
-    InvalidPostProcessingError,
     QueryClauseValidationException,
     QueryObjectValidationError,
 )
 from superset.sql_parse import sanitize_clause
 from superset.superset_typing import Column, Metric, OrderBy
-from superset.utils import json, pandas_postprocessing
+from superset.utils import json
 from superset.utils.core import (
     DTTM_ALIAS,
     find_duplicates,
@@ -96,6 +96,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
     order_desc: bool
     orderby: list[OrderBy]
     post_processing: list[dict[str, Any]]
+    post_processing_stats: list[dict[str, Any]]
     result_type: ChartDataResultType | None
     row_limit: int | None
     row_offset: int
@@ -147,6 +148,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
         self.order_desc = order_desc
         self.orderby = orderby or []
         self._set_post_processing(post_processing)
+        self.post_processing_stats = []
         self.row_limit = row_limit
         self.row_offset = row_offset or 0
         self._init_series_columns(series_columns, metrics, is_timeseries)
@@ -428,19 +430,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                  is incorrect
         """
         logger.debug("post_processing: \n %s", pformat(self.post_processing))
-        for post_process in self.post_processing:
-            operation = post_process.get("operation")
-            if not operation:
-                raise InvalidPostProcessingError(
-                    _("`operation` property of post processing object undefined")
-                )
-            if not hasattr(pandas_postprocessing, operation):
-                raise InvalidPostProcessingError(
-                    _(
-                        "Unsupported post processing operation: %(operation)s",
-                        type=operation,
-                    )
-                )
-            options = post_process.get("options", {})
-            df = getattr(pandas_postprocessing, operation)(df, **options)
+        pipeline = PostProcessingPipeline(self.post_processing)
+        df = pipeline.execute(df)
+        self.post_processing_stats = pipeline.stats
         return df
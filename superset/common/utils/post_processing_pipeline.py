@@ -0,0 +1,261 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Planner and executor for the post processing operations of a query object.
+
+The operations in ``superset.utils.pandas_postprocessing`` are pure functions that
+usually return a new DataFrame. Before running them the pipeline:
+
+- skips the steps that can't change the DataFrame, eg, a ``sort`` without keys;
+- fuses adjacent steps of the same operation that add independent columns, eg,
+  two ``cum`` operations with the same operator, so the frame is copied once;
+- runs the operations that support it in place, when the input DataFrame is an
+  intermediate result owned by the pipeline.
+
+The duration and memory footprint of each step are recorded in ``stats``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from flask_babel import gettext as _
+from pandas import DataFrame
+
+from superset.constants import PandasAxis
+from superset.exceptions import InvalidPostProcessingError
+from superset.utils import pandas_postprocessing
+from superset.utils.core import TIME_COMPARISON
+
+logger = logging.getLogger(__name__)
+
+# operations that always return a DataFrame that doesn't share data with their input
+FRESH_OPERATIONS = {
+    "aggregate",
+    "boxplot",
+    "compare",
+    "contribution",
+    "cum",
+    "diff",
+    "histogram",
+    "pivot",
+    "prophet",
+    "rename",
+    "resample",
+    "rolling",
+}
+
+# operations that accept ``inplace=True`` to update their input DataFrame
+INPLACE_OPERATIONS = {"contribution", "cum", "diff", "rename", "rolling"}
+
+
+@dataclass
+class PostProcessingStep:
+    operation: str
+    options: dict[str, Any] = field(default_factory=dict)
+    # number of operations of the original request merged into this step
+    fused: int = 1
+
+
+def _is_noop(step: PostProcessingStep) -> bool:
+    """Whether a step returns its input unchanged, regardless of the DataFrame"""
+    options = step.options
+    if step.operation == "rename":
+        return not options.get("columns")
+    if step.operation == "sort":
+        return not options.get("is_sort_index") and not options.get("by")
+    if step.operation == "select":
+        return not any(options.get(key) for key in ("columns", "exclude", "rename"))
+    return False
+
+
+def _fuse_column_mappings(
+    previous: PostProcessingStep, step: PostProcessingStep
+) -> Optional[dict[str, Any]]:
+    """
+    Fuse two operations that map source columns to target columns, eg, ``cum``.
+
+    The steps can be fused when all their other options are equal, when the second
+    step doesn't read or overwrite the columns written by the first one, and when
+    both steps either replace their source columns or add new ones.
+    """
+    previous_columns = previous.options.get("columns") or {}
+    columns = step.options.get("columns") or {}
+    other_options = {key: val for key, val in step.options.items() if key != "columns"}
+    if other_options != {
+        key: val for key, val in previous.options.items() if key != "columns"
+    }:
+        return None
+    if step.operation == "diff" and other_options.get("axis", PandasAxis.ROW) not in (
+        PandasAxis.ROW,
+        PandasAxis.ROW.value,
+    ):
+        # differences between columns depend on the set of selected columns
+        return None
+    if step.operation == "rolling" and other_options.get("min_periods"):
+        # each rolling operation drops the first rows of the DataFrame
+        return None
+
+    def replaces(mapping: dict[str, str]) -> bool:
+        return all(source == target for source, target in mapping.items())
+
+    if replaces(previous_columns) != replaces(columns):
+        return None
+    written = set(previous_columns.values())
+    if written & set(columns) or written & set(columns.values()):
+        return None
+    if set(previous_columns) & set(columns):
+        return None
+    return {**step.options, "columns": {**previous_columns, **columns}}
+
+
+def _fuse_compare(
+    previous: PostProcessingStep, step: PostProcessingStep
+) -> Optional[dict[str, Any]]:
+    """
+    Fuse two ``compare`` operations, so the comparisons are appended at once.
+    """
+    keys = ("compare_type", "precision")
+    if any(previous.options.get(key) != step.options.get(key) for key in keys):
+        return None
+    if previous.options.get("drop_original_columns") or step.options.get(
+        "drop_original_columns"
+    ):
+        return None
+    written = {
+        TIME_COMPARISON.join([previous.options.get("compare_type", ""), s_col, c_col])
+        for s_col, c_col in zip(
+            previous.options.get("source_columns") or [],
+            previous.options.get("compare_columns") or [],
+        )
+    }
+    columns = {
+        *(step.options.get("source_columns") or []),
+        *(step.options.get("compare_columns") or []),
+    }
+    if written & columns:
+        return None
+    return {
+        **step.options,
+        "source_columns": [
+            *(previous.options.get("source_columns") or []),
+            *(step.options.get("source_columns") or []),
+        ],
+        "compare_columns": [
+            *(previous.options.get("compare_columns") or []),
+            *(step.options.get("compare_columns") or []),
+        ],
+    }
+
+
+FUSERS: dict[
+    str,
+    Callable[[PostProcessingStep, PostProcessingStep], Optional[dict[str, Any]]],
+] = {
+    "compare": _fuse_compare,
+    "cum": _fuse_column_mappings,
+    "diff": _fuse_column_mappings,
+    "rolling": _fuse_column_mappings,
+}
+
+
+def plan_post_processing(
+    post_processing: list[dict[str, Any]],
+) -> list[PostProcessingStep]:
+    """
+    Validate the post processing operations and plan the steps to execute.
+
+    :param post_processing: The post processing operations of a query object
+    :return: The steps to execute, in order
+    :raises InvalidPostProcessingError: If an operation is undefined or unsupported
+    """
+    steps: list[PostProcessingStep] = []
+    for post_process in post_processing:
+        operation = post_process.get("operation")
+        if not operation:
+            raise InvalidPostProcessingError(
+                _("`operation` property of post processing object undefined")
+            )
+        if not hasattr(pandas_postprocessing, operation):
+            raise InvalidPostProcessingError(
+                _(
+                    "Unsupported post processing operation: %(operation)s",
+                    operation=operation,
+                )
+            )
+        step = PostProcessingStep(operation, dict(post_process.get("options", {})))
+        if _is_noop(step):
+            logger.debug("Skipping no-op post processing step: %s", operation)
+            continue
+        if (
+            steps
+            and steps[-1].operation == operation
+            and operation in FUSERS
+            and (options := FUSERS[operation](steps[-1], step)) is not None
+        ):
+            steps[-1] = PostProcessingStep(operation, options, steps[-1].fused + 1)
+            continue
+        steps.append(step)
+    return steps
+
+
+class PostProcessingPipeline:  # pylint: disable=too-few-public-methods
+    """
+    Execute the post processing operations of a query object.
+    """
+
+    def __init__(self, post_processing: list[dict[str, Any]]) -> None:
+        self.steps = plan_post_processing(post_processing)
+        self.stats: list[dict[str, Any]] = []
+
+    def execute(self, df: DataFrame) -> DataFrame:
+        """
+        Run the planned steps on a DataFrame.
+
+        The DataFrame passed in is never updated in place; intermediate results are.
+
+        :param df: DataFrame returned from database model
+        :return: The post processed DataFrame
+        """
+        self.stats = []
+        owned = False
+        for step in self.steps:
+            options = step.options
+            if owned and step.operation in INPLACE_OPERATIONS:
+                options = {**options, "inplace": True}
+
+            start = time.perf_counter()
+            result = getattr(pandas_postprocessing, step.operation)(df, **options)
+            duration = time.perf_counter() - start
+
+            if result is not df:
+                owned = step.operation in FRESH_OPERATIONS
+            df = result
+            self.stats.append(
+                {
+                    "operation": step.operation,
+                    "fused": step.fused,
+                    "duration_ms": round(duration * 1000, 3),
+                    "rows": len(df.index),
+                    "columns": len(df.columns),
+                    "memory_bytes": int(df.memory_usage(index=True).sum()),
+                }
+            )
+        return df
@@ -48,7 +48,7 @@ class QueryCacheManager:
     Class for manage query-cache getting and setting
     """
 
-    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    # pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-locals
     def __init__(
         self,
         df: DataFrame = DataFrame(),
@@ -65,6 +65,8 @@ class QueryCacheManager:
         cache_dttm: str | None = None,
         cache_value: dict[str, Any] | None = None,
         sql_rowcount: int | None = None,
+        post_processing_stats: list[dict[str, Any]] | None = None,
+        sample_percent: float | None = None,
     ) -> None:
         self.df = df
         self.query = query
@@ -81,6 +83,8 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
         self.sql_rowcount = sql_rowcount
+        self.post_processing_stats = post_processing_stats or []
+        self.sample_percent = sample_percent
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -105,6 +109,8 @@ class QueryCacheManager:
             self.error_message = query_result.error_message
             self.df = query_result.df
             self.sql_rowcount = query_result.sql_rowcount
+            self.post_processing_stats = query_result.post_processing_stats
+            self.sample_percent = query_result.sample_percent
             self.annotation_data = {} if annotation_data is None else annotation_data
 
             if self.status != QueryStatus.FAILED:
@@ -121,6 +127,7 @@ class QueryCacheManager:
                 "rejected_filter_columns": self.rejected_filter_columns,
                 "annotation_data": self.annotation_data,
                 "sql_rowcount": self.sql_rowcount,
+                "sample_percent": self.sample_percent,
             }
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
@@ -172,6 +179,7 @@ class QueryCacheManager:
                 query_cache.is_loaded = True
                 query_cache.is_cached = cache_value is not None
                 query_cache.sql_rowcount = cache_value.get("sql_rowcount", None)
+                query_cache.sample_percent = cache_value.get("sample_percent")
                 query_cache.cache_dttm = (
                     cache_value["dttm"] if cache_value is not None else None
                 )
@@ -0,0 +1,533 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A semantic cache of datasource query results.
+
+The raw results of aggregate queries whose metrics are additive are cached along
+with a description of their dimensions, metrics and filters. Another query on the
+same datasource, which only differs by a subset of those dimensions, a coarser time
+grain or stricter filters, can then be answered by re-aggregating a cached result in
+pandas instead of querying the database.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import re
+from datetime import datetime
+from typing import Any, Callable, TYPE_CHECKING, TypedDict
+
+import pandas as pd
+
+from superset import app
+from superset.common.db_query_status import QueryStatus
+from superset.constants import TimeGrain
+from superset.extensions import cache_manager
+from superset.models.helpers import QueryResult
+from superset.stats_logger import BaseStatsLogger
+from superset.utils.cache import set_and_log_cache
+from superset.utils.core import (
+    FilterOperator,
+    get_column_name,
+    get_metric_name,
+    is_adhoc_column,
+    is_adhoc_metric,
+    is_base_axis,
+)
+
+if TYPE_CHECKING:
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import BaseDatasource
+    from superset.superset_typing import Column, Metric
+
+config = app.config
+stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
+logger = logging.getLogger(__name__)
+
+# Aggregates whose partial results can be aggregated again, counts being summed
+ADDITIVE_AGGREGATES = {"SUM", "COUNT", "MIN", "MAX"}
+
+# Time grains that can be rolled up into any coarser one, with the matching pandas
+# frequencies, from the finest to the coarsest
+TIME_GRAIN_FREQUENCIES = {
+    TimeGrain.SECOND: "s",
+    TimeGrain.MINUTE: "min",
+    TimeGrain.HOUR: "h",
+    TimeGrain.DAY: "D",
+    TimeGrain.MONTH: "M",
+    TimeGrain.QUARTER: "Q",
+    TimeGrain.YEAR: "Y",
+}
+
+SQL_METRIC_REGEX = re.compile(
+    r"^\s*(SUM|COUNT|MIN|MAX)\s*\(\s*([^()\s,]+)\s*\)\s*$",
+    re.IGNORECASE,
+)
+
+
+class RollupDescription(TypedDict):
+    key: str
+    dimensions: list[str]
+    time_column: str | None
+    time_label: str | None
+    time_grain: str | None
+    metrics: dict[str, list[str]]
+    filters: list[dict[str, Any]]
+
+
+def get_metric_identity(
+    metric: Metric,
+    saved_metrics: dict[str, str],
+) -> list[str] | None:
+    """
+    Return the aggregate and argument of an additive metric, e.g. ``["SUM", "num"]``,
+    or None if the metric cannot be re-aggregated.
+    """
+    expression: str | None
+    if is_adhoc_metric(metric):
+        if metric.get("expressionType") == "SIMPLE":
+            aggregate = str(metric.get("aggregate") or "").upper()
+            column = metric.get("column") or {}
+            if aggregate in ADDITIVE_AGGREGATES and column.get("column_name"):
+                return [aggregate, column["column_name"]]
+            return None
+        expression = metric.get("sqlExpression")
+    else:
+        expression = saved_metrics.get(metric)
+
+    if expression and (match := SQL_METRIC_REGEX.match(expression)):
+        return [match.group(1).upper(), match.group(2)]
+    return None
+
+
+def truncate_time(series: pd.Series, time_grain: str) -> pd.Series:
+    frequency = TIME_GRAIN_FREQUENCIES[TimeGrain(time_grain)]
+    if frequency in {"M", "Q", "Y"}:
+        return series.dt.to_period(frequency).dt.to_timestamp()
+    return series.dt.floor(frequency)
+
+
+def can_roll_up_time_grain(source: str | None, target: str | None) -> bool:
+    if source == target:
+        return True
+    grains = list(TIME_GRAIN_FREQUENCIES)
+    return target in grains and (
+        source is None or source in grains[: grains.index(target)]
+    )
+
+
+def get_filter_mask(series: pd.Series, flt: dict[str, Any]) -> pd.Series | None:
+    """
+    Evaluate a filter on a column of a result, or return None if it cannot be done
+    with the same semantics as in SQL.
+    """
+    op = flt.get("op")
+    if op == FilterOperator.IS_NULL:
+        return series.isna()
+    if op == FilterOperator.IS_NOT_NULL:
+        return series.notna()
+    if op not in {
+        FilterOperator.EQUALS,
+        FilterOperator.NOT_EQUALS,
+        FilterOperator.IN,
+        FilterOperator.NOT_IN,
+    }:
+        return None
+
+    values = flt.get("val")
+    values = values if isinstance(values, list) else [values]
+    if pd.api.types.is_bool_dtype(series):
+        comparable = all(isinstance(value, bool) for value in values)
+    elif pd.api.types.is_numeric_dtype(series):
+        comparable = all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in values
+        )
+    elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+        comparable = all(isinstance(value, str) for value in values)
+    else:
+        comparable = False
+    if not comparable or not values:
+        return None
+
+    mask = series.isin(values)
+    if op in {FilterOperator.NOT_EQUALS, FilterOperator.NOT_IN}:
+        # `NULL <> value` is not true in SQL
+        return ~mask & series.notna()
+    return mask
+
+
+def is_aggregation(query_object: QueryObject) -> bool:
+    """
+    Whether a query is a plain aggregation, whose rows are each a group.
+    """
+    return bool(query_object.metrics) and not (
+        query_object.is_timeseries
+        or query_object.is_rowcount
+        or query_object.series_limit
+        or query_object.row_offset
+        or query_object.extras.get("having")
+    )
+
+
+def is_complete(query_object: QueryObject, result: QueryResult) -> bool:
+    """
+    Whether a result holds every group of a query, and can thus be re-aggregated.
+    """
+    return result.status != QueryStatus.FAILED and not (
+        len(result.df.index) > config["ROLLUP_CACHE_MAX_ROWS"]
+        or (query_object.row_limit and len(result.df.index) >= query_object.row_limit)
+    )
+
+
+def reaggregate(target: Any, aggregate: str) -> Any:
+    """
+    Re-aggregate the partial results of an additive metric, in a series or in each
+    group of a series.
+    """
+    if aggregate == "COUNT":
+        return target.sum()
+    if aggregate == "SUM":
+        # `SUM` of only `NULL` values is `NULL`
+        return target.sum(min_count=1)
+    if aggregate == "MIN":
+        return target.min()
+    return target.max()
+
+
+class RollupCache:
+    """
+    Answer datasource queries from cached results with more dimensions, finer time
+    grains or fewer filters.
+
+    The results are indexed by a signature of everything else in the query, such as
+    the datasource and its generation, the time range, the `WHERE` clause and the
+    row level security filters, which is computed with the cache key function of the
+    query context.
+    """
+
+    def __init__(
+        self,
+        datasource: BaseDatasource,
+        cache_key: Callable[[QueryObject], str | None],
+        timeout: int | None = None,
+    ) -> None:
+        self.datasource = datasource
+        self.cache_key = cache_key
+        self.timeout = timeout
+        self.cache = cache_manager.data_cache
+
+    def describe(self, query_object: QueryObject) -> RollupDescription | None:
+        """
+        Describe the dimensions, metrics and filters of a query, or return None if
+        the query is not an aggregation of additive metrics.
+        """
+        if not is_aggregation(query_object):
+            return None
+
+        has_extra_cache_key_calls = getattr(
+            self.datasource, "has_extra_cache_key_calls", None
+        )
+        if has_extra_cache_key_calls and has_extra_cache_key_calls(
+            query_object.to_dict()
+        ):
+            # the query may be templated with the values of the filters
+            return None
+
+        dimensions: list[str] = []
+        time_column: Column | None = None
+        for column in query_object.columns:
+            if is_base_axis(column) and time_column is None:
+                time_column = column
+            elif isinstance(column, str):
+                dimensions.append(column)
+            else:
+                return None
+
+        saved_metrics = {
+            metric.metric_name: metric.expression for metric in self.datasource.metrics
+        }
+        metrics: dict[str, list[str]] = {}
+        for metric in query_object.metrics:
+            if (identity := get_metric_identity(metric, saved_metrics)) is None:
+                return None
+            metrics[get_metric_name(metric)] = identity
+
+        key = self.cache_key(self._get_raw_query_object(query_object))
+        if not key:
+            return None
+
+        return {
+            "key": f"rollup:{key}",
+            "dimensions": dimensions,
+            "time_column": time_column["sqlExpression"] if time_column else None,
+            "time_label": get_column_name(time_column) if time_column else None,
+            "time_grain": time_column.get("timeGrain") if time_column else None,
+            "metrics": metrics,
+            "filters": [copy.deepcopy(flt) for flt in query_object.filter],
+        }
+
+    def get_signature(self, query_object: QueryObject) -> str | None:
+        signature_object = copy.copy(query_object)
+        signature_object.columns = []
+        signature_object.metrics = []
+        signature_object.orderby = []
+        signature_object.row_limit = None
+        signature_object.filter = []
+        signature_object.post_processing = []
+        signature_object.time_offsets = []
+        signature_object.annotation_layers = []
+        if key := self.cache_key(signature_object):
+            return f"rollup_index:{key}"
+        return None
+
+    @staticmethod
+    def _get_raw_query_object(query_object: QueryObject) -> QueryObject:
+        raw_object = copy.copy(query_object)
+        raw_object.post_processing = []
+        raw_object.time_offsets = []
+        raw_object.annotation_layers = []
+        return raw_object
+
+    def add(self, query_object: QueryObject, result: QueryResult) -> None:
+        """
+        Cache the result of a query if it can later be rolled up.
+        """
+        if (
+            not is_complete(query_object, result)
+            or (description := self.describe(query_object)) is None
+            or (signature := self.get_signature(query_object)) is None
+        ):
+            return
+
+        value = {
+            "df": result.df,
+            "query": result.query,
+            "applied_template_filters": result.applied_template_filters,
+            "applied_filter_columns": result.applied_filter_columns,
+            "rejected_filter_columns": result.rejected_filter_columns,
+            "sample_percent": result.sample_percent,
+        }
+        set_and_log_cache(
+            self.cache,
+            description["key"],
+            value,
+            self.timeout,
+            self.datasource.uid,
+        )
+
+        index = [
+            entry
+            for entry in self.cache.get(signature) or []
+            if entry["key"] != description["key"]
+        ]
+        index.insert(0, description)
+        self.cache.set(
+            signature,
+            index[: config["ROLLUP_CACHE_MAX_ENTRIES"]],
+            timeout=self.timeout,
+        )
+        stats_logger.incr("rollup_cache.set")
+
+    def get(self, query_object: QueryObject) -> QueryResult | None:
+        """
+        Return the result of a query rolled up from a cached result, if any.
+        """
+        if (description := self.describe(query_object)) is None or (
+            signature := self.get_signature(query_object)
+        ) is None:
+            return None
+
+        start = datetime.now()
+        for entry in self.cache.get(signature) or []:
+            if (extra_filters := self._match(entry, description)) is None:
+                continue
+            if not (value := self.cache.get(entry["key"])):
+                continue
+            df = self._roll_up(
+                value["df"], entry, description, query_object, extra_filters
+            )
+            if df is None:
+                continue
+
+            logger.info(
+                "Query on %s rolled up from cached result %s",
+                self.datasource.uid,
+                entry["key"],
+            )
+            stats_logger.incr("rollup_cache.hit")
+            applied_filter_columns = list(value["applied_filter_columns"])
+            applied_filter_columns += [
+                flt["col"]
+                for flt in extra_filters
+                if flt["col"] not in applied_filter_columns
+            ]
+            return QueryResult(
+                df=df,
+                query=f"-- Rolled up from cached result {entry['key']}\n"
+                f"{value['query']}",
+                duration=datetime.now() - start,
+                applied_template_filters=value["applied_template_filters"],
+                applied_filter_columns=applied_filter_columns,
+                rejected_filter_columns=value["rejected_filter_columns"],
+                sample_percent=value.get("sample_percent"),
+            )
+
+        stats_logger.incr("rollup_cache.miss")
+        return None
+
+    @staticmethod
+    def _covers(entry: RollupDescription, description: RollupDescription) -> bool:
+        """
+        Whether a cached result has the time grain, dimensions and metrics of a query,
+        and no filter that the query does not have.
+        """
+        if description["time_column"] is not None and (
+            entry["time_column"] != description["time_column"]
+            or not can_roll_up_time_grain(
+                entry["time_grain"], description["time_grain"]
+            )
+        ):
+            return False
+        return (
+            set(description["dimensions"]) <= set(entry["dimensions"])
+            and all(
+                identity in entry["metrics"].values()
+                for identity in description["metrics"].values()
+            )
+            and all(flt in description["filters"] for flt in entry["filters"])
+        )
+
+    @staticmethod
+    def _match(
+        entry: RollupDescription,
+        description: RollupDescription,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Return the filters to apply to a cached result to answer a query, or None if
+        the query cannot be answered from it.
+        """
+        if not RollupCache._covers(entry, description):
+            return None
+
+        extra_filters = [
+            flt for flt in description["filters"] if flt not in entry["filters"]
+        ]
+        if any(
+            not isinstance(flt.get("col"), str) or flt["col"] not in entry["dimensions"]
+            for flt in extra_filters
+        ):
+            return None
+        return extra_filters
+
+    @staticmethod
+    def _roll_up(
+        df: pd.DataFrame,
+        entry: RollupDescription,
+        description: RollupDescription,
+        query_object: QueryObject,
+        extra_filters: list[dict[str, Any]],
+    ) -> pd.DataFrame | None:
+        for flt in extra_filters:
+            if (mask := get_filter_mask(df[flt["col"]], flt)) is None:
+                return None
+            df = df[mask]
+
+        groupby = list(description["dimensions"])
+        if (time_label := description["time_label"]) is not None:
+            time_series = df[entry["time_label"]]
+            if entry["time_grain"] != description["time_grain"]:
+                if not pd.api.types.is_datetime64_dtype(time_series):
+                    return None
+                time_series = truncate_time(time_series, description["time_grain"])
+            df = df.drop(columns=[entry["time_label"]]).assign(
+                **{time_label: time_series}
+            )
+            groupby.insert(0, time_label)
+
+        sources = {
+            label: entry_label
+            for label, identity in description["metrics"].items()
+            for entry_label, entry_identity in entry["metrics"].items()
+            if entry_identity == identity
+        }
+        if groupby:
+            result = RollupCache._aggregate_groups(df, groupby, description, sources)
+        else:
+            result = pd.DataFrame(
+                {
+                    label: [reaggregate(df[sources[label]], aggregate)]
+                    for label, (aggregate, _) in description["metrics"].items()
+                }
+            )
+        return RollupCache._sort_and_limit(result, description, query_object)
+
+    @staticmethod
+    def _aggregate_groups(
+        df: pd.DataFrame,
+        groupby: list[str],
+        description: RollupDescription,
+        sources: dict[str, str],
+    ) -> pd.DataFrame:
+        """
+        Re-aggregate the metrics of a cached result for each group of dimensions.
+        """
+        grouped = df.groupby(groupby, dropna=False, sort=False)
+        result = pd.concat(
+            {
+                label: reaggregate(grouped[sources[label]], aggregate)
+                for label, (aggregate, _) in description["metrics"].items()
+            },
+            axis=1,
+        ).reset_index()
+        for label in groupby:
+            if pd.api.types.is_object_dtype(result[label]):
+                # grouping turns `None` into `NaN`
+                result[label] = result[label].where(result[label].notna(), None)
+        return result
+
+    @staticmethod
+    def _sort_and_limit(
+        result: pd.DataFrame,
+        description: RollupDescription,
+        query_object: QueryObject,
+    ) -> pd.DataFrame | None:
+        """
+        Order and limit a rolled up result as the query would, or return None if it
+        is ordered by something that is not in the result.
+        """
+        labels = set(result.columns)
+        sort_labels: list[str] = []
+        ascending: list[bool] = []
+        for orderby, is_asc in query_object.orderby:
+            if is_adhoc_column(orderby):
+                label = get_column_name(orderby)
+            else:
+                label = get_metric_name(orderby)
+            if label not in labels:
+                return None
+            sort_labels.append(label)
+            ascending.append(is_asc)
+        if sort_labels:
+            result = result.sort_values(sort_labels, ascending=ascending)
+
+        columns = [get_column_name(column) for column in query_object.columns]
+        result = result[columns + list(description["metrics"])]
+        if query_object.row_limit:
+            result = result.head(query_object.row_limit)
+        return result.reset_index(drop=True)
@@ -80,6 +80,9 @@ STATS_LOGGER = DummyStatsLogger()
 
 # By default will log events to the metadata database with `DBEventLogger`
 # Note that you can use `StdOutEventLogger` for debugging
+# Note that you can use `AsyncDBEventLogger` to insert the logs in batches from a
+# background thread, so requests don't wait on the metadata database, eg:
+# EVENT_LOGGER = AsyncDBEventLogger(max_queue_size=10000, batch_size=500)
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
 EVENT_LOGGER = DBEventLogger()
@@ -160,6 +163,9 @@ SAMPLES_ROW_LIMIT = 1000
 NATIVE_FILTER_DEFAULT_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
+# timeout of the distinct column values cached in the data cache for filter select
+# auto complete, which also serve the searches of a prefix; None disables caching
+FILTER_SELECT_CACHE_TIMEOUT: int | None = int(timedelta(hours=1).total_seconds())
 # default time filter in explore
 # values may be "Last day", "Last week", "<ISO date> : now", etc.
 DEFAULT_TIME_FILTER = NO_TIME_RANGE
@@ -737,6 +743,14 @@ SCREENSHOT_PLAYWRIGHT_WAIT_EVENT = "load"
 SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT = int(
     timedelta(seconds=30).total_seconds() * 1000
 )
+# Capture dashboard PDF reports as vertical tiles, each rendered in its own browser
+# page (requires the PLAYWRIGHT_REPORTS_AND_THUMBNAILS feature flag). Every tile
+# becomes a page of the PDF, which keeps tall dashboards fast and memory bounded.
+SCREENSHOT_TILED_ENABLED = False
+# Height of each tile, in pixels
+SCREENSHOT_TILE_HEIGHT = 2000
+# Maximum number of browser pages capturing tiles concurrently
+SCREENSHOT_TILED_MAX_PAGES = 4
 
 # ---------------------------------------------------
 # Image and file configuration
@@ -763,6 +777,17 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Prophet forecasts are stored in the data cache, keyed by a hash of the series
+# history and the forecast parameters, so that refreshing a chart whose history has
+# not changed skips refitting the model. Set the timeout to 0 to disable the cache,
+# or to `None` to use the data cache default timeout.
+PROPHET_FORECAST_CACHE_TIMEOUT: int | None = int(timedelta(days=1).total_seconds())
+# Number of processes used to fit the series of a forecast in parallel. A value of 1
+# fits every series sequentially in the web worker. Series are always fitted
+# sequentially in daemonic processes, like Celery prefork workers, which can't start
+# child processes.
+PROPHET_MAX_WORKERS = 1
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -777,6 +802,28 @@ FILTER_STATE_CACHE_CONFIG: CacheConfig = {
     "CODEC": JsonKeyValueCodec(),
 }
 
+# In-process cache (L1) kept by every worker in front of the data cache (L2), keyed by
+# the name of the L2 cache config. The filter state cache is never tiered, as its
+# entries are overwritten in place and a stale L1 copy would go unnoticed. Each L1
+# cache holds at most `MAX_BYTES` of pickled values, evicting the least recently used
+# ones, and keeps an entry at most `MAX_TIMEOUT` seconds, and never longer than the L2
+# entry when the backend is Redis. An L1 hit saves the round trip to L2 and the
+# transfer of the value, which is still unpickled on every hit. With
+# `VALIDATE_ON_HIT` (off by default) every L1 hit first checks that the entry still
+# exists in L2, so that deletions made by other workers are honored at the cost of a
+# round trip. Entries derived from a dataset are evicted from the L1 cache of the
+# worker that updates the dataset. Hits and misses of each tier are reported to the
+# stats logger, e.g. `data_cache.l1.hit` or `data_cache.l2.miss`. Example:
+#
+# LOCAL_CACHE_CONFIG = {
+#     "DATA_CACHE_CONFIG": {
+#         "MAX_BYTES": 256 * 1024 * 1024,
+#         "MAX_TIMEOUT": 300,
+#         "VALIDATE_ON_HIT": False,
+#     },
+# }
+LOCAL_CACHE_CONFIG: dict[str, dict[str, Any]] = {}
+
 # Cache for explore form data state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -791,9 +838,60 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "CODEC": JsonKeyValueCodec(),
 }
 
+# Expired `SupersetMetastoreCache` entries are deleted by the `prune_metastore_cache`
+# Celery beat task, in batches of at most `METASTORE_CACHE_PRUNE_BATCH_SIZE` rows, each
+# committed separately. `METASTORE_CACHE_PRUNE_MAX_BATCHES` caps the number of batches
+# per run (None for no limit). To shrink large entries, a metastore cache can use
+# `ZstdKeyValueCodec(MsgpackKeyValueCodec())` as its `CODEC`, which also reports the
+# raw and compressed value sizes to the stats logger.
+METASTORE_CACHE_PRUNE_BATCH_SIZE = 999  # SQLite has a IN clause limit of 999
+METASTORE_CACHE_PRUNE_MAX_BATCHES: int | None = 1000
+
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Index the cache keys by datasource UID in the data cache backend itself, which
+# avoids writing a `CacheKey` row to the metadata database for every cached value.
+# With Redis, each datasource gets a sorted set of its cache keys that are trimmed as
+# they expire; other backends are only supported when not shared between processes.
+# `/api/v1/cachekey/invalidate` uses this index in addition to the `CacheKey` table.
+STORE_CACHE_KEYS_IN_CACHE_BACKEND = False
+
+# Fold generation counters kept in the data cache backend into the cache keys of chart
+# data, instead of the `changed_on` of the datasource and its row level security
+# filters. The generation of a dataset is bumped when the dataset, its columns or its
+# metrics are saved, and through `/api/v1/cachekey/invalidate`, which then
+# invalidates all its cached values at once; a global generation is bumped when any
+# RLS filter changes, and the key only holds the roles of the user. Enabling or
+# disabling this changes every cache key.
+DATASOURCE_CACHE_GENERATIONS = False
+
+# Answer chart data queries from a cached result of the same dataset with more
+# dimensions, a finer time grain or fewer filters, by re-aggregating it in pandas.
+# Only queries with `SUM`, `COUNT`, `MIN` or `MAX` metrics and no `HAVING` clause are
+# eligible, and only complete results of at most `ROLLUP_CACHE_MAX_ROWS` rows are
+# cached in the data cache for that purpose, with up to `ROLLUP_CACHE_MAX_ENTRIES`
+# results kept for each combination of the other query parameters. The query of a
+# rolled up result names the cache entry it was computed from.
+ROLLUP_CACHE_ENABLED = False
+ROLLUP_CACHE_MAX_ROWS = 100_000
+ROLLUP_CACHE_MAX_ENTRIES = 20
+
+# Serve the chart data queries of selected datasets from a local Parquet extract,
+# queried with an embedded DuckDB engine (requires the `duckdb` extra). A dataset opts
+# in through its `extra`, e.g. `{"extract": {"refresh_interval": 3600}}`, optionally
+# with a `max_age` in seconds after which the extract is considered stale (twice the
+# refresh interval by default). Extracts are written under `DATASET_EXTRACT_PATH` by
+# the `refresh_dataset_extracts` Celery task, which has to be added to the beat
+# schedule, and hold all the rows of the dataset: row level security filters are
+# applied when querying them. Queries fall back to the database of the dataset when
+# the extract is missing or stale, or when DuckDB fails to run them. Virtual datasets
+# using Jinja templating are never extracted.
+DATASET_EXTRACTS_ENABLED = False
+DATASET_EXTRACT_PATH = os.path.join(DATA_DIR, "extracts")
+DATASET_EXTRACT_REFRESH_INTERVAL = int(timedelta(hours=1).total_seconds())
+DATASET_EXTRACT_CHUNK_SIZE = 100_000
+
 # CORS Options
 ENABLE_CORS = False
 CORS_OPTIONS: dict[Any, Any] = {}
@@ -841,6 +939,10 @@ CSV_UPLOAD_MAX_SIZE = None
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# Number of rows fetched and converted at a time when SQL Lab re-runs a query to
+# stream its results as CSV, which bounds the memory used by large exports.
+SQLLAB_CSV_EXPORT_CHUNK_SIZE = 10000
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -975,6 +1077,13 @@ DASHBOARD_AUTO_REFRESH_INTERVALS = [
     [43200, "12 hours"],
     [86400, "24 hours"],
 ]
+# Timeout of the cached datasets payload returned to render a dashboard, and of the
+# fields each chart requires from its dataset. Both are stored in the cache defined
+# by `CACHE_CONFIG`, keyed by the versions of the dashboard, charts and datasets, so
+# they have no effect with the default `NullCache`: configure a shared cache, e.g.
+# Redis, for the fields precomputed when a chart is saved to be used.
+# Set to 0 to disable caching.
+DASHBOARD_DATASETS_CACHE_TIMEOUT = int(timedelta(days=1).total_seconds())
 
 # This is used as a workaround for the alerts & reports scheduler task to get the time
 # celery beat triggered it, see https://github.com/celery/celery/issues/6974 for details
@@ -992,14 +1101,36 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.scheduler",
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
+        "superset.tasks.extracts",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
     task_acks_late = False
+    # Task priorities, so that interactive work is picked up first when the workers
+    # are busy: dashboards > SQL Lab > reports > cache warm-up and thumbnails. The
+    # values follow the Redis broker convention, where 0 is the highest priority
+    # (the default for tasks without one) and 9 the lowest; RabbitMQ orders
+    # priorities the other way around and needs `task_queue_max_priority`. Redis
+    # only honours them with the transport options below, which other brokers ignore.
+    broker_transport_options = {
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    }
     task_annotations = {
+        "load_chart_data_into_cache": {"priority": 0},
+        "load_explore_json_into_cache": {"priority": 0},
         "sql_lab.get_sql_results": {
             "rate_limit": "100/s",
+            "priority": 3,
         },
+        "reports.execute": {"priority": 6},
+        "cache-warmup": {"priority": 9},
+        "fetch_url": {"priority": 9},
+        "cache_chart_thumbnail": {"priority": 9},
+        "cache_dashboard_thumbnail": {"priority": 9},
+        "cache_dashboard_screenshot": {"priority": 9},
+        "refresh_dataset_extracts": {"priority": 9},
     }
     beat_schedule = {
         "reports.scheduler": {
@@ -1011,12 +1142,21 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
             "task": "reports.prune_log",
             "schedule": crontab(minute=0, hour=0),
         },
+        "prune_metastore_cache": {
+            "task": "prune_metastore_cache",
+            "schedule": crontab(minute=30, hour="*"),
+        },
         # Uncomment to enable pruning of the query table
         # "prune_query": {
         #     "task": "prune_query",
         #     "schedule": crontab(minute=0, hour=0, day_of_month=1),
         #     "options": {"retention_period_days": 180},
         # },
+        # Uncomment to refresh the dataset extracts, see DATASET_EXTRACTS_ENABLED
+        # "refresh_dataset_extracts": {
+        #     "task": "refresh_dataset_extracts",
+        #     "schedule": crontab(minute="*/5", hour="*"),
+        # },
     }
 
 
@@ -1051,6 +1191,20 @@ SQLLAB_DEFAULT_DBID = None
 # The MAX duration a query can run for before being killed by celery.
 SQLLAB_ASYNC_TIME_LIMIT_SEC = int(timedelta(hours=6).total_seconds())
 
+# Maximum number of queries that async chart data and SQL Lab Celery tasks can run
+# concurrently against a database, keyed by database name, so that a slow database
+# can't take up all the workers. `DATABASE_CONCURRENCY_LIMIT_DEFAULT` applies to the
+# databases not listed (None for no limit). A task that can't get a query slot is
+# retried after `DATABASE_CONCURRENCY_RETRY_DELAY` seconds, freeing its worker for
+# queries on other databases. Slots are distributed locks in the metastore, released
+# after `DATABASE_CONCURRENCY_SLOT_TIMEOUT` seconds if a worker dies holding one.
+# The time spent waiting for a slot and the number of retries are reported as the
+# `database.<id>.wait_time` and `database.<id>.throttled` metrics.
+DATABASE_CONCURRENCY_LIMITS: dict[str, int] = {}
+DATABASE_CONCURRENCY_LIMIT_DEFAULT: int | None = None
+DATABASE_CONCURRENCY_RETRY_DELAY = 5
+DATABASE_CONCURRENCY_SLOT_TIMEOUT = SQLLAB_ASYNC_TIME_LIMIT_SEC
+
 # Some databases support running EXPLAIN queries that allow users to estimate
 # query costs before they run. These EXPLAIN queries should have a small
 # timeout.
@@ -1125,6 +1279,16 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Fetch the results of asynchronous SQL Lab queries in batches of this many rows, and
+# publish the rows fetched so far to the results backend while the query is still
+# running, so that the first rows of long-running queries can be shown early. The
+# partial results are stored under the `partial_results_key` of the query extra until
+# the query finishes, and are republished each time the number of fetched rows
+# doubles, which keeps the cost of serializing them proportional to the size of the
+# result. The `progress` of the query tracks the fetched rows against its limit. None
+# disables progressive fetching.
+SQLLAB_PROGRESSIVE_FETCH_BATCH_SIZE: int | None = None
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1718,6 +1882,21 @@ GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# Long-polling for the "polling" transport: when positive, the client asks the
+# `/api/v1/async_event/` endpoint to wait up to this many milliseconds for new events
+# (using Redis `XREAD BLOCK`) instead of returning an empty result right away, which
+# lowers both event latency and the number of requests. A waiting request occupies
+# a web server thread, so `GLOBAL_ASYNC_QUERIES_LONG_POLL_MAX_WAITERS` bounds the
+# number of requests waiting at once in each worker process; additional requests
+# return immediately. Use a threaded or async worker class when enabling this.
+GLOBAL_ASYNC_QUERIES_LONG_POLL_TIMEOUT = 0
+GLOBAL_ASYNC_QUERIES_LONG_POLL_MAX_WAITERS = 32
+# Async chart data jobs computing the same results (same queries, same row level
+# security) are deduplicated: while a job is in flight, requests for the same results
+# are attached to it rather than enqueueing another Celery task, and are notified on
+# their own channel when it completes. This is the number of seconds after which an
+# in-flight job is forgotten, in case its worker died; set to 0 to disable.
+GLOBAL_ASYNC_QUERIES_JOB_DEDUP_TIMEOUT = int(timedelta(minutes=10).total_seconds())
 
 # Global async queries cache backend configuration options:
 # - Set 'CACHE_TYPE' to 'RedisCache' for RedisCacheBackend.
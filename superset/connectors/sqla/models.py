@@ -19,12 +19,16 @@ from __future__ import annotations
 
 import builtins
 import dataclasses
+import importlib.util
 import logging
+import os
 import re
+import time
 from collections import defaultdict
 from collections.abc import Hashable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import cache
 from typing import Any, Callable, cast, Optional, Union
 
 import dateutil.parser
@@ -79,7 +83,11 @@ from superset.connectors.sqla.utils import (
     get_virtual_table_metadata,
 )
 from superset.constants import EMPTY_STRING, NULL_STRING
-from superset.db_engine_specs.base import BaseEngineSpec, TimestampExpression
+from superset.db_engine_specs.base import (
+    BaseEngineSpec,
+    MetricType,
+    TimestampExpression,
+)
 from superset.exceptions import (
     ColumnNotFoundException,
     DatasetInvalidPermissionEvaluationException,
@@ -89,6 +97,7 @@ from superset.exceptions import (
     SupersetGenericDBErrorException,
     SupersetSecurityException,
 )
+from superset.extensions import cache_manager
 from superset.jinja_context import (
     BaseTemplateProcessor,
     ExtraCache,
@@ -116,11 +125,15 @@ from superset.superset_typing import (
 )
 from superset.utils import core as utils, json
 from superset.utils.backports import StrEnum
+from superset.utils.cache_generation import bump_generation_on_commit, RLS_GENERATION
 from superset.utils.core import GenericDataType, MediumText
+from superset.utils.hashing import md5_sha_from_dict
 
 config = app.config
 metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
+
+
 ADVANCED_DATA_TYPES = config["ADVANCED_DATA_TYPES"]
 VIRTUAL_TABLE_ALIAS = "virtual_table"
 
@@ -132,6 +145,17 @@ ADDITIVE_METRIC_TYPES = {
 }
 ADDITIVE_METRIC_TYPES_LOWER = {op.lower() for op in ADDITIVE_METRIC_TYPES}
 
+# the view of the Parquet extract of a dataset in the DuckDB database reading it
+EXTRACT_VIEW_NAME = "superset_extract"
+
+
+@cache
+def has_duckdb() -> bool:
+    """
+    Whether the DuckDB SQLAlchemy dialect used to query dataset extracts is installed.
+    """
+    return importlib.util.find_spec("duckdb_engine") is not None
+
 
 @dataclass
 class MetadataResult:
@@ -405,9 +429,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             "select_star": self.select_star,
         }
 
-    def data_for_slices(  # pylint: disable=too-many-locals
-        self, slices: list[Slice]
-    ) -> dict[str, Any]:
+    def data_for_slices(self, slices: list[Slice]) -> dict[str, Any]:
         """
         The representation of the datasource containing only the required data
         to render the provided slices.
@@ -418,57 +440,9 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
         metric_names = set()
         column_names = set()
         for slc in slices:
-            form_data = slc.form_data
-            # pull out all required metrics from the form_data
-            for metric_param in METRIC_FORM_DATA_PARAMS:
-                for metric in utils.as_list(form_data.get(metric_param) or []):
-                    metric_names.add(utils.get_metric_name(metric))
-                    if utils.is_adhoc_metric(metric):
-                        column_ = metric.get("column") or {}
-                        if column_name := column_.get("column_name"):
-                            column_names.add(column_name)
-
-            # Columns used in query filters
-            column_names.update(
-                filter_["subject"]
-                for filter_ in form_data.get("adhoc_filters") or []
-                if filter_.get("clause") == "WHERE" and filter_.get("subject")
-            )
-
-            # columns used by Filter Box
-            column_names.update(
-                filter_config["column"]
-                for filter_config in form_data.get("filter_configs") or []
-                if "column" in filter_config
-            )
-
-            # for legacy dashboard imports which have the wrong query_context in them
-            try:
-                query_context = slc.get_query_context()
-            except DatasetNotFoundError:
-                query_context = None
-
-            # legacy charts don't have query_context charts
-            if query_context:
-                column_names.update(
-                    [
-                        utils.get_column_name(column_)
-                        for query in query_context.queries
-                        for column_ in query.columns
-                    ]
-                    or []
-                )
-            else:
-                _columns = [
-                    (
-                        utils.get_column_name(column_)
-                        if utils.is_adhoc_column(column_)
-                        else column_
-                    )
-                    for column_param in COLUMN_FORM_DATA_PARAMS
-                    for column_ in utils.as_list(form_data.get(column_param) or [])
-                ]
-                column_names.update(_columns)
+            slice_metric_names, slice_column_names = self.get_slice_required_fields(slc)
+            metric_names.update(slice_metric_names)
+            column_names.update(slice_column_names)
 
         filtered_metrics = [
             metric
@@ -507,6 +481,98 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
 
         return data
 
+    @staticmethod
+    def get_slice_required_fields(slc: Slice) -> tuple[set[str], set[str]]:
+        """
+        The names of the metrics and columns a chart requires from its datasource.
+
+        Computing them requires building the query context of the chart, so they're
+        cached by the content of the chart's params and query context. They are
+        precomputed when a chart is saved.
+
+        :param slc: The chart
+        :returns: The names of the metrics and the names of the columns
+        """
+        cache_timeout = app.config["DASHBOARD_DATASETS_CACHE_TIMEOUT"]
+        cache_key = None
+        if cache_timeout:
+            cache_key = "slice_required_fields_" + md5_sha_from_dict(
+                {
+                    "datasource": f"{slc.datasource_id}__{slc.datasource_type}",
+                    "params": slc.params,
+                    "query_context": slc.query_context,
+                }
+            )
+            if (cached := cache_manager.cache.get(cache_key)) is not None:
+                return set(cached["metrics"]), set(cached["columns"])
+
+        metric_names, column_names = BaseDatasource._compute_slice_required_fields(slc)
+        if cache_key:
+            cache_manager.cache.set(
+                cache_key,
+                {"metrics": list(metric_names), "columns": list(column_names)},
+                timeout=cache_timeout,
+            )
+        return metric_names, column_names
+
+    @staticmethod
+    def _compute_slice_required_fields(slc: Slice) -> tuple[set[str], set[str]]:
+        metric_names = set()
+        column_names = set()
+        form_data = slc.form_data
+        # pull out all required metrics from the form_data
+        for metric_param in METRIC_FORM_DATA_PARAMS:
+            for metric in utils.as_list(form_data.get(metric_param) or []):
+                metric_names.add(utils.get_metric_name(metric))
+                if utils.is_adhoc_metric(metric):
+                    column_ = metric.get("column") or {}
+                    if column_name := column_.get("column_name"):
+                        column_names.add(column_name)
+
+        # Columns used in query filters
+        column_names.update(
+            filter_["subject"]
+            for filter_ in form_data.get("adhoc_filters") or []
+            if filter_.get("clause") == "WHERE" and filter_.get("subject")
+        )
+
+        # columns used by Filter Box
+        column_names.update(
+            filter_config["column"]
+            for filter_config in form_data.get("filter_configs") or []
+            if "column" in filter_config
+        )
+
+        # for legacy dashboard imports which have the wrong query_context in them
+        try:
+            query_context = slc.get_query_context()
+        except DatasetNotFoundError:
+            query_context = None
+
+        # legacy charts don't have query_context charts
+        if query_context:
+            column_names.update(
+                [
+                    utils.get_column_name(column_)
+                    for query in query_context.queries
+                    for column_ in query.columns
+                ]
+                or []
+            )
+        else:
+            _columns = [
+                (
+                    utils.get_column_name(column_)
+                    if utils.is_adhoc_column(column_)
+                    else column_
+                )
+                for column_param in COLUMN_FORM_DATA_PARAMS
+                for column_ in utils.as_list(form_data.get(column_param) or [])
+            ]
+            column_names.update(_columns)
+
+        return metric_names, column_names
+
     @staticmethod
     def filter_values_handler(  # pylint: disable=too-many-arguments
         values: FilterValues | None,
@@ -1192,6 +1258,10 @@ class SqlaTable(
     normalize_columns = Column(Boolean, default=False)
     always_filter_main_dttm = Column(Boolean, default=False)
 
+    # statements run on the connection before the queries of the dataset, only set on
+    # the transient copies returned by `get_extract_datasource`
+    setup_statements: tuple[str, ...] = ()
+
     baselink = "tablemodelview"
 
     export_fields = [
@@ -1436,6 +1506,103 @@ class SqlaTable(
         except (TypeError, json.JSONDecodeError):
             return {}
 
+    @property
+    def extract_settings(self) -> dict[str, Any] | None:
+        """
+        The `refresh_interval` and `max_age` of the extract of the dataset in seconds,
+        or None when the dataset is not extracted.
+        """
+        if not config["DATASET_EXTRACTS_ENABLED"]:
+            return None
+        settings = self.extra_dict.get("extract")
+        if settings is True:
+            settings = {}
+        if not isinstance(settings, dict):
+            return None
+        refresh_interval = settings.get(
+            "refresh_interval", config["DATASET_EXTRACT_REFRESH_INTERVAL"]
+        )
+        return {
+            "refresh_interval": refresh_interval,
+            "max_age": settings.get("max_age", 2 * refresh_interval),
+        }
+
+    @property
+    def extract_path(self) -> str:
+        return os.path.join(config["DATASET_EXTRACT_PATH"], f"{self.uuid}.parquet")
+
+    def get_extract_age(self) -> float | None:
+        """
+        Return the age of the extract of the dataset in seconds, or None if there is
+        no extract.
+        """
+        try:
+            return time.time() - os.path.getmtime(self.extract_path)
+        except OSError:
+            return None
+
+    def get_extract_datasource(self) -> SqlaTable | None:
+        """
+        Return a transient copy of the dataset that reads its Parquet extract with an
+        in-memory DuckDB database, or None when the dataset has no fresh extract.
+
+        The copy keeps the ID of the dataset, so that the same row level security
+        filters are applied to it. Its queries run after the extract is registered as
+        a view and access to any other file is disabled, so that the SQL of adhoc
+        metrics and columns cannot read the file system of the workers. This requires
+        DuckDB 1.1.3 or newer; with older versions the queries fail and fall back to
+        the database of the dataset.
+        """
+        if (settings := self.extract_settings) is None or not has_duckdb():
+            return None
+        age = self.get_extract_age()
+        if age is None or age > settings["max_age"]:
+            return None
+
+        path = self.extract_path.replace("'", "''")
+        extract = SqlaTable(
+            id=self.id,
+            uuid=self.uuid,
+            table_name=self.table_name,
+            main_dttm_col=self.main_dttm_col,
+            offset=self.offset,
+            fetch_values_predicate=self.fetch_values_predicate,
+            template_params=self.template_params,
+            normalize_columns=self.normalize_columns,
+            always_filter_main_dttm=self.always_filter_main_dttm,
+            sql=f"SELECT * FROM {EXTRACT_VIEW_NAME}",
+            database=Database(
+                database_name=self.database.database_name,
+                sqlalchemy_uri="duckdb:///:memory:",
+            ),
+            columns=[
+                TableColumn(
+                    **{
+                        field: getattr(column, field)
+                        for field in TableColumn.update_from_object_fields
+                    }
+                )
+                for column in self.columns
+            ],
+            metrics=[
+                SqlMetric(
+                    **{
+                        field: getattr(metric, field)
+                        for field in SqlMetric.update_from_object_fields
+                    }
+                )
+                for metric in self.metrics
+            ],
+        )
+        extract.setup_statements = (
+            f"CREATE VIEW {EXTRACT_VIEW_NAME} AS SELECT * FROM read_parquet('{path}')",
+            # the view reads the extract when queried
+            f"SET allowed_paths = ['{path}']",
+            "SET enable_external_access = false",
+            "SET lock_configuration = true",
+        )
+        return extract
+
     def get_fetch_values_predicate(
         self,
         template_processor: BaseTemplateProcessor | None = None,
@@ -1458,6 +1625,24 @@ class SqlaTable(
     def get_template_processor(self, **kwargs: Any) -> BaseTemplateProcessor:
         return get_template_processor(table=self, database=self.database, **kwargs)
 
+    def get_sample_percent(self, extras: dict[str, Any]) -> float | None:
+        """
+        Return the `sample_percent` of the query extras, defaulting to the one of the
+        dataset `extra`. Only physical datasets on engines supporting `TABLESAMPLE`
+        are sampled, and sampling 100 percent of the rows reads all of them.
+        """
+        sample_percent = extras.get("sample_percent")
+        if sample_percent is None:
+            sample_percent = self.extra_dict.get("sample_percent")
+        if (
+            not sample_percent
+            or sample_percent >= 100
+            or self.is_virtual
+            or self.db_engine_spec.tablesample_method is None
+        ):
+            return None
+        return float(sample_percent)
+
     def get_query_str(self, query_obj: QueryObjectDict) -> str:
         query_str_ext = self.get_query_str_extended(query_obj)
         all_queries = query_str_ext.prequeries + [query_str_ext.sql]
@@ -1726,6 +1911,23 @@ class SqlaTable(
         return or_(*groups)
 
     def query(self, query_obj: QueryObjectDict) -> QueryResult:
+        if (extract := self.get_extract_datasource()) is not None:
+            try:
+                result = extract.query(query_obj)
+                if result.status != QueryStatus.FAILED:
+                    return result
+                logger.warning(
+                    "Query on the extract of dataset %s failed: %s",
+                    self.id,
+                    result.error_message,
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Query on the extract of dataset %s failed",
+                    self.id,
+                    exc_info=True,
+                )
+
         qry_start_dttm = datetime.now()
         query_str_ext = self.get_query_str_extended(query_obj)
         sql = query_str_ext.sql
@@ -1760,7 +1962,7 @@ class SqlaTable(
 
         try:
             df = self.database.get_df(
-                sql,
+                ";\n".join([*self.setup_statements, sql]),
                 self.catalog,
                 self.schema or None,
                 mutator=assign_column_label,
@@ -1795,6 +1997,7 @@ class SqlaTable(
             query=sql,
             errors=errors,
             error_message=error_message,
+            sample_percent=query_str_ext.sample_percent,
         )
 
     def get_sqla_table_object(self) -> Table:
@@ -1806,23 +2009,32 @@ class SqlaTable(
             )
         )
 
-    def fetch_metadata(self) -> MetadataResult:
+    def fetch_metadata(
+        self,
+        external_columns: list[ResultSetColumnType] | None = None,
+        external_metrics: list[MetricType] | None = None,
+    ) -> MetadataResult:
         """
         Fetches the metadata for the table and merges it in
 
+        :param external_columns: The columns of the table, if already fetched
+        :param external_metrics: The metrics of the table, if already fetched
         :return: Tuple with lists of added, removed and modified column names.
         """
-        new_columns = self.external_metadata()
-        metrics = [
-            SqlMetric(**metric)
-            for metric in self.database.get_metrics(
+        new_columns = (
+            external_columns
+            if external_columns is not None
+            else self.external_metadata()
+        )
+        if external_metrics is None:
+            external_metrics = self.database.get_metrics(
                 Table(
                     self.table_name,
                     self.schema or None,
                     self.catalog,
                 )
             )
-        ]
+        metrics = [SqlMetric(**metric) for metric in external_metrics]
         any_date_col = None
         db_engine_spec = self.db_engine_spec
 
@@ -2038,6 +2250,8 @@ class SqlaTable(
         # Forces an update to the table's changed_on value when a metric or column on the
         # table is updated. This busts the cache key for all charts that use the table.
         session.execute(update(SqlaTable).where(SqlaTable.id == target.table.id))
+        cache_manager.invalidate_datasource(target.table.uid)
+        bump_generation_on_commit(session, target.table.uid)
 
     @staticmethod
     def after_insert(
@@ -2061,6 +2275,21 @@ class SqlaTable(
         Update dataset permissions after delete
         """
         security_manager.dataset_after_delete(mapper, connection, sqla_table)
+        cache_manager.invalidate_datasource(sqla_table.uid)
+        bump_generation_on_commit(inspect(sqla_table).session, sqla_table.uid)
+
+    @staticmethod
+    def after_update(  # pylint: disable=unused-argument
+        mapper: Mapper,
+        connection: Connection,
+        target: SqlaTable,
+    ) -> None:
+        """
+        Evict the values computed from the dataset from the in-process caches, and
+        bump its cache generation
+        """
+        cache_manager.invalidate_datasource(target.uid)
+        bump_generation_on_commit(inspect(target).session, target.uid)
 
     def load_database(self: SqlaTable) -> None:
         # somehow the database attribute is not loaded on access
@@ -2073,6 +2302,7 @@ class SqlaTable(
 
 sa.event.listen(SqlaTable, "before_update", SqlaTable.before_update)
 sa.event.listen(SqlaTable, "after_insert", SqlaTable.after_insert)
+sa.event.listen(SqlaTable, "after_update", SqlaTable.after_update)
 sa.event.listen(SqlaTable, "after_delete", SqlaTable.after_delete)
 sa.event.listen(SqlMetric, "after_update", SqlaTable.update_column)
 sa.event.listen(TableColumn, "after_update", SqlaTable.update_column)
@@ -2122,3 +2352,18 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(MediumText(), nullable=False)
+
+    @staticmethod
+    def after_change(  # pylint: disable=unused-argument
+        mapper: Mapper,
+        connection: Connection,
+        target: RowLevelSecurityFilter,
+    ) -> None:
+        """
+        Bump the cache generation of the row level security filters
+        """
+        bump_generation_on_commit(inspect(target).session, RLS_GENERATION)
+
+
+for event in ("after_insert", "after_update", "after_delete"):
+    sa.event.listen(RowLevelSecurityFilter, event, RowLevelSecurityFilter.after_change)
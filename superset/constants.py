@@ -150,6 +150,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "screenshot": "read",
     "data": "read",
     "data_from_cache": "read",
+    "get_bootstrap": "read",
     "get_charts": "read",
     "get_datasets": "read",
     "get_tabs": "read",
@@ -22,6 +22,7 @@ from typing import Any
 
 from flask import g
 from flask_appbuilder.models.sqla.interface import SQLAInterface
+from sqlalchemy.orm import joinedload, selectinload
 
 from superset import is_feature_enabled, security_manager
 from superset.commands.dashboard.exceptions import (
@@ -29,6 +30,7 @@ from superset.commands.dashboard.exceptions import (
     DashboardForbiddenError,
     DashboardNotFoundError,
 )
+from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.base import BaseDAO
 from superset.dashboards.filters import DashboardAccessFilter, is_uuid
 from superset.exceptions import SupersetSecurityException
@@ -48,7 +50,21 @@ class DashboardDAO(BaseDAO[Dashboard]):
     base_filter = DashboardAccessFilter
 
     @classmethod
-    def get_by_id_or_slug(cls, id_or_slug: int | str) -> Dashboard:
+    def get_by_id_or_slug(
+        cls,
+        id_or_slug: int | str,
+        eager_load: bool = False,
+    ) -> Dashboard:
+        """
+        Get a dashboard by its id, slug or uuid, checking that the current user can
+        access it.
+
+        :param id_or_slug: The id, slug or uuid of the dashboard
+        :param eager_load: Load the charts, owners, roles and tags of the dashboard
+            in the same round trip, for callers that serialize all of them
+        :raises DashboardNotFoundError: If the dashboard doesn't exist
+        :raises DashboardAccessDeniedError: If the user can't access the dashboard
+        """
         if is_uuid(id_or_slug):
             # just get dashboard if it's uuid
             dashboard = Dashboard.get(id_or_slug)
@@ -59,6 +75,15 @@ class DashboardDAO(BaseDAO[Dashboard]):
                 .outerjoin(Dashboard.owners)
                 .outerjoin(Dashboard.roles)
             )
+            if eager_load:
+                query = query.options(
+                    selectinload(Dashboard.slices),
+                    selectinload(Dashboard.owners),
+                    selectinload(Dashboard.roles),
+                    selectinload(Dashboard.tags),
+                    joinedload(Dashboard.changed_by),
+                    joinedload(Dashboard.created_by),
+                )
             # Apply dashboard base filters
             query = cls.base_filter("id", SQLAInterface(Dashboard, db.session)).apply(
                 query, None
@@ -135,12 +160,14 @@ class DashboardDAO(BaseDAO[Dashboard]):
     @staticmethod
     def get_dashboard_and_datasets_changed_on(  # pylint: disable=invalid-name
         id_or_slug_or_dashboard: str | Dashboard,
+        datasources: set[BaseDatasource] | None = None,
     ) -> datetime:
         """
         Get latest changed datetime for a dashboard. The change could be a dashboard
         metadata change, a change to one of its dependent datasets.
 
         :param id_or_slug_or_dashboard: A dashboard or the ID or slug of the dashboard.
+        :param datasources: The datasources of the dashboard, if already loaded
         :returns: The datetime the dashboard was last changed.
         """
 
@@ -150,7 +177,8 @@ class DashboardDAO(BaseDAO[Dashboard]):
             else id_or_slug_or_dashboard
         )
         dashboard_changed_on = DashboardDAO.get_dashboard_changed_on(dashboard)
-        datasources = dashboard.datasources
+        if datasources is None:
+            datasources = dashboard.datasources
         datasources_changed_on = max(
             [datasource.changed_on for datasource in datasources]
             + ([datetime.fromtimestamp(0)] if len(datasources) == 0 else [])
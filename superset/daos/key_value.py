@@ -21,6 +21,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+import sqlalchemy as sa
 from sqlalchemy import and_
 
 from superset import db
@@ -68,17 +69,112 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
         return False
 
     @staticmethod
-    def delete_expired_entries(resource: KeyValueResource) -> None:
-        (
+    def get_entries(
+        resource: KeyValueResource,
+        keys: list[UUID],
+    ) -> dict[UUID, KeyValueEntry]:
+        """
+        Fetch the entries for multiple UUID keys in a single query.
+
+        :param resource: the resource the keys belong to
+        :param keys: the UUID keys to look up
+        :returns: the found entries, keyed by UUID; missing keys are omitted
+        """
+        if not keys:
+            return {}
+
+        entries = (
             db.session.query(KeyValueEntry)
             .filter(
                 and_(
                     KeyValueEntry.resource == resource.value,
-                    KeyValueEntry.expires_on <= datetime.now(),
+                    KeyValueEntry.uuid.in_(keys),
                 )
             )
-            .delete()
+            .all()
         )
+        return {entry.uuid: entry for entry in entries}
+
+    @classmethod
+    def get_values(
+        cls,
+        resource: KeyValueResource,
+        keys: list[UUID],
+        codec: KeyValueCodec,
+    ) -> dict[UUID, Any]:
+        """
+        Fetch and decode the values for multiple UUID keys in a single query.
+        Expired entries are treated as missing.
+        """
+        return {
+            key: codec.decode(entry.value)
+            for key, entry in cls.get_entries(resource, keys).items()
+            if not entry.is_expired()
+        }
+
+    @staticmethod
+    def delete_entries(resource: KeyValueResource, keys: list[UUID]) -> int:
+        """
+        Delete the entries for multiple UUID keys in a single statement.
+
+        :returns: the number of deleted entries
+        """
+        if not keys:
+            return 0
+
+        result = db.session.execute(
+            sa.delete(KeyValueEntry)
+            .where(
+                and_(
+                    KeyValueEntry.resource == resource.value,
+                    KeyValueEntry.uuid.in_(keys),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @staticmethod
+    def delete_expired_entries(
+        resource: KeyValueResource,
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Delete expired entries of a resource.
+
+        :param resource: the resource to prune
+        :param batch_size: if set, delete at most this many entries so the
+            statement (and the locks it holds) stays bounded
+        :returns: the number of deleted entries
+        """
+        expired = and_(
+            KeyValueEntry.resource == resource.value,
+            KeyValueEntry.expires_on <= datetime.now(),
+        )
+        if batch_size is None:
+            return db.session.query(KeyValueEntry).filter(expired).delete()
+
+        # Resolve the ids first, as not every engine supports LIMIT in a
+        # DELETE statement or in an IN subquery (e.g. MySQL).
+        ids = (
+            db.session.execute(
+                sa.select(KeyValueEntry.id)
+                .where(expired)
+                .order_by(KeyValueEntry.id)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not ids:
+            return 0
+
+        result = db.session.execute(
+            sa.delete(KeyValueEntry)
+            .where(KeyValueEntry.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
     @staticmethod
     def create_entry(
@@ -127,6 +223,62 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
 
         return KeyValueDAO.create_entry(resource, value, codec, key, expires_on)
 
+    @staticmethod
+    def upsert_entries(
+        resource: KeyValueResource,
+        values: dict[UUID, Any],
+        codec: KeyValueCodec,
+        expires_on: datetime | None = None,
+    ) -> None:
+        """
+        Create or update multiple UUID keyed entries. Existing entries are looked
+        up in a single query, after which updates and inserts are each issued as
+        a single executemany statement.
+        """
+        if not values:
+            return
+
+        try:
+            encoded = {key: codec.encode(value) for key, value in values.items()}
+        except Exception as ex:
+            raise KeyValueCreateFailedError("Unable to encode value") from ex
+
+        existing = KeyValueDAO.get_entries(resource, list(encoded))
+        now = datetime.now()
+        user_id = get_user_id()
+        updates = [
+            {
+                "id": existing[key].id,
+                "value": value,
+                "expires_on": expires_on,
+                "changed_on": now,
+                "changed_by_fk": user_id,
+            }
+            for key, value in encoded.items()
+            if key in existing
+        ]
+        inserts = [
+            {
+                "uuid": key,
+                "resource": resource.value,
+                "value": value,
+                "created_on": now,
+                "created_by_fk": user_id,
+                "expires_on": expires_on,
+            }
+            for key, value in encoded.items()
+            if key not in existing
+        ]
+        # the updated rows are already in the identity map, expire them so that
+        # subsequent reads in this session don't return stale values
+        for key in encoded:
+            if entry := existing.get(key):
+                db.session.expire(entry)
+        if updates:
+            db.session.bulk_update_mappings(KeyValueEntry, updates)
+        if inserts:
+            db.session.bulk_insert_mappings(KeyValueEntry, inserts)
+
     @staticmethod
     def update_entry(
         resource: KeyValueResource,
@@ -32,7 +32,7 @@ from marshmallow import ValidationError
 from werkzeug.wrappers import Response as WerkzeugResponse
 from werkzeug.wsgi import FileWrapper
 
-from superset import db, is_feature_enabled, thumbnail_cache
+from superset import db, is_feature_enabled, security_manager, thumbnail_cache
 from superset.charts.schemas import ChartEntityResponseSchema
 from superset.commands.dashboard.copy import CopyDashboardCommand
 from superset.commands.dashboard.create import CreateDashboardCommand
@@ -76,6 +76,7 @@ from superset.dashboards.filters import (
 from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.dashboards.schemas import (
     CacheScreenshotSchema,
+    DashboardBootstrapResponseSchema,
     DashboardCacheScreenshotResponseSchema,
     DashboardCopySchema,
     DashboardDatasetSchema,
@@ -103,6 +104,8 @@ from superset.tasks.thumbnails import (
 )
 from superset.tasks.utils import get_current_user
 from superset.utils import json
+from superset.utils.core import get_user_id
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.pdf import build_pdf_from_screenshots
 from superset.utils.screenshots import (
     DashboardScreenshot,
@@ -165,6 +168,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         "favorite_status",
         "add_favorite",
         "remove_favorite",
+        "get_bootstrap",
         "get_charts",
         "get_datasets",
         "get_tabs",
@@ -297,6 +301,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
     """ Override the name set for this collection of endpoints """
     openapi_spec_component_schemas = (
         ChartEntityResponseSchema,
+        DashboardBootstrapResponseSchema,
         DashboardCacheScreenshotResponseSchema,
         DashboardCopySchema,
         DashboardGetResponseSchema,
@@ -421,6 +426,108 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         except (TypeError, ValueError) as err:
             raise DatasetValidationError(err) from err
 
+    @expose("/<id_or_slug>/bootstrap", methods=("GET",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        ".get_bootstrap",
+        log_to_statsd=False,
+    )
+    def get_bootstrap(self, id_or_slug: str) -> Response:
+        """Get everything needed to render a dashboard.
+        ---
+        get:
+          summary: Get everything needed to render a dashboard
+          description: >-
+            Returns the dashboard, its chart definitions, its datasets trimmed to
+            the fields used by the charts, and its tabs in a single response. The
+            response has an ETag, and conditional requests with `If-None-Match`
+            get a 304 response when neither the dashboard, its charts, its
+            datasets nor the roles and row level security filters of the user
+            changed.
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: id_or_slug
+            description: Either the id of the dashboard, or its slug
+          responses:
+            200:
+              description: Dashboard bootstrap payload
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        $ref: '#/components/schemas/DashboardBootstrapResponseSchema'
+            304:
+              description: Dashboard not modified
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            404:
+              $ref: '#/components/responses/404'
+        """
+        try:
+            dash = DashboardDAO.get_by_id_or_slug(id_or_slug, eager_load=True)
+        except DashboardAccessDeniedError:
+            return self.response_403()
+        except DashboardNotFoundError:
+            return self.response_404()
+
+        # the datasources are needed for the ETag and the payload, load them once
+        datasources = dash.datasources
+        last_modified = max(
+            DashboardDAO.get_dashboard_and_slices_changed_on(dash),
+            DashboardDAO.get_dashboard_and_datasets_changed_on(dash, datasources),
+        )
+        etag = md5_sha_from_dict(
+            {
+                "api": repr(self),
+                "dashboard_id": dash.id,
+                "last_modified": last_modified,
+                "user_id": get_user_id(),
+                # the trimmed datasets depend on the permissions and RLS filters
+                "roles": security_manager.get_roles_cache_key(),
+                "rls": sorted(
+                    (datasource.uid, security_manager.get_rls_cache_key(datasource))
+                    for datasource in datasources
+                ),
+            },
+            default=str,
+        )
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            try:
+                result = {
+                    "dashboard": self.dashboard_get_response_schema.dump(dash),
+                    "charts": [
+                        self.chart_entity_response_schema.dump(chart)
+                        for chart in dash.slices
+                    ],
+                    "datasets": [
+                        self.dashboard_dataset_schema.dump(dataset)
+                        for dataset in dash.datasets_trimmed_for_slices(datasources)
+                    ],
+                    "tabs": self.tab_schema.dump(dash.tabs),
+                }
+            except (TypeError, ValueError) as err:
+                return self.response_400(message=str(err))
+            response = self.response(200, result=result)
+
+        # the browser can store the response, but must always revalidate it
+        response.cache_control.no_cache = True
+        response.last_modified = last_modified
+        response.set_etag(etag)
+        return response
+
     @expose("/<id_or_slug>/tabs", methods=("GET",))
     @protect()
     @safe
@@ -21,6 +21,7 @@ from marshmallow import fields, post_dump, post_load, pre_load, Schema
 from marshmallow.validate import Length, ValidationError
 
 from superset import security_manager
+from superset.charts.schemas import ChartEntityResponseSchema
 from superset.tags.models import TagType
 from superset.utils import json
 
@@ -292,6 +293,13 @@ class TabsPayloadSchema(Schema):
     tab_tree = fields.List(fields.Nested(lambda: TabSchema))
 
 
+class DashboardBootstrapResponseSchema(Schema):
+    dashboard = fields.Nested(DashboardGetResponseSchema)
+    charts = fields.List(fields.Nested(ChartEntityResponseSchema))
+    datasets = fields.List(fields.Nested(DashboardDatasetSchema))
+    tabs = fields.Nested(TabsPayloadSchema)
+
+
 class BaseDashboardSchema(Schema):
     # pylint: disable=unused-argument
     @post_load
@@ -99,6 +99,7 @@ from superset.databases.schemas import (
     TableExtraMetadataResponseSchema,
     TableMetadataResponseSchema,
     UploadFileMetadata,
+    UploadReportSchema,
     ValidateSQLRequest,
     ValidateSQLResponse,
 )
@@ -299,6 +300,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         ExcelMetadataUploadFilePostSchema,
         ColumnarMetadataUploadFilePostSchema,
         UploadFileMetadata,
+        UploadReportSchema,
         ValidateSQLRequest,
         ValidateSQLResponse,
     )
@@ -1703,6 +1705,8 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
                     properties:
                       message:
                         type: string
+                      result:
+                        $ref: '#/components/schemas/UploadReportSchema'
             400:
               $ref: '#/components/responses/400'
             401:
@@ -1718,7 +1722,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             request_form = request.form.to_dict()
             request_form["file"] = request.files.get("file")
             parameters = CSVUploadPostSchema().load(request_form)
-            UploadCommand(
+            report = UploadCommand(
                 pk,
                 parameters["table_name"],
                 parameters["file"],
@@ -1727,7 +1731,9 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             ).run()
         except ValidationError as error:
             return self.response_400(message=error.messages)
-        return self.response(201, message="OK")
+        return self.response(
+            201, message="OK", result=UploadReportSchema().dump(report)
+        )
 
     @expose("/excel_metadata/", methods=("POST",))
     @protect()
@@ -1812,6 +1818,8 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
                     properties:
                       message:
                         type: string
+                      result:
+                        $ref: '#/components/schemas/UploadReportSchema'
             400:
               $ref: '#/components/responses/400'
             401:
@@ -1827,7 +1835,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             request_form = request.form.to_dict()
             request_form["file"] = request.files.get("file")
             parameters = ExcelUploadPostSchema().load(request_form)
-            UploadCommand(
+            report = UploadCommand(
                 pk,
                 parameters["table_name"],
                 parameters["file"],
@@ -1836,7 +1844,9 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             ).run()
         except ValidationError as error:
             return self.response_400(message=error.messages)
-        return self.response(201, message="OK")
+        return self.response(
+            201, message="OK", result=UploadReportSchema().dump(report)
+        )
 
     @expose("/columnar_metadata/", methods=("POST",))
     @protect()
@@ -1922,6 +1932,8 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
                     properties:
                       message:
                         type: string
+                      result:
+                        $ref: '#/components/schemas/UploadReportSchema'
             400:
               $ref: '#/components/responses/400'
             401:
@@ -1937,7 +1949,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             request_form = request.form.to_dict()
             request_form["file"] = request.files.get("file")
             parameters = ColumnarUploadPostSchema().load(request_form)
-            UploadCommand(
+            report = UploadCommand(
                 pk,
                 parameters["table_name"],
                 parameters["file"],
@@ -1946,7 +1958,9 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             ).run()
         except ValidationError as error:
             return self.response_400(message=error.messages)
-        return self.response(201, message="OK")
+        return self.response(
+            201, message="OK", result=UploadReportSchema().dump(report)
+        )
 
     @expose("/<int:pk>/function_names/", methods=("GET",))
     @protect()
@@ -1400,6 +1400,21 @@ class UploadFileMetadata(Schema):
     items = fields.List(fields.Nested(UploadFileMetadataItemSchema))
 
 
+class UploadReportSchema(Schema):
+    """
+    Schema for the report of an uploaded file.
+    """
+
+    chunks = fields.Integer(metadata={"description": "The number of chunks uploaded"})
+    rows = fields.Integer(metadata={"description": "The number of rows uploaded"})
+    duration_ms = fields.Float(
+        metadata={"description": "The duration of the upload in milliseconds"}
+    )
+    rows_per_second = fields.Float(
+        metadata={"description": "The number of rows uploaded per second"}
+    )
+
+
 class OAuth2ProviderResponseSchema(Schema):
     """
     Schema for the payload sent on OAuth2 redirect.
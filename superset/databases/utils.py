@@ -23,6 +23,7 @@ from sqlalchemy.engine.url import make_url, URL
 
 from superset.commands.database.exceptions import DatabaseInvalidError
 from superset.sql_parse import Table
+from superset.superset_typing import TableReflection
 
 if TYPE_CHECKING:
     from superset.databases.schemas import (
@@ -35,22 +36,44 @@ if TYPE_CHECKING:
 def get_foreign_keys_metadata(
     database: Any,
     table: Table,
+    foreign_keys: list[dict[str, Any]] | None = None,
 ) -> list[TableMetadataForeignKeysIndexesResponse]:
-    foreign_keys = database.get_foreign_keys(table)
-    for fk in foreign_keys:
-        fk["column_names"] = fk.pop("constrained_columns")
-        fk["type"] = "fk"
-    return foreign_keys
+    if foreign_keys is None:
+        foreign_keys = database.get_foreign_keys(table)
+    return [
+        {
+            **{key: value for key, value in fk.items() if key != "constrained_columns"},
+            "column_names": fk["constrained_columns"],
+            "type": "fk",
+        }
+        for fk in foreign_keys
+    ]
 
 
 def get_indexes_metadata(
     database: Any,
     table: Table,
+    indexes: list[dict[str, Any]] | None = None,
 ) -> list[TableMetadataForeignKeysIndexesResponse]:
-    indexes = database.get_indexes(table)
-    for idx in indexes:
-        idx["type"] = "index"
-    return indexes
+    if indexes is None:
+        indexes = database.get_indexes(table)
+    return [{**idx, "type": "index"} for idx in indexes]
+
+
+def get_table_reflection(database: Any, table: Table) -> TableReflection:
+    """
+    Get the reflected metadata of a table, cached according to the
+    ``table_cache_timeout`` of the database.
+
+    :param database: The database model
+    :param table: Table instance
+    :return: The table reflection
+    """
+    return database.get_table_reflection(
+        table=table,
+        cache=database.table_cache_enabled,
+        cache_timeout=database.table_cache_timeout,
+    )
 
 
 def get_col_type(col: dict[Any, Any]) -> str:
@@ -72,17 +95,20 @@ def get_table_metadata(database: Any, table: Table) -> TableMetadataResponse:
     :return: Dict table metadata ready for API response
     """
     keys = []
-    columns = database.get_columns(table)
-    primary_key = database.get_pk_constraint(table)
+    reflection = get_table_reflection(database, table)
+    columns = reflection["columns"]
+    primary_key = dict(reflection["pk_constraint"])
     if primary_key and primary_key.get("constrained_columns"):
         primary_key["column_names"] = primary_key.pop("constrained_columns")
         primary_key["type"] = "pk"
         keys += [primary_key]
-    foreign_keys = get_foreign_keys_metadata(database, table)
-    indexes = get_indexes_metadata(database, table)
+    foreign_keys = get_foreign_keys_metadata(
+        database, table, reflection["foreign_keys"]
+    )
+    indexes = get_indexes_metadata(database, table, reflection["indexes"])
     keys += foreign_keys + indexes
     payload_columns: list[TableMetadataColumnsResponse] = []
-    table_comment = database.get_table_comment(table)
+    table_comment = reflection["comment"]
     for col in columns:
         dtype = get_col_type(col)
         payload_columns.append(
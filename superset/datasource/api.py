@@ -16,11 +16,13 @@
 # under the License.
 import logging
 
+from flask import request
 from flask_appbuilder.api import expose, protect, safe
 
 from superset import app, event_logger
 from superset.daos.datasource import DatasourceDAO
 from superset.daos.exceptions import DatasourceNotFound, DatasourceTypeNotSupportedError
+from superset.datasource.utils import get_column_values
 from superset.exceptions import SupersetSecurityException
 from superset.superset_typing import FlaskResponse
 from superset.utils.core import apply_max_row_limit, DatasourceType
@@ -70,6 +72,12 @@ class DatasourceRestApi(BaseSupersetApi):
               type: string
             name: column_name
             description: The name of the column to get values for
+          - in: query
+            schema:
+              type: string
+            name: search
+            description: >-
+              Only return the values starting with this prefix, ignoring case
           responses:
             200:
               description: A List of distinct values for the column
@@ -117,10 +125,12 @@ class DatasourceRestApi(BaseSupersetApi):
         row_limit = apply_max_row_limit(app.config["FILTER_SELECT_ROW_LIMIT"])
         denormalize_column = not datasource.normalize_columns
         try:
-            payload = datasource.values_for_column(
+            payload = get_column_values(
+                datasource,
                 column_name=column_name,
                 limit=row_limit,
                 denormalize_column=denormalize_column,
+                search=request.args.get("search") or None,
             )
             return self.response(200, result=payload)
         except KeyError:
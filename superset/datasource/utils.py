@@ -0,0 +1,181 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app
+
+from superset.extensions import cache_manager, security_manager
+from superset.utils.cache import generate_cache_key, set_and_log_cache
+
+if TYPE_CHECKING:
+    from superset.connectors.sqla.models import BaseDatasource
+
+logger = logging.getLogger(__name__)
+
+
+def _search_key(value: Any) -> str:
+    return "" if value is None else str(value).casefold()
+
+
+def index_column_values(values: list[Any]) -> tuple[list[str], list[int]]:
+    """
+    Return the sorted search keys of values, and the index of the value of each key.
+    """
+    keyed = sorted((_search_key(value), index) for index, value in enumerate(values))
+    return [key for key, _ in keyed], [index for _, index in keyed]
+
+
+def search_column_values(
+    values: list[Any],
+    keys: list[str],
+    indexes: list[int],
+    search: str,
+    limit: int,
+) -> list[Any]:
+    """
+    Return the values starting with a prefix, ignoring case, in their original order,
+    from their search keys and indexes, as returned by `index_column_values`.
+    """
+    search = search.casefold()
+    start = bisect.bisect_left(keys, search)
+    end = start
+    while end < len(keys) and keys[end].startswith(search):
+        end += 1
+    return [values[index] for index in heapq.nsmallest(limit, indexes[start:end])]
+
+
+def _get_cache_keys(
+    datasource: BaseDatasource,
+    column_name: str,
+    limit: int,
+    denormalize_column: bool,
+    searches: list[str | None],
+) -> list[str]:
+    values = {
+        "datasource": datasource.uid,
+        "changed_on": datasource.changed_on,
+        "column_name": column_name,
+        "limit": limit,
+        "denormalize_column": denormalize_column,
+        "fetch_values_predicate": getattr(datasource, "fetch_values_predicate", None),
+        "rls": security_manager.get_rls_cache_key(datasource),
+    }
+    return [
+        generate_cache_key(
+            {**values, "search": search.casefold() if search else None},
+            key_prefix="column_values:",
+        )
+        for search in searches
+    ]
+
+
+def get_column_values(
+    datasource: BaseDatasource,
+    column_name: str,
+    limit: int,
+    denormalize_column: bool = False,
+    search: str | None = None,
+) -> list[Any]:
+    """
+    Return the distinct values of a column, cached per datasource, column, row level
+    security filters and fetch values predicate.
+
+    The values are cached in the order of the database, along with their sorted search
+    keys and whether they were truncated by the limit. A search is answered from the
+    cached values of the column, or of a shorter prefix, when they are complete;
+    otherwise the prefix is pushed down to the database for string columns, and
+    applied to all the values of the column for other columns.
+
+    :param datasource: The datasource
+    :param column_name: The name of the column
+    :param limit: The maximum number of values
+    :param denormalize_column: Whether to denormalize the column name
+    :param search: Only return the values starting with this prefix, ignoring case
+    :returns: The values of the column
+    :raises KeyError: If the column does not exist
+    """
+    target_col = next(
+        (col for col in datasource.columns if col.column_name == column_name),
+        None,
+    )
+    # only string columns are searched in the database
+    push_down = search if target_col is None or target_col.is_string else None
+
+    timeout = current_app.config["FILTER_SELECT_CACHE_TIMEOUT"]
+    has_extra_cache_key_calls = getattr(datasource, "has_extra_cache_key_calls", None)
+    if timeout is None or (
+        # the values may depend on the user or the request
+        has_extra_cache_key_calls and has_extra_cache_key_calls({})
+    ):
+        values = datasource.values_for_column(
+            column_name=column_name,
+            limit=limit,
+            denormalize_column=denormalize_column,
+            search=push_down,
+        )
+        if search and not push_down:
+            return search_column_values(
+                values, *index_column_values(values), search, limit
+            )
+        return values
+
+    cache = cache_manager.data_cache
+    prefixes = (
+        [search[:length] for length in range(len(search), 0, -1)] if search else []
+    )
+    keys = _get_cache_keys(
+        datasource,
+        column_name,
+        limit,
+        denormalize_column,
+        [*prefixes, None],
+    )
+    for cached in cache.get_many(*keys):
+        if not cached:
+            continue
+        if not search:
+            return cached["values"]
+        if cached["complete"]:
+            return search_column_values(
+                cached["values"], cached["keys"], cached["indexes"], search, limit
+            )
+
+    values = datasource.values_for_column(
+        column_name=column_name,
+        limit=limit,
+        denormalize_column=denormalize_column,
+        search=push_down,
+    )
+    cache_value: dict[str, Any] = {"values": values, "complete": len(values) < limit}
+    cache_value["keys"], cache_value["indexes"] = index_column_values(values)
+    set_and_log_cache(
+        cache,
+        keys[0] if push_down else keys[-1],
+        cache_value,
+        timeout,
+        datasource.uid,
+    )
+    if search and not push_down:
+        return search_column_values(
+            values, cache_value["keys"], cache_value["indexes"], search, limit
+        )
+    return values
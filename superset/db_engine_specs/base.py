@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterator
 from datetime import datetime
 from re import Match, Pattern
 from typing import (
@@ -47,14 +48,22 @@ from flask_appbuilder.security.sqla.models import User
 from flask_babel import gettext as __, lazy_gettext as _
 from marshmallow import fields, Schema
 from marshmallow.validate import Range
-from sqlalchemy import column, select, types
+from sqlalchemy import column, select, tablesample, types
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.interfaces import Compiled, Dialect
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import literal_column, quoted_name, text
-from sqlalchemy.sql.expression import ColumnClause, Select, TextAsFrom, TextClause
+from sqlalchemy.sql.expression import (
+    ColumnClause,
+    FromClause,
+    Select,
+    TableClause,
+    TextAsFrom,
+    TextClause,
+)
+from sqlalchemy.sql.functions import Function
 from sqlalchemy.types import TypeEngine
 from sqlparse.tokens import CTE
 
@@ -92,8 +101,32 @@ ColumnTypeMapping = tuple[
     GenericDataType,
 ]
 
+# signature of the `method` argument of `pandas.DataFrame.to_sql`: pandas table,
+# SQLAlchemy connection, column names and rows
+BulkLoadMethod = Callable[[Any, Any, list[str], Iterator[tuple[Any, ...]]], int]
+
 logger = logging.getLogger()
 
+
+def executemany_bulk_load(
+    pd_table: Any,
+    conn: Any,
+    keys: list[str],
+    data_iter: Iterator[tuple[Any, ...]],
+) -> int:
+    """
+    Bulk load method that inserts all the rows with a single `executemany` call in
+    the transaction opened by pandas. Drivers like `sqlite3` and `mysqlclient` run
+    it far more efficiently than multi-row `INSERT` statements compiled by
+    SQLAlchemy, which are also limited in the number of bound parameters.
+    """
+    rows = [dict(zip(keys, row)) for row in data_iter]
+    if not rows:
+        return 0
+    conn.execute(pd_table.table.insert(), rows)
+    return len(rows)
+
+
 # When connecting to a database it's hard to catch specific exceptions, since we support
 # more than 50 different database drivers. Usually the try/except block will catch the
 # generic `Exception` class, which requires a pylint disablee comment. To make it clear
@@ -376,6 +409,14 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     allows_cte_in_subquery = True
     # Define alias for CTE
     cte_alias = "__cte"
+    # The sampling method of the `TABLESAMPLE` clause used to read a random sample of
+    # the rows of a table in sampled chart queries, e.g. "SYSTEM" or "BERNOULLI", or
+    # None when the engine does not support sampling
+    tablesample_method: str | None = None
+    # Whether SQL Lab can fetch the results of asynchronous queries in batches with
+    # `fetch_data_chunks` to publish them progressively; engines that override
+    # `fetch_data` for more than `normalize_rows` should disable it
+    allows_progressive_fetch = True
     # Whether allow LIMIT clause in the SQL
     # If True, then the database engine is allowed for LIMIT clause
     # If False, then the database engine is allowed for TOP clause
@@ -410,6 +451,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Whether `df_to_sql` can append to an existing table. Files are uploaded one chunk
+    # at a time to engines that can, and in a single call to the others.
+    supports_file_upload_append = True
+
     # Is the DB engine spec able to change the default schema? This requires implementing
     # a custom `adjust_engine_params` method.
     supports_dynamic_schema = False
@@ -964,33 +1009,96 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         try:
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
-            data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
+            return cls._mutate_column_values(cursor.description, cursor.fetchall())
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def fetch_data_chunks(
+        cls,
+        cursor: Any,
+        chunk_size: int,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the results of a cursor in batches, so that only one batch of rows is
+        held in memory at a time.
+
+        :param cursor: Cursor instance
+        :param chunk_size: Maximum number of rows per batch
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Iterator of batches of rows
+        """
+        remaining = limit
+        try:
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                if not (data := cursor.fetchmany(size)):
+                    break
+                if remaining is not None:
+                    remaining -= len(data)
+                yield cls.normalize_rows(
+                    cls._mutate_column_values(cursor.description, list(data))
                 )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
-            return data
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def normalize_rows(cls, data: list[Any]) -> list[tuple[Any, ...]]:
+        """
+        Convert the rows fetched from a cursor to tuples, for drivers that return
+        rows of their own type. Applied by `fetch_data_chunks`, and by the
+        `fetch_data` of the engines that override it.
+
+        :param data: Rows fetched from the cursor
+        :return: List of tuples
+        """
+        return data
+
+    @classmethod
+    def _mutate_column_values(
+        cls,
+        description: Any,
+        data: list[tuple[Any, ...]],
+    ) -> list[tuple[Any, ...]]:
+        description = description or []
+        # Create a mapping between column name and a mutator function to normalize
+        # values with. The first two items in the description row are
+        # the column name and type.
+        column_mutators = {
+            row[0]: func
+            for row in description
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+                )
+            )
+        }
+        if column_mutators:
+            indexes = {row[0]: idx for idx, row in enumerate(description)}
+            for row_idx, row in enumerate(data):
+                new_row = list(row)
+                for col, func in column_mutators.items():
+                    col_idx = indexes[col]
+                    new_row[col_idx] = func(row[col_idx])
+                data[row_idx] = tuple(new_row)
+
+        return data
+
+    @classmethod
+    def get_server_side_cursor(cls, connection: Any) -> Any:
+        """
+        Return a cursor that keeps the result set on the server, fetching rows as
+        they are requested rather than buffering all of them on execution.
+
+        Used when streaming large results. Drivers without server-side cursors
+        return a regular cursor, which is still read in batches.
+
+        :param connection: Raw DB-API connection
+        :return: Cursor instance
+        """
+        return connection.cursor()
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1226,6 +1334,19 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         parsed_query = sql_parse.ParsedQuery(sql, engine=cls.engine)
         return parsed_query.set_or_update_query_limit(limit)
 
+    @classmethod
+    def get_tablesample_clause(cls, table: TableClause, percent: float) -> FromClause:
+        """
+        Return a FROM clause reading a random sample of about ``percent`` percent of
+        the rows of a table, using the ``tablesample_method`` of the engine.
+
+        :param table: The table to sample
+        :param percent: The percentage of rows to sample, between 0 and 100
+        :return: The sampled table, aliased with the name of the table
+        """
+        method = Function(cast(str, cls.tablesample_method), percent)
+        return tablesample(table, method, name=table.name)
+
     @classmethod
     def get_cte_query(cls, sql: str) -> str | None:
         """
@@ -1285,13 +1406,38 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
+            if bulk_load_method := cls.get_bulk_load_method(database):
+                # the native loaders are efficient regardless of the number of rows,
+                # so the whole dataframe is loaded in a single call
+                to_sql_kwargs["method"] = bulk_load_method
+                to_sql_kwargs["chunksize"] = None
+            elif (
                 engine.dialect.supports_multivalues_insert
                 or cls.supports_multivalues_insert
             ):
                 to_sql_kwargs["method"] = "multi"
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def get_bulk_load_method(  # pylint: disable=unused-argument
+        cls,
+        database: Database,
+    ) -> BulkLoadMethod | None:
+        """
+        Return a function that loads rows into a table using the native bulk load
+        mechanism of the engine (e.g. `COPY` in Postgres), to be used by `df_to_sql`
+        instead of batched `INSERT` statements.
+
+        The function follows the signature of the `method` argument of
+        `pandas.DataFrame.to_sql`: it receives the pandas table, the SQLAlchemy
+        connection, the column names and an iterator over the rows, and returns
+        the number of rows loaded.
+
+        :param database: The database the data is uploaded to
+        :return: The bulk load function, or `None` to use `INSERT` statements
+        """
+        return None
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -1584,6 +1730,28 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             )
         )
 
+    @classmethod
+    def get_schema_columns(  # pylint: disable=unused-argument
+        cls,
+        inspector: Inspector,
+        schema: str | None,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, list[ResultSetColumnType]] | None:
+        """
+        Get the columns of all the tables and views in a schema with a single
+        query, for engines where reflecting them table by table is slow.
+
+        The columns must be identical to the ones returned by `get_columns`.
+
+        :param inspector: SqlAlchemy Inspector instance
+        :param schema: Schema name
+        :param options: Extra options to customise the display of columns in
+                        some databases
+        :return: The columns keyed by table name, or None if not supported, in
+                 which case `get_columns` is called for each table
+        """
+        return None
+
     @classmethod
     def get_metrics(  # pylint: disable=unused-argument
         cls,
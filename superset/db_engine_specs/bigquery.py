@@ -30,11 +30,13 @@ from deprecation import deprecated
 from flask_babel import gettext as __
 from marshmallow import fields, Schema
 from marshmallow.exceptions import ValidationError
-from sqlalchemy import column, types
+from sqlalchemy import column, tablesample, types
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
-from sqlalchemy.sql import sqltypes
+from sqlalchemy.sql import literal_column, sqltypes
+from sqlalchemy.sql.expression import FromClause, TableClause
+from sqlalchemy.sql.functions import Function
 
 from superset import sql_parse
 from superset.constants import TimeGrain
@@ -127,6 +129,7 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
     allows_hidden_cc_in_orderby = True
 
     supports_catalog = supports_dynamic_catalog = True
+    tablesample_method = "SYSTEM"
 
     # when editing the database, mask this field in `encrypted_extra`
     # pylint: disable=invalid-name
@@ -241,11 +244,14 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
 
     @classmethod
     def fetch_data(cls, cursor: Any, limit: int | None = None) -> list[tuple[Any, ...]]:
-        data = super().fetch_data(cursor, limit)
+        return cls.normalize_rows(super().fetch_data(cursor, limit))
+
+    @classmethod
+    def normalize_rows(cls, data: list[Any]) -> list[tuple[Any, ...]]:
         # Support type BigQuery Row, introduced here PR #4071
         # google.cloud.bigquery.table.Row
         if data and type(data[0]).__name__ == "Row":
-            data = [r.values() for r in data]  # type: ignore
+            data = [r.values() for r in data]
         return data
 
     @staticmethod
@@ -353,6 +359,14 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
     def epoch_ms_to_dttm(cls) -> str:
         return "TIMESTAMP_MILLIS({col})"
 
+    @classmethod
+    def get_tablesample_clause(cls, table: TableClause, percent: float) -> FromClause:
+        """
+        BigQuery expects the sampled percentage to be followed by `PERCENT`.
+        """
+        method = Function("SYSTEM", literal_column(f"{float(percent)} PERCENT"))
+        return tablesample(table, method, name=table.name)
+
     @classmethod
     def df_to_sql(
         cls,
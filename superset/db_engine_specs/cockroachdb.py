@@ -25,6 +25,7 @@ from superset.db_engine_specs.postgres import PostgresEngineSpec
 class CockroachDbEngineSpec(PostgresEngineSpec):
     engine = "cockroachdb"
     engine_name = "CockroachDB"
+    tablesample_method = None
 
     @classmethod
     def convert_dttm(
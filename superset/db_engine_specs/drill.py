@@ -37,6 +37,8 @@ class DrillEngineSpec(BaseEngineSpec):
     default_driver = "sadrill"
 
     supports_dynamic_schema = True
+    # empty results are handled by `fetch_data`
+    allows_progressive_fetch = False
 
     _time_grain_expressions = {
         None: "{col}",
@@ -17,10 +17,13 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
+from uuid import uuid4
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -32,7 +35,7 @@ from sqlalchemy.engine.url import URL
 from superset.config import VERSION_STRING
 from superset.constants import TimeGrain, USER_AGENT
 from superset.databases.utils import make_url_safe
-from superset.db_engine_specs.base import BaseEngineSpec
+from superset.db_engine_specs.base import BaseEngineSpec, BulkLoadMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 
 if TYPE_CHECKING:
@@ -208,6 +211,43 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
         TimeGrain.YEAR: "DATE_TRUNC('year', {col})",
     }
 
+    @classmethod
+    def get_bulk_load_method(cls, database: Database) -> BulkLoadMethod | None:
+        return cls._insert_from_arrow
+
+    @staticmethod
+    def _insert_from_arrow(
+        pd_table: Any,
+        conn: Any,
+        keys: list[str],
+        data_iter: Iterator[tuple[Any, ...]],  # pylint: disable=unused-argument
+    ) -> int:
+        """
+        Register the dataframe as an Arrow table and load it with a single
+        `INSERT ... SELECT`, skipping the conversion of the data to Python rows.
+
+        `df_to_sql` loads the whole dataframe in one call, so the rows are read from
+        the dataframe held by the pandas table instead of `data_iter`.
+        """
+        frame = pd_table.frame
+        if pd_table.index is not None:
+            frame = frame.reset_index()
+        arrow_table = pa.Table.from_pandas(frame, preserve_index=False)
+        arrow_table = arrow_table.rename_columns(keys)
+
+        preparer = conn.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(key) for key in keys)
+        view_name = f"superset_upload_{uuid4().hex}"
+        conn.connection.register(view_name, arrow_table)
+        try:
+            conn.exec_driver_sql(
+                f"INSERT INTO {preparer.format_table(pd_table.table)} ({columns}) "
+                f"SELECT {columns} FROM {view_name}"
+            )
+        finally:
+            conn.connection.unregister(view_name)
+        return arrow_table.num_rows
+
     custom_errors: dict[Pattern[str], tuple[str, SupersetErrorType, dict[str, Any]]] = {
         COLUMN_DOES_NOT_EXIST_REGEX: (
             __('We can\'t seem to resolve the column "%(column_name)s"'),
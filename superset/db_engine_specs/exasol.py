@@ -44,6 +44,9 @@ class ExasolEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
     def fetch_data(
         cls, cursor: Any, limit: Optional[int] = None
     ) -> list[tuple[Any, ...]]:
-        data = super().fetch_data(cursor, limit)
+        return cls.normalize_rows(super().fetch_data(cursor, limit))
+
+    @classmethod
+    def normalize_rows(cls, data: list[Any]) -> list[tuple[Any, ...]]:
         # Lists of `pyodbc.Row` need to be unpacked further
         return cls.pyodbc_rows_to_tuples(data)
@@ -107,6 +107,7 @@ class GSheetsEngineSpec(ShillelaghEngineSpec):
     }
 
     supports_file_upload = True
+    supports_file_upload_append = False
 
     # OAuth 2.0
     supports_oauth2 = True
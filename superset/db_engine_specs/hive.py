@@ -105,6 +105,10 @@ class HiveEngineSpec(PrestoEngineSpec):
     allows_hidden_orderby_agg = False
 
     supports_dynamic_schema = True
+    tablesample_method = None
+    # results are fetched after polling the state of the operation
+    allows_progressive_fetch = False
+    supports_file_upload_append = False
 
     # When running `SHOW FUNCTIONS`, what is the name of the column with the
     # function names?
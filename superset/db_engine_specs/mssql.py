@@ -144,7 +144,10 @@ class MssqlEngineSpec(BaseEngineSpec):
     ) -> list[tuple[Any, ...]]:
         if not cursor.description:
             return []
-        data = super().fetch_data(cursor, limit)
+        return cls.normalize_rows(super().fetch_data(cursor, limit))
+
+    @classmethod
+    def normalize_rows(cls, data: list[Any]) -> list[tuple[Any, ...]]:
         # Lists of `pyodbc.Row` need to be unpacked further
         return cls.pyodbc_rows_to_tuples(data)
 
@@ -19,7 +19,7 @@ import re
 from datetime import datetime
 from decimal import Decimal
 from re import Pattern
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from urllib import parse
 
 from flask_babel import gettext as __
@@ -39,11 +39,19 @@ from sqlalchemy.dialects.mysql import (
 from sqlalchemy.engine.url import URL
 
 from superset.constants import TimeGrain
-from superset.db_engine_specs.base import BaseEngineSpec, BasicParametersMixin
+from superset.db_engine_specs.base import (
+    BaseEngineSpec,
+    BasicParametersMixin,
+    BulkLoadMethod,
+    executemany_bulk_load,
+)
 from superset.errors import SupersetErrorType
 from superset.models.sql_lab import Query
 from superset.utils.core import GenericDataType
 
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
 # Regular expressions to catch custom errors
 CONNECTION_ACCESS_DENIED_REGEX = re.compile(
     "Access denied for user '(?P<username>.*?)'@'(?P<hostname>.*?)'"
@@ -191,6 +199,18 @@ class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
         "mysqlconnector": {"allow_local_infile": 0},
     }
 
+    @classmethod
+    def get_bulk_load_method(cls, database: "Database") -> Optional[BulkLoadMethod]:
+        """
+        `LOAD DATA LOCAL INFILE` is disabled on purpose (see
+        `enforce_uri_query_params`), since it allows the server to read arbitrary
+        files from the client. `mysqlclient` rewrites `executemany` of an `INSERT`
+        into batched multi-row statements sized to the packet limit instead.
+        """
+        if database.driver == "mysqldb":
+            return executemany_bulk_load
+        return None
+
     @classmethod
     def convert_dttm(
         cls, target_type: str, dttm: datetime, db_extra: Optional[dict[str, Any]] = None
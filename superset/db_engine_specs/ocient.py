@@ -230,6 +230,8 @@ class OcientEngineSpec(BaseEngineSpec):
     max_column_name_length = 30
 
     allows_cte_in_subquery = False
+    # results are sanitized and the query mapping is cleaned up by `fetch_data`
+    allows_progressive_fetch = False
     # Ocient does not support cte names starting with underscores
     cte_alias = "cte__"
     # Store mapping of superset Query id -> Ocient ID
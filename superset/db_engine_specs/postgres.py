@@ -19,23 +19,33 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
+from io import StringIO
 from re import Pattern
 from typing import Any, TYPE_CHECKING
+from uuid import uuid4
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
+from sqlalchemy.sql import text
 from sqlalchemy.types import Date, DateTime, String
 
 from superset.constants import TimeGrain
-from superset.db_engine_specs.base import BaseEngineSpec, BasicParametersMixin
+from superset.db_engine_specs.base import (
+    BaseEngineSpec,
+    BasicParametersMixin,
+    BulkLoadMethod,
+    convert_inspector_columns,
+)
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetException, SupersetSecurityException
 from superset.models.sql_lab import Query
 from superset.sql.parse import SQLScript
+from superset.superset_typing import ResultSetColumnType, SQLAColumnType
 from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType
 
@@ -206,6 +216,7 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
     supports_dynamic_schema = True
     supports_catalog = True
     supports_dynamic_catalog = True
+    tablesample_method = "SYSTEM"
 
     default_driver = "psycopg2"
     sqlalchemy_uri_placeholder = (
@@ -240,6 +251,53 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
         ),
     )
 
+    @classmethod
+    def get_bulk_load_method(cls, database: Database) -> BulkLoadMethod | None:
+        if database.driver == "psycopg2":
+            return cls._copy_from_stdin
+        return None
+
+    @staticmethod
+    def _quote_copy_value(value: Any) -> str:
+        """
+        Quote a value for `COPY ... FROM STDIN` in CSV format.
+        """
+        if value is None:
+            return ""
+        escaped = str(value).replace('"', '""')
+        return f'"{escaped}"'
+
+    @staticmethod
+    def _copy_from_stdin(
+        pd_table: Any,
+        conn: Any,
+        keys: list[str],
+        data_iter: Iterator[tuple[Any, ...]],
+    ) -> int:
+        """
+        Load the rows with `COPY ... FROM STDIN`, streaming them as CSV.
+
+        Nulls are written as unquoted empty values, and every other value is quoted,
+        so that empty strings (or any other string) are never read as nulls.
+        """
+        buffer = StringIO()
+        buffer.writelines(
+            ",".join(PostgresEngineSpec._quote_copy_value(value) for value in row)
+            + "\n"
+            for row in data_iter
+        )
+        buffer.seek(0)
+
+        preparer = conn.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(key) for key in keys)
+        sql = (
+            f"COPY {preparer.format_table(pd_table.table)} ({columns}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(sql, buffer)
+            return cursor.rowcount
+
     @classmethod
     def get_schema_from_engine_params(
         cls,
@@ -392,6 +450,17 @@ WHERE datistemplate = false;
             )
         }
 
+    @classmethod
+    def get_server_side_cursor(cls, connection: Any) -> Any:
+        """
+        Use a named cursor, which psycopg declares as a server-side cursor.
+        """
+        try:
+            return connection.cursor(name=f"superset_{uuid4().hex}")
+        except TypeError:
+            # the driver does not support named cursors
+            return connection.cursor()
+
     @classmethod
     def get_table_names(
         cls, database: Database, inspector: PGInspector, schema: str | None
@@ -401,6 +470,84 @@ WHERE datistemplate = false;
             inspector.get_foreign_table_names(schema)
         )
 
+    @classmethod
+    def get_schema_columns(  # pylint: disable=too-many-locals
+        cls,
+        inspector: Inspector,
+        schema: str | None,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, list[ResultSetColumnType]] | None:
+        """
+        Read the columns of every relation in the schema from the catalog in one
+        query. The SQLAlchemy reflection runs several queries per table, loading
+        all the domains and enums each time.
+
+        The column types are parsed by the dialect the same way it does when
+        reflecting a single table; if that fails (eg, with a different
+        SQLAlchemy version) the columns are reflected table by table.
+        """
+        dialect = inspector.dialect
+        if dialect.name != "postgresql":
+            return None
+
+        sql = text(
+            """
+            SELECT c.relname, a.attname,
+              pg_catalog.format_type(a.atttypid, a.atttypmod),
+              a.attnotnull, pgd.description
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_catalog.pg_description pgd ON (
+                pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+            WHERE n.nspname = :schema
+            AND c.relkind IN ('r', 'v', 'm', 'f', 'p')
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY c.relname, a.attnum
+            """
+        )
+        # pylint: disable=protected-access
+        try:
+            with inspector.engine.connect() as connection:
+                rows = connection.execute(
+                    sql, {"schema": schema or dialect.default_schema_name}
+                ).fetchall()
+                domains = dialect._load_domains(connection)
+                enums = {
+                    (
+                        (rec["name"],)
+                        if rec["visible"]
+                        else (rec["schema"], rec["name"])
+                    ): rec
+                    for rec in dialect._load_enums(connection, schema="*")
+                }
+            columns: dict[str, list[SQLAColumnType]] = {}
+            for table_name, name, format_type, notnull, comment in rows:
+                columns.setdefault(table_name, []).append(
+                    dialect._get_column_info(
+                        name,
+                        format_type,
+                        None,
+                        notnull,
+                        domains,
+                        enums,
+                        schema,
+                        comment,
+                        None,
+                        None,
+                    )
+                )
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Unable to read the columns of schema %s", schema, exc_info=True
+            )
+            return None
+
+        return {
+            table_name: convert_inspector_columns(table_columns)
+            for table_name, table_columns in columns.items()
+        }
+
     @staticmethod
     def get_extra_params(database: Database) -> dict[str, Any]:
         """
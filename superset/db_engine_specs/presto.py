@@ -165,6 +165,7 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
 
     supports_dynamic_schema = True
     supports_catalog = supports_dynamic_catalog = True
+    tablesample_method = "SYSTEM"
 
     column_type_mappings = (
         (
@@ -20,4 +20,5 @@ from superset.db_engine_specs.postgres import PostgresEngineSpec
 class RisingWaveDbEngineSpec(PostgresEngineSpec):
     engine = "risingwave"
     engine_name = "RisingWave"
+    tablesample_method = None
     default_driver = ""
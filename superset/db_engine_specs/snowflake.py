@@ -86,6 +86,7 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
 
     supports_dynamic_schema = True
     supports_catalog = supports_dynamic_catalog = True
+    tablesample_method = "SYSTEM"
 
     # pylint: disable=invalid-name
     encrypted_extra_sensitive_fields = {
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import logging
 import re
 from datetime import datetime
 from re import Pattern
@@ -25,15 +26,23 @@ from typing import Any, TYPE_CHECKING
 from flask_babel import gettext as __
 from sqlalchemy import types
 from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.sql import text
 
 from superset.constants import TimeGrain
-from superset.db_engine_specs.base import BaseEngineSpec
+from superset.db_engine_specs.base import (
+    BaseEngineSpec,
+    BulkLoadMethod,
+    convert_inspector_columns,
+    executemany_bulk_load,
+)
 from superset.errors import SupersetErrorType
+from superset.superset_typing import ResultSetColumnType, SQLAColumnType
 
 if TYPE_CHECKING:
     # prevent circular imports
     from superset.models.core import Database
 
+logger = logging.getLogger(__name__)
 
 COLUMN_DOES_NOT_EXIST_REGEX = re.compile("no such column: (?P<column_name>.+)")
 
@@ -111,6 +120,10 @@ class SqliteEngineSpec(BaseEngineSpec):
         ),
     }
 
+    @classmethod
+    def get_bulk_load_method(cls, database: Database) -> BulkLoadMethod | None:
+        return executemany_bulk_load
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "datetime({col}, 'unixepoch')"
@@ -134,6 +147,55 @@ class SqliteEngineSpec(BaseEngineSpec):
         """Need to disregard the schema for Sqlite"""
         return set(inspector.get_table_names())
 
+    @classmethod
+    def get_schema_columns(
+        cls,
+        inspector: Inspector,
+        schema: str | None,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, list[ResultSetColumnType]] | None:
+        """
+        Read the columns of every table and view with a single query, joining the
+        `pragma_table_info` table-valued function. Like `get_table_names`, the
+        schema is disregarded.
+        """
+        sql = text(
+            """
+            SELECT m.name, p.name, p.type, p."notnull", p.dflt_value, p.pk
+            FROM sqlite_master AS m
+            JOIN pragma_table_info(m.name) AS p
+            WHERE m.type IN ('table', 'view') AND m.name NOT LIKE 'sqlite_%'
+            ORDER BY m.name, p.cid
+            """
+        )
+        dialect = inspector.dialect
+        # pylint: disable=protected-access
+        try:
+            with inspector.engine.connect() as connection:
+                rows = connection.execute(sql).fetchall()
+            columns: dict[str, list[SQLAColumnType]] = {}
+            for table_name, name, type_, notnull, default, primary_key in rows:
+                columns.setdefault(table_name, []).append(
+                    dialect._get_column_info(
+                        name,
+                        type_.upper(),
+                        not notnull,
+                        default,
+                        primary_key,
+                        False,
+                        False,
+                        None,
+                    )
+                )
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to read the columns of the database", exc_info=True)
+            return None
+
+        return {
+            table_name: convert_inspector_columns(table_columns)
+            for table_name, table_columns in columns.items()
+        }
+
     @classmethod
     def get_function_names(
         cls,
@@ -64,6 +64,7 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
     engine = "trino"
     engine_name = "Trino"
     allows_alias_to_source_column = False
+    supports_file_upload_append = False
 
     @classmethod
     def get_extra_table_metadata(
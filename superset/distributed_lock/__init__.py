@@ -75,3 +75,54 @@ def KeyValueDistributedLock(  # pylint: disable=invalid-name
     yield key
     DeleteDistributedLock(namespace=namespace, params=kwargs).run()
     logger.debug("Removed lock on namespace %s for key %s", namespace, key)
+
+
+@contextmanager
+def KeyValueDistributedSemaphore(  # pylint: disable=invalid-name
+    namespace: str,
+    slots: int,
+    lock_expiration: timedelta = LOCK_EXPIRATION,
+    **kwargs: Any,
+) -> Iterator[uuid.UUID]:
+    """
+    KV global semaphore, allowing up to `slots` holders at once.
+
+    Each slot is a distributed lock on the namespace, with the slot number added to
+    the optional parameters. Unlike `KeyValueDistributedLock`, the slot is released
+    when the context exits with an exception too.
+
+    :param namespace: The namespace for which a slot is to be acquired.
+    :param slots: The number of slots.
+    :param lock_expiration: How long a slot is held at most, in case the holder
+        fails to release it (eg, the process was killed).
+    :param kwargs: Additional keyword arguments.
+    :yields: A unique identifier (UUID) for the acquired slot (the KV key).
+    :raises CreateKeyValueDistributedLockFailedException: If all slots are taken.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.distributed_lock.create import CreateDistributedLock
+    from superset.commands.distributed_lock.delete import DeleteDistributedLock
+
+    for slot in range(slots):
+        params = {**kwargs, "slot": slot}
+        try:
+            CreateDistributedLock(
+                namespace=namespace,
+                params=params,
+                lock_expiration=lock_expiration,
+            ).run()
+        except CreateKeyValueDistributedLockFailedException:
+            continue
+
+        key = get_key(namespace, **params)
+        logger.debug("Acquired slot %s on namespace %s (%s)", slot, namespace, key)
+        try:
+            yield key
+        finally:
+            DeleteDistributedLock(namespace=namespace, params=params).run()
+            logger.debug("Released slot %s on namespace %s", slot, namespace)
+        return
+
+    logger.debug("All %s slots on namespace %s are taken", slots, namespace)
+    raise CreateKeyValueDistributedLockFailedException("All slots taken")
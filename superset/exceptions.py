@@ -408,6 +408,12 @@ class DeleteKeyValueDistributedLockFailedException(Exception):
     """
 
 
+class DatabaseConcurrencyLimitExceededException(Exception):
+    """
+    Exception to signalize that all the query slots of a database are taken.
+    """
+
+
 class DatabaseNotFoundException(SupersetErrorException):
     status = 404
 
@@ -116,6 +116,29 @@ class SupersetMetastoreCache(BaseCache):
 
         return KeyValueDAO.get_value(RESOURCE, self.get_key(key), self.codec)
 
+    def get_many(self, *keys: str) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        uuids = [self.get_key(key) for key in keys]
+        values = KeyValueDAO.get_values(RESOURCE, uuids, self.codec)
+        return [values.get(uuid) for uuid in uuids]
+
+    @transaction()
+    def set_many(
+        self, mapping: dict[str, Any], timeout: Optional[int] = None
+    ) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        KeyValueDAO.upsert_entries(
+            resource=RESOURCE,
+            values={self.get_key(key): value for key, value in mapping.items()},
+            codec=self.codec,
+            expires_on=self._get_expiry(timeout),
+        )
+        return list(mapping)
+
     def has(self, key: str) -> bool:
         entry = self.get(key)
         if entry:
@@ -128,3 +151,11 @@ class SupersetMetastoreCache(BaseCache):
         from superset.daos.key_value import KeyValueDAO
 
         return KeyValueDAO.delete_entry(RESOURCE, self.get_key(key))
+
+    @transaction()
+    def delete_many(self, *keys: str) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        KeyValueDAO.delete_entries(RESOURCE, [self.get_key(key) for key in keys])
+        return list(keys)
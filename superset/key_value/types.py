@@ -22,6 +22,9 @@ from abc import ABC, abstractmethod
 from typing import Any, TypedDict, Union
 from uuid import UUID
 
+import msgpack
+import zstandard
+from flask import current_app, has_app_context
 from marshmallow import Schema, ValidationError
 
 from superset.key_value.exceptions import (
@@ -32,6 +35,9 @@ from superset.utils.backports import StrEnum
 
 Key = Union[int, UUID]
 
+# Every zstd frame starts with these bytes
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 
 class KeyValueFilter(TypedDict, total=False):
     resource: str
@@ -99,3 +105,70 @@ class MarshmallowKeyValueCodec(JsonKeyValueCodec):
             return self.schema.load(obj)
         except ValidationError as ex:
             raise KeyValueCodecEncodeException(message=str(ex)) from ex
+
+
+class MsgpackKeyValueCodec(KeyValueCodec):
+    """
+    A compact binary alternative to `JsonKeyValueCodec`. Like JSON, only plain
+    data types (dicts, lists, strings, numbers, booleans and None) are supported.
+    """
+
+    def encode(self, value: Any) -> bytes:
+        try:
+            return msgpack.packb(value, use_bin_type=True)
+        except (TypeError, ValueError) as ex:
+            raise KeyValueCodecEncodeException(str(ex)) from ex
+
+    def decode(self, value: bytes) -> Any:
+        try:
+            return msgpack.unpackb(value, raw=False, strict_map_key=False)
+        except (TypeError, ValueError) as ex:
+            raise KeyValueCodecDecodeException(str(ex)) from ex
+
+
+class ZstdKeyValueCodec(KeyValueCodec):
+    """
+    Compresses the output of another codec with zstd. The raw and compressed
+    sizes of every encoded value are reported to the stats logger as
+    `<metric_prefix>.raw_size` and `<metric_prefix>.compressed_size` gauges.
+
+    Values that aren't zstd frames are passed to the wrapped codec as-is, which
+    makes it possible to switch an existing store to this codec as long as the
+    wrapped codec stays the same.
+    """
+
+    def __init__(
+        self,
+        codec: KeyValueCodec | None = None,
+        level: int = 3,
+        metric_prefix: str = "key_value.codec",
+    ):
+        self.codec = codec or MsgpackKeyValueCodec()
+        self.metric_prefix = metric_prefix
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._error = zstandard.ZstdError
+
+    def _log_sizes(self, raw_size: int, compressed_size: int) -> None:
+        if has_app_context():
+            stats_logger = current_app.config["STATS_LOGGER"]
+            stats_logger.gauge(f"{self.metric_prefix}.raw_size", raw_size)
+            stats_logger.gauge(f"{self.metric_prefix}.compressed_size", compressed_size)
+
+    def encode(self, value: Any) -> bytes:
+        raw = self.codec.encode(value)
+        try:
+            compressed = self._compressor.compress(raw)
+        except self._error as ex:
+            raise KeyValueCodecEncodeException(str(ex)) from ex
+        self._log_sizes(len(raw), len(compressed))
+        return compressed
+
+    def decode(self, value: bytes) -> Any:
+        if bytes(value[:4]) != ZSTD_MAGIC:
+            return self.codec.decode(value)
+        try:
+            raw = self._decompressor.decompress(value)
+        except self._error as ex:
+            raise KeyValueCodecDecodeException(str(ex)) from ex
+        return self.codec.decode(raw)
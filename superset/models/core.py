@@ -25,6 +25,7 @@ import builtins
 import logging
 import textwrap
 from ast import literal_eval
+from collections.abc import Iterator
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
 from datetime import datetime
@@ -74,7 +75,11 @@ from superset.extensions import (
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin
 from superset.result_set import SupersetResultSet
 from superset.sql_parse import Table
-from superset.superset_typing import OAuth2ClientConfig, ResultSetColumnType
+from superset.superset_typing import (
+    OAuth2ClientConfig,
+    ResultSetColumnType,
+    TableReflection,
+)
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import DatasourceName, get_username
@@ -694,6 +699,68 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
             return self.post_process_df(df)
 
+    def get_df_chunks(  # pylint: disable=too-many-arguments, too-many-locals
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+        chunk_size: int = 10000,
+        limit: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run the statements in ``sql`` and yield the results of the last one as
+        dataframes of at most ``chunk_size`` rows.
+
+        Unlike ``get_df`` the result set is never materialized as a whole: the last
+        statement runs on a server-side cursor when the engine spec supports it,
+        and rows are fetched one batch at a time. At least one (possibly empty)
+        dataframe is always yielded.
+        """
+        sqls = self.db_engine_spec.parse_sql(sql)
+        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
+            engine_url = engine.url
+
+        with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
+            cursor = conn.cursor()
+            try:
+                for i, sql_ in enumerate(sqls):
+                    sql_ = self.mutate_sql_based_on_config(sql_, is_split=True)
+                    if log_query:
+                        log_query(engine_url, sql_, schema, __name__, security_manager)
+                    if i == len(sqls) - 1:
+                        # the last statement runs on a cursor that can stream its rows
+                        cursor.close()
+                        cursor = self.db_engine_spec.get_server_side_cursor(conn)
+                    with event_logger.log_context(
+                        action="execute_sql",
+                        database=self,
+                        object_ref=__name__,
+                    ):
+                        self.db_engine_spec.execute(cursor, sql_, self)
+                        if i < len(sqls) - 1:
+                            # If it's not the last, we don't keep the results
+                            cursor.fetchall()
+
+                empty = True
+                # statements without a result set have nothing to fetch
+                chunks = (
+                    self.db_engine_spec.fetch_data_chunks(cursor, chunk_size, limit)
+                    if cursor.description
+                    else []
+                )
+                for data in chunks:
+                    empty = False
+                    result_set = SupersetResultSet(
+                        data, cursor.description, self.db_engine_spec
+                    )
+                    yield self.post_process_df(result_set.to_pandas_df())
+                if empty:
+                    yield pd.DataFrame(
+                        columns=[column[0] for column in cursor.description or []]
+                    )
+            finally:
+                cursor.close()
+
     def compile_sqla_query(
         self,
         qry: Select,
@@ -973,15 +1040,19 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             catalog=table.catalog,
             schema=table.schema,
         ) as inspector:
-            pk_constraint = inspector.get_pk_constraint(table.table, table.schema) or {}
+            return self._get_pk_constraint(inspector, table)
 
-            def _convert(value: Any) -> Any:
-                try:
-                    return json.base_json_conv(value)
-                except TypeError:
-                    return None
+    @staticmethod
+    def _get_pk_constraint(inspector: Inspector, table: Table) -> dict[str, Any]:
+        pk_constraint = inspector.get_pk_constraint(table.table, table.schema) or {}
+
+        def _convert(value: Any) -> Any:
+            try:
+                return json.base_json_conv(value)
+            except TypeError:
+                return None
 
-            return {key: _convert(value) for key, value in pk_constraint.items()}
+        return {key: _convert(value) for key, value in pk_constraint.items()}
 
     def get_foreign_keys(self, table: Table) -> list[dict[str, Any]]:
         with self.get_inspector(
@@ -990,6 +1061,38 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         ) as inspector:
             return inspector.get_foreign_keys(table.table, table.schema)
 
+    @cache_util.memoized_func(
+        key="db:{self.id}:table:{table}:reflection",
+        cache=cache_manager.cache,
+    )
+    def get_table_reflection(self, table: Table) -> TableReflection:
+        """
+        Reflect the columns, primary key, foreign keys, indexes and comment of a
+        table in a single pass, sharing one inspector between the calls.
+
+        For unused parameters, they are referenced in
+        cache_util.memoized_func decorator.
+
+        :param table: The table to reflect
+        :param cache: whether cache is enabled for the function
+        :param cache_timeout: timeout in seconds for the cache
+        :param force: whether to force refresh the cache
+        :return: The table reflection
+        """
+        with self.get_inspector(
+            catalog=table.catalog,
+            schema=table.schema,
+        ) as inspector:
+            return {
+                "columns": self.db_engine_spec.get_columns(
+                    inspector, table, self.schema_options
+                ),
+                "pk_constraint": self._get_pk_constraint(inspector, table),
+                "foreign_keys": inspector.get_foreign_keys(table.table, table.schema),
+                "indexes": self.db_engine_spec.get_indexes(self, inspector, table),
+                "comment": self.db_engine_spec.get_table_comment(inspector, table),
+            }
+
     def get_schema_access_for_file_upload(  # pylint: disable=invalid-name
         self,
     ) -> set[str]:
@@ -19,6 +19,7 @@ from __future__ import annotations
 import logging
 import uuid
 from collections import defaultdict, deque
+from collections.abc import Iterable
 from typing import Any, Callable
 
 import sqlalchemy as sqla
@@ -44,6 +45,7 @@ from sqlalchemy.sql.elements import BinaryExpression
 from superset import app, db, is_feature_enabled, security_manager
 from superset.connectors.sqla.models import BaseDatasource, SqlaTable
 from superset.daos.datasource import DatasourceDAO
+from superset.extensions import cache_manager
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin
 from superset.models.slice import Slice
 from superset.models.user_attributes import UserAttribute
@@ -51,6 +53,7 @@ from superset.tasks.thumbnails import cache_dashboard_thumbnail
 from superset.tasks.utils import get_current_user
 from superset.thumbnails.digest import get_dashboard_digest
 from superset.utils import core as utils, json
+from superset.utils.hashing import md5_sha_from_dict
 
 metadata = Model.metadata  # pylint: disable=no-member
 config = app.config
@@ -262,7 +265,9 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
             "is_managed_externally": self.is_managed_externally,
         }
 
-    def datasets_trimmed_for_slices(self) -> list[dict[str, Any]]:
+    def datasets_trimmed_for_slices(
+        self, datasources: set[BaseDatasource] | None = None
+    ) -> list[dict[str, Any]]:
         # Verbose but efficient database enumeration of dashboard datasources.
         slices_by_datasource: dict[tuple[type[BaseDatasource], int], set[Slice]] = (
             defaultdict(set)
@@ -271,19 +276,55 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
         for slc in self.slices:
             slices_by_datasource[(slc.cls_model, slc.datasource_id)].add(slc)
 
-        result: list[dict[str, Any]] = []
-
-        for (cls_model, datasource_id), slices in slices_by_datasource.items():
-            datasource = (
-                db.session.query(cls_model).filter_by(id=datasource_id).one_or_none()
-            )
-
-            if datasource:
-                # Filter out unneeded fields from the datasource payload
-                result.append(datasource.data_for_slices(slices))
+        # the datasources can be passed in when the caller already loaded them
+        if datasources is None:
+            datasources = self.datasources
+        datasources_by_key = {
+            (type(datasource), datasource.id): datasource for datasource in datasources
+        }
 
+        cache_timeout = config["DASHBOARD_DATASETS_CACHE_TIMEOUT"]
+        cache_key = (
+            self._trimmed_datasets_cache_key(datasources) if cache_timeout else None
+        )
+        if cache_key and (result := cache_manager.cache.get(cache_key)) is not None:
+            return result
+
+        # Filter out unneeded fields from the datasource payload
+        result = [
+            datasource.data_for_slices(slices)
+            for key, slices in slices_by_datasource.items()
+            if (datasource := datasources_by_key.get(key))
+        ]
+
+        if cache_key:
+            cache_manager.cache.set(cache_key, result, timeout=cache_timeout)
         return result
 
+    def _trimmed_datasets_cache_key(self, datasources: Iterable[BaseDatasource]) -> str:
+        """
+        Key of the cached datasets payload, derived from the last change of the
+        dashboard, its charts and datasets, and the roles and RLS filters of the
+        current user.
+        """
+        return "dashboard_datasets_" + md5_sha_from_dict(
+            {
+                "dashboard_id": self.id,
+                "changed_on": self.changed_on,
+                "roles": security_manager.get_roles_cache_key(),
+                "slices": sorted((slc.id, str(slc.changed_on)) for slc in self.slices),
+                "datasources": sorted(
+                    (
+                        datasource.uid,
+                        str(datasource.changed_on),
+                        security_manager.get_rls_cache_key(datasource),
+                    )
+                    for datasource in datasources
+                ),
+            },
+            default=str,
+        )
+
     @property
     def params(self) -> str:
         return self.json_metadata
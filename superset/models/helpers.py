@@ -109,6 +109,14 @@ VIRTUAL_TABLE_ALIAS = "virtual_table"
 SERIES_LIMIT_SUBQ_ALIAS = "series_limit"
 ADVANCED_DATA_TYPES = config["ADVANCED_DATA_TYPES"]
 
+# SQL metrics scaled up when computed from a sample of the rows: a single SUM or COUNT
+# of an expression without parentheses, excluding COUNT(DISTINCT ...)
+SAMPLE_SCALED_METRIC_REGEX = re.compile(
+    r"^\s*(SUM|COUNT)\s*\((?!\s*DISTINCT\b)[^()]*\)\s*$",
+    re.IGNORECASE,
+)
+SAMPLE_SCALED_AGGREGATES = {"SUM", "COUNT"}
+
 
 def validate_adhoc_subquery(
     sql: str,
@@ -578,6 +586,7 @@ class QueryResult:  # pylint: disable=too-few-public-methods
         errors: Optional[list[dict[str, Any]]] = None,
         from_dttm: Optional[datetime] = None,
         to_dttm: Optional[datetime] = None,
+        sample_percent: Optional[float] = None,
     ) -> None:
         self.df = df
         self.query = query
@@ -591,6 +600,8 @@ class QueryResult:  # pylint: disable=too-few-public-methods
         self.from_dttm = from_dttm
         self.to_dttm = to_dttm
         self.sql_rowcount = len(self.df.index) if not self.df.empty else 0
+        self.post_processing_stats: list[dict[str, Any]] = []
+        self.sample_percent = sample_percent
 
 
 class ExtraJSONMixin:
@@ -688,6 +699,7 @@ class QueryStringExtended(NamedTuple):
     labels_expected: list[str]
     prequeries: list[str]
     sql: str
+    sample_percent: Optional[float] = None
 
 
 class SqlaQuery(NamedTuple):
@@ -699,6 +711,7 @@ class SqlaQuery(NamedTuple):
     labels_expected: list[str]
     prequeries: list[str]
     sqla_query: Select
+    sample_percent: Optional[float] = None
 
 
 class ExploreMixin:  # pylint: disable=too-many-public-methods
@@ -716,6 +729,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         "MAX": sa.func.MAX,
     }
     fetch_values_predicate = None
+    sample_percent: Optional[float] = None
 
     @property
     def type(self) -> str:
@@ -802,6 +816,47 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
     def get_template_processor(self, **kwargs: Any) -> BaseTemplateProcessor:
         raise NotImplementedError()
 
+    def get_sample_percent(
+        self,
+        extras: dict[str, Any],  # pylint: disable=unused-argument
+    ) -> Optional[float]:
+        """
+        Return the percentage of the rows sampled by a query with these extras, or
+        None when the query reads all the rows.
+        """
+        return self.sample_percent
+
+    def _scale_sampled_metric(
+        self,
+        metric: Metric,
+        sqla_metric: ColumnElement,
+        metrics_by_name: dict[str, "SqlMetric"],
+        sample_percent: float,
+    ) -> ColumnElement:
+        """
+        Scale a SUM or COUNT metric computed from a sample of the rows up to an
+        estimate of its value over all the rows. Other metrics are left as is.
+        """
+        if utils.is_adhoc_metric(metric):
+            metric = cast(AdhocMetric, metric)
+            if metric.get("expressionType") == utils.AdhocMetricExpressionType.SIMPLE:
+                aggregate = str(metric.get("aggregate") or "").upper()
+                scaled = aggregate in SAMPLE_SCALED_AGGREGATES
+            else:
+                expression = metric.get("sqlExpression") or ""
+                scaled = bool(SAMPLE_SCALED_METRIC_REGEX.match(expression))
+        else:
+            expression = metrics_by_name[cast(str, metric)].expression or ""
+            scaled = bool(SAMPLE_SCALED_METRIC_REGEX.match(expression))
+
+        if not scaled:
+            return sqla_metric
+        element = sqla_metric.element if isinstance(sqla_metric, Label) else sqla_metric
+        return self.make_sqla_column_compatible(
+            element * (100 / sample_percent),
+            sqla_metric.key,
+        )
+
     def get_fetch_values_predicate(
         self,
         template_processor: Optional[  # pylint: disable=unused-argument
@@ -890,6 +945,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             labels_expected=sqlaq.labels_expected,
             prequeries=sqlaq.prequeries,
             sql=sql,
+            sample_percent=sqlaq.sample_percent,
         )
 
     def _normalize_prequery_result_type(
@@ -1030,6 +1086,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             query=sql,
             errors=errors,
             error_message=error_message,
+            sample_percent=query_str_ext.sample_percent,
         )
 
     def get_rendered_sql(
@@ -1326,7 +1383,17 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         column_name: str,
         limit: int = 10000,
         denormalize_column: bool = False,
+        search: Optional[str] = None,
     ) -> list[Any]:
+        """
+        Return the distinct values of a column.
+
+        :param column_name: The name of the column
+        :param limit: The maximum number of values
+        :param denormalize_column: Whether to denormalize the column name
+        :param search: Only return the values starting with this prefix, ignoring
+            case. Only supported for string columns
+        """
         # denormalize column name before querying for values
         # unless disabled in the dataset configuration
         db_dialect = self.database.get_dialect()
@@ -1357,6 +1424,13 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         if self.fetch_values_predicate:
             qry = qry.where(self.get_fetch_values_predicate(template_processor=tp))
 
+        if search:
+            qry = qry.where(
+                sa.func.lower(
+                    target_col.get_sqla_col(template_processor=tp)
+                ).startswith(search.lower(), autoescape=True)
+            )
+
         rls_filters = self.get_sqla_row_level_filters(template_processor=tp)
         qry = qry.where(and_(*rls_filters))
 
@@ -1455,6 +1529,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
         extras = extras or {}
         time_grain = extras.get("time_grain_sqla")
+        sample_percent = self.get_sample_percent(extras)
 
         template_kwargs = {
             "columns": columns,
@@ -1541,6 +1616,15 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                     _("Metric '%(metric)s' does not exist", metric=metric)
                 )
 
+        unscaled_metrics_exprs = metrics_exprs
+        if sample_percent is not None:
+            metrics_exprs = [
+                self._scale_sampled_metric(
+                    metric, metric_expr, metrics_by_name, sample_percent
+                )
+                for metric, metric_expr in zip(metrics, metrics_exprs)
+            ]
+
         if metrics_exprs:
             main_metric_expr = metrics_exprs[0]
         else:
@@ -1551,7 +1635,10 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         # metric instance if defined in the SELECT clause.
         # use the key of the ColumnClause for the expected label
         metrics_exprs_by_label = {m.key: m for m in metrics_exprs}
-        metrics_exprs_by_expr = {str(m): m for m in metrics_exprs}
+        metrics_exprs_by_expr = {
+            str(unscaled): m
+            for unscaled, m in zip(unscaled_metrics_exprs, metrics_exprs)
+        }
 
         # Since orderby may use adhoc metrics, too; we need to process them first
         orderby_exprs: list[ColumnElement] = []
@@ -1729,6 +1816,10 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         qry = sa.select(select_exprs)
 
         tbl, cte = self.get_from_clause(template_processor)
+        if sample_percent is not None:
+            tbl = db_engine_spec.get_tablesample_clause(
+                cast(TableClause, tbl), sample_percent
+            )
 
         if groupby_all_columns:
             qry = qry.group_by(*groupby_all_columns.values())
@@ -2122,4 +2213,5 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             labels_expected=labels_expected,
             sqla_query=qry,
             prequeries=prequeries,
+            sample_percent=sample_percent,
         )
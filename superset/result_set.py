@@ -23,6 +23,7 @@ from typing import Any, Optional
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 from numpy.typing import NDArray
 
 from superset.db_engine_specs import BaseEngineSpec
@@ -32,6 +33,96 @@ from superset.utils.core import GenericDataType
 
 logger = logging.getLogger(__name__)
 
+# Arrow types converted through numpy, along with integers without nulls
+FLAT_ARROW_TYPES = (
+    pa.types.is_floating,
+    pa.types.is_boolean,
+    pa.types.is_string,
+    pa.types.is_large_string,
+)
+
+
+def _arrow_to_pylist(column: pa.ChunkedArray) -> list[Any]:
+    """
+    Convert an Arrow column to a list of Python values.
+
+    Going through numpy is an order of magnitude faster than ``to_pylist`` for flat
+    types, but would turn the nulls of an integer column into ``NaN``.
+    """
+    if any(is_type(column.type) for is_type in FLAT_ARROW_TYPES) or (
+        pa.types.is_integer(column.type) and not column.null_count
+    ):
+        return column.to_numpy(zero_copy_only=False).tolist()
+    return column.to_pylist()
+
+
+def _arrow_timestamps_to_iso(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    Format timestamps as ``pd.Timestamp.isoformat`` does.
+    """
+    column = pc.cast(column, pa.timestamp("ns", tz=column.type.tz))
+    if column.type.tz is None:
+        iso = pc.replace_substring(
+            pc.cast(column, pa.string()),
+            pattern=" ",
+            replacement="T",
+            max_replacements=1,
+        )
+    else:
+        iso = pc.replace_substring_regex(
+            pc.strftime(column, format="%Y-%m-%dT%H:%M:%S%z"),
+            pattern=r"([+-]\d{2})(\d{2})$",
+            replacement=r"\1:\2",
+        )
+    # drop the fractional seconds when zero, else the nanoseconds when zero
+    iso = pc.replace_substring_regex(
+        iso,
+        pattern=r"\.0{9}([+-]|$)",
+        replacement=r"\1",
+    )
+    iso = pc.replace_substring_regex(
+        iso,
+        pattern=r"(\.\d{6})000([+-]|$)",
+        replacement=r"\1\2",
+    )
+    # pandas represents missing timestamps as `NaT`
+    return pc.fill_null(iso, "NaT")
+
+
+def _arrow_column_to_pylist(column: pa.ChunkedArray) -> list[Any]:
+    """
+    Convert an Arrow column to Python values that serialize to the same JSON as
+    the values produced by ``df_to_records``.
+    """
+    if pa.types.is_integer(column.type):
+        values = _arrow_to_pylist(column)
+        if pa.types.is_signed_integer(column.type):
+            big = pc.or_(
+                pc.greater(column, pa.scalar(utils.JS_MAX_INTEGER, pa.int64())),
+                pc.less(column, pa.scalar(-utils.JS_MAX_INTEGER, pa.int64())),
+            )
+        else:
+            # compared as signed integers, values above 2**63 would overflow
+            big = pc.greater(column, pa.scalar(utils.JS_MAX_INTEGER, pa.uint64()))
+        if pc.any(big).as_py():
+            mask = pc.fill_null(big, False).to_numpy(zero_copy_only=False)
+            for idx in np.flatnonzero(mask):
+                values[idx] = str(values[idx])
+        return values
+
+    if pa.types.is_date(column.type):
+        return _arrow_to_pylist(pc.cast(column, pa.string()))
+
+    if pa.types.is_timestamp(column.type):
+        try:
+            return _arrow_to_pylist(_arrow_timestamps_to_iso(column))
+        except pa.lib.ArrowInvalid:
+            # out of bounds for nanoseconds, or a time zone unknown to Arrow, leave
+            # it to `json_iso_dttm_ser`
+            return column.to_pylist()
+
+    return _arrow_to_pylist(column)
+
 
 def dedup(l: list[str], suffix: str = "__", case_sensitive: bool = True) -> list[str]:  # noqa: E741
     """De-duplicates a list of string by suffixing a counter
@@ -212,6 +303,27 @@ class SupersetResultSet:
         except pa.lib.ArrowInvalid:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
+    @staticmethod
+    def convert_table_to_records(table: pa.Table) -> list[dict[str, Any]]:
+        """
+        Convert a table to a list of records without going through pandas.
+
+        The columns are converted one at a time, with the JSON rules that
+        ``df_to_records`` and ``json_iso_dttm_ser`` apply value by value (big
+        integers as strings, timestamps and dates as ISO 8601 strings) applied on
+        the whole Arrow column.
+
+        :param table: The table to convert
+        :returns: A list of dictionaries, one for each row of the table
+        """
+        names = table.column_names
+        if len(set(names)) != len(names):
+            logger.warning(
+                "DataFrame columns are not unique, some columns will be omitted."
+            )
+        columns = [_arrow_column_to_pylist(column) for column in table.columns]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
     @staticmethod
     def first_nonempty(items: NDArray[Any]) -> Any:
         return next((i for i in items if i), None)
@@ -2531,6 +2531,33 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         guest_rls = self.get_guest_rls_filters_str(datasource)
         return guest_rls + rls_clauses_with_group_key
 
+    def get_rls_roles_cache_key(self, datasource: "BaseDatasource") -> list[str]:
+        """
+        A cache key for the row level security filters of the current user which,
+        unlike `get_rls_cache_key`, does not query the filters: it is made of the
+        roles of the user, and must be combined with a generation of the cache that is
+        bumped whenever the filters change.
+
+        :param datasource: The datasource to compute the cache key for
+        :returns: The cache key
+        """
+        guest_rls = self.get_guest_rls_filters_str(datasource)
+        if not datasource.is_rls_supported or not getattr(g, "user", None):
+            return guest_rls
+        return guest_rls + [self.get_roles_cache_key()]
+
+    def get_roles_cache_key(self) -> str:
+        """
+        A cache key for the permissions of the current user, made of the ids of their
+        roles, for cached values that depend on what the user can access.
+
+        :returns: The cache key
+        """
+        if not getattr(g, "user", None):
+            return ""
+        role_ids = sorted(role.id for role in self.get_user_roles(g.user) if role)
+        return f"roles-{','.join(map(str, role_ids))}"
+
     @staticmethod
     def _get_current_epoch_time() -> float:
         """This is used so the tests can mock time"""
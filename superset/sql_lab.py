@@ -18,10 +18,10 @@
 import dataclasses
 import logging
 import uuid
-from contextlib import closing
+from contextlib import closing, nullcontext
 from datetime import datetime
 from sys import getsizeof
-from typing import Any, cast, Optional, Union
+from typing import Any, Callable, cast, Optional, Union
 
 import backoff
 import msgpack
@@ -43,6 +43,7 @@ from superset.dataframe import df_to_records
 from superset.db_engine_specs import BaseEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import (
+    DatabaseConcurrencyLimitExceededException,
     OAuth2RedirectError,
     SupersetErrorException,
     SupersetErrorsException,
@@ -60,13 +61,14 @@ from superset.sql_parse import (
     ParsedQuery,
 )
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.utils import get_partial_results_key, write_ipc_buffer
 from superset.utils import json
 from superset.utils.core import (
     override_user,
     QuerySource,
     zlib_compress,
 )
+from superset.utils.database import database_concurrency_slot
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
 
@@ -179,15 +181,30 @@ def get_sql_results(  # pylint: disable=too-many-arguments
     with current_app.test_request_context():
         with override_user(security_manager.find_user(username)):
             try:
-                return execute_sql_statements(
-                    query_id,
-                    rendered_query,
-                    return_results,
-                    store_results,
-                    start_time=start_time,
-                    expand_data=expand_data,
-                    log_params=log_params,
-                )
+                # only queries running on Celery workers are subject to the
+                # database concurrency limit
+                with (
+                    nullcontext()
+                    if get_sql_results.request.called_directly
+                    else database_concurrency_slot(
+                        get_query(query_id).database, start_time
+                    )
+                ):
+                    return execute_sql_statements(
+                        query_id,
+                        rendered_query,
+                        return_results,
+                        store_results,
+                        start_time=start_time,
+                        expand_data=expand_data,
+                        log_params=log_params,
+                    )
+            except DatabaseConcurrencyLimitExceededException as ex:
+                logger.debug("Query %d: deferring, %s", query_id, ex)
+                raise get_sql_results.retry(
+                    countdown=config["DATABASE_CONCURRENCY_RETRY_DELAY"],
+                    max_retries=None,
+                ) from ex
             except Exception as ex:  # pylint: disable=broad-except
                 logger.debug("Query %d: %s", query_id, ex)
                 stats_logger.incr("error_sqllab_unhandled")
@@ -195,14 +212,21 @@ def get_sql_results(  # pylint: disable=too-many-arguments
                 return handle_query_error(ex, query)
 
 
-def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-locals
+def execute_sql_statement(  # pylint: disable=too-many-arguments, too-many-statements, too-many-locals
     sql_statement: str,
     query: Query,
     cursor: Any,
     log_params: Optional[dict[str, Any]],
     apply_ctas: bool = False,
+    on_fetch: Optional[Callable[[list[tuple[Any, ...]], Any], None]] = None,
 ) -> SupersetResultSet:
-    """Executes a single SQL statement"""
+    """
+    Executes a single SQL statement
+
+    When ``on_fetch`` is set and ``SQLLAB_PROGRESSIVE_FETCH_BATCH_SIZE`` is enabled,
+    the results are fetched in batches and ``on_fetch`` is called with the rows
+    fetched so far and the cursor description after each batch.
+    """
     database: Database = query.database
     db_engine_spec = database.db_engine_spec
 
@@ -310,7 +334,7 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
                     query.id,
                     str(query.to_dict()),
                 )
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                data = _fetch_data(cursor, db_engine_spec, increased_limit, on_fetch)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -350,6 +374,83 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
     return SupersetResultSet(data, cursor_description, db_engine_spec)
 
 
+class PartialResultsPublisher:
+    """
+    Publish the rows fetched so far by a running query to the results backend, under
+    a key of their own that is stored in the `partial_results_key` of the query
+    extra, so that the `results_key` of the query is only set once it succeeds.
+
+    The rows are republished each time their number doubles, so that serializing
+    them costs at most about twice as much as serializing the final results.
+    """
+
+    def __init__(self, query: Query, expand_data: bool) -> None:
+        self.query = query
+        self.results_key = get_partial_results_key(query.id)
+        self.expand_data = expand_data
+        self.published_rows = 0
+
+    def __call__(self, rows: list[tuple[Any, ...]], cursor_description: Any) -> None:
+        if len(rows) < 2 * self.published_rows:
+            return
+
+        query = self.query
+        if query.limit is not None:
+            rows = rows[: query.limit]
+        try:
+            db_engine_spec = query.database.db_engine_spec
+            result_set = SupersetResultSet(rows, cursor_description, db_engine_spec)
+            data, selected_columns, all_columns, expanded_columns = (
+                _serialize_and_expand_data(
+                    result_set,
+                    db_engine_spec,
+                    cast(bool, results_backend_use_msgpack),
+                    self.expand_data,
+                )
+            )
+            query.rows = len(rows)
+            if query.limit:
+                query.progress = min(99, int(100 * len(rows) / query.limit))
+            query.set_extra_json_key(
+                "progress", __("Fetched %(rows)s rows", rows=len(rows))
+            )
+            query.set_extra_json_key("partial_results_key", self.results_key)
+            payload = {
+                "query_id": query.id,
+                "status": QueryStatus.RUNNING,
+                "data": data,
+                "columns": all_columns,
+                "selected_columns": selected_columns,
+                "expanded_columns": expanded_columns,
+                "query": query.to_dict(),
+            }
+            payload["query"]["state"] = QueryStatus.RUNNING
+            _write_results_payload(payload, query.database, self.results_key)
+            db.session.commit()
+            stats_logger.incr("sqllab.query.partial_results_published")
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Query %d: Failed to publish partial results", query.id, exc_info=True
+            )
+        self.published_rows = len(rows)
+
+    def discard(self) -> None:
+        """
+        Remove the partial results, once the query has finished.
+        """
+        if not self.published_rows:
+            return
+        self.query.set_extra_json_key("partial_results_key", None)
+        try:
+            results_backend.delete(self.results_key)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Query %d: Failed to delete partial results",
+                self.query.id,
+                exc_info=True,
+            )
+
+
 def apply_limit_if_exists(
     database: Database, increased_limit: Optional[int], query: Query, sql: str
 ) -> str:
@@ -363,6 +464,33 @@ def apply_limit_if_exists(
     return sql
 
 
+def _fetch_data(
+    cursor: Any,
+    db_engine_spec: BaseEngineSpec,
+    limit: Optional[int],
+    on_fetch: Optional[Callable[[list[tuple[Any, ...]], Any], None]] = None,
+) -> list[tuple[Any, ...]]:
+    """
+    Fetch the results of a cursor. When ``on_fetch`` is set, the engine supports it
+    and ``SQLLAB_PROGRESSIVE_FETCH_BATCH_SIZE`` is enabled, the rows are fetched in
+    batches and ``on_fetch`` is called with the rows fetched so far after each one.
+    """
+    batch_size = config["SQLLAB_PROGRESSIVE_FETCH_BATCH_SIZE"]
+    if not (
+        on_fetch
+        and batch_size
+        and cursor.description
+        and db_engine_spec.allows_progressive_fetch
+    ):
+        return db_engine_spec.fetch_data(cursor, limit)
+
+    data: list[tuple[Any, ...]] = []
+    for batch in db_engine_spec.fetch_data_chunks(cursor, batch_size, limit):
+        data.extend(batch)
+        on_fetch(data, cursor.description)
+    return data
+
+
 def _serialize_payload(
     payload: dict[Any, Any], use_msgpack: Optional[bool] = False
 ) -> Union[bytes, str]:
@@ -406,6 +534,28 @@ def _serialize_and_expand_data(
     return (data, selected_columns, all_columns, expanded_columns)
 
 
+def _write_results_payload(
+    payload: dict[str, Any],
+    database: Database,
+    key: str,
+) -> None:
+    with stats_timing("sqllab.query.results_backend_write", stats_logger):
+        with stats_timing(
+            "sqllab.query.results_backend_write_serialization", stats_logger
+        ):
+            serialized_payload = _serialize_payload(
+                payload, cast(bool, results_backend_use_msgpack)
+            )
+        cache_timeout = database.cache_timeout
+        if cache_timeout is None:
+            cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
+
+        compressed = zlib_compress(serialized_payload)
+        logger.debug("*** serialized payload size: %i", getsizeof(serialized_payload))
+        logger.debug("*** compressed payload size: %i", getsizeof(compressed))
+        results_backend.set(key, compressed, cache_timeout)
+
+
 def execute_sql_statements(
     # pylint: disable=too-many-arguments, too-many-locals, too-many-statements, too-many-branches
     query_id: int,
@@ -490,6 +640,12 @@ def execute_sql_statements(
             )
         )
 
+    publisher = (
+        PartialResultsPublisher(query, expand_data)
+        if store_results and results_backend
+        else None
+    )
+
     with database.get_raw_connection(
         catalog=query.catalog,
         schema=query.schema,
@@ -530,11 +686,18 @@ def execute_sql_statements(
                     cursor,
                     log_params,
                     apply_ctas,
+                    # only the results of the last statement are returned
+                    on_fetch=publisher if i == statement_count - 1 else None,
                 )
             except SqlLabQueryStoppedException:
+                if publisher:
+                    publisher.discard()
+                    db.session.commit()
                 payload.update({"status": QueryStatus.STOPPED})
                 return payload
             except Exception as ex:  # pylint: disable=broad-except
+                if publisher:
+                    publisher.discard()
                 msg = str(ex)
                 prefix_message = (
                     __(
@@ -557,6 +720,8 @@ def execute_sql_statements(
             conn.commit()
 
     # Success, updating the query entry in database
+    if publisher:
+        publisher.discard()
     query.rows = result_set.size
     query.progress = 100
     query.set_extra_json_key("progress", None)
@@ -589,29 +754,15 @@ def execute_sql_statements(
     payload["query"]["state"] = QueryStatus.SUCCESS
 
     if store_results and results_backend:
-        key = str(uuid.uuid4())
-        payload["query"]["resultsKey"] = key
+        results_key = str(uuid.uuid4())
+        payload["query"]["resultsKey"] = results_key
         logger.info(
-            "Query %s: Storing results in results backend, key: %s", str(query_id), key
+            "Query %s: Storing results in results backend, key: %s",
+            str(query_id),
+            results_key,
         )
-        with stats_timing("sqllab.query.results_backend_write", stats_logger):
-            with stats_timing(
-                "sqllab.query.results_backend_write_serialization", stats_logger
-            ):
-                serialized_payload = _serialize_payload(
-                    payload, cast(bool, results_backend_use_msgpack)
-                )
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
-
-            compressed = zlib_compress(serialized_payload)
-            logger.debug(
-                "*** serialized payload size: %i", getsizeof(serialized_payload)
-            )
-            logger.debug("*** compressed payload size: %i", getsizeof(compressed))
-            results_backend.set(key, compressed, cache_timeout)
-        query.results_key = key
+        _write_results_payload(payload, database, results_key)
+        query.results_key = results_key
 
     query.status = QueryStatus.SUCCESS
     db.session.commit()
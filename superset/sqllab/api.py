@@ -15,10 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from typing import Any, cast, Optional
 from urllib import parse
 
-from flask import request, Response
+from flask import request, Response, stream_with_context
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -273,27 +274,40 @@ class SqlLabRestApi(BaseSupersetApi):
         """
         result = SqlResultExportCommand(client_id=client_id).run()
 
-        query, data, row_count = result["query"], result["data"], result["count"]
-
-        quoted_csv_name = parse.quote(query.name)
-        response = CsvResponse(
-            data, headers=generate_download_headers("csv", quoted_csv_name)
-        )
+        query, data = result["query"], result["data"]
         event_info = {
             "event_type": "data_export",
             "client_id": client_id,
-            "row_count": row_count,
             "database": query.database.name,
             "catalog": query.catalog,
             "schema": query.schema,
             "sql": query.sql,
             "exported_format": "csv",
         }
-        event_rep = repr(event_info)
-        logger.debug(
-            "CSV exported: %s", event_rep, extra={"superset_event": event_info}
+
+        def log_export() -> None:
+            event_info["row_count"] = result["count"]
+            event_rep = repr(event_info)
+            logger.debug(
+                "CSV exported: %s", event_rep, extra={"superset_event": event_info}
+            )
+
+        if isinstance(data, str):
+            log_export()
+        else:
+            # the query is re-run while streaming, log once all rows are sent
+            chunks = data
+
+            def stream() -> Iterator[str]:
+                yield from chunks
+                log_export()
+
+            data = stream_with_context(stream())
+
+        quoted_csv_name = parse.quote(query.name)
+        return CsvResponse(
+            data, headers=generate_download_headers("csv", quoted_csv_name)
         )
-        return response
 
     @expose("/results/")
     @protect()
@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+import uuid
 from typing import Any
 
 import pyarrow as pa
@@ -80,6 +81,23 @@ def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
     return sink.getvalue()
 
 
+def get_partial_results_key(query_id: int) -> str:
+    """
+    Return a new results backend key for the partial results of a running query.
+    """
+    return f"partial:{query_id}:{uuid.uuid4()}"
+
+
+def get_partial_results_query_id(key: str) -> int | None:
+    """
+    Return the ID of the query a partial results key was generated for, if any.
+    """
+    prefix, query_id, _ = (key.split(":", 2) + ["", ""])[:3]
+    if prefix != "partial" or not query_id.isdigit():
+        return None
+    return int(query_id)
+
+
 def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
     tabs_state: list[Any] = []
     active_tab: Any = None
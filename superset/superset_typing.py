@@ -90,6 +90,18 @@ class ResultSetColumnType(TypedDict):
     query_as: NotRequired[Any]
 
 
+class TableReflection(TypedDict):
+    """
+    Metadata of a physical table, as reflected by the SQLAlchemy inspector
+    """
+
+    columns: list[ResultSetColumnType]
+    pk_constraint: dict[str, Any]
+    foreign_keys: list[dict[str, Any]]
+    indexes: list[dict[str, Any]]
+    comment: Optional[str]
+
+
 CacheConfig = dict[str, Any]
 DbapiDescriptionRow = tuple[
     Union[str, bytes],
@@ -20,13 +20,17 @@ import copy
 import logging
 from typing import Any, cast, TYPE_CHECKING
 
+from celery import Task
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app, g
 from flask_appbuilder.security.sqla.models import User
 from marshmallow import ValidationError
 
 from superset.charts.schemas import ChartDataQueryContextSchema
-from superset.exceptions import SupersetVizException
+from superset.exceptions import (
+    DatabaseConcurrencyLimitExceededException,
+    SupersetVizException,
+)
 from superset.extensions import (
     async_query_manager,
     cache_manager,
@@ -35,6 +39,8 @@ from superset.extensions import (
 )
 from superset.utils.cache import generate_cache_key, set_and_log_cache
 from superset.utils.core import override_user
+from superset.utils.database import database_concurrency_slot
+from superset.utils.dates import now_as_float
 from superset.views.utils import get_datasource_info, get_viz
 
 if TYPE_CHECKING:
@@ -79,20 +85,30 @@ def _load_user_from_job_metadata(job_metadata: dict[str, Any]) -> User:
     return user
 
 
-@celery_app.task(name="load_chart_data_into_cache", soft_time_limit=query_timeout)
+@celery_app.task(
+    name="load_chart_data_into_cache", bind=True, soft_time_limit=query_timeout
+)
 def load_chart_data_into_cache(
+    self: Task,
     job_metadata: dict[str, Any],
     form_data: dict[str, Any],
+    queued_at: float | None = None,
 ) -> None:
     # pylint: disable=import-outside-toplevel
     from superset.commands.chart.data.get_data_command import ChartDataCommand
 
+    # the job metadata is altered when loading the user, keep the original for retries
+    retry_args = (copy.deepcopy(job_metadata), form_data)
+    queued_at = queued_at or now_as_float()
     with override_user(_load_user_from_job_metadata(job_metadata), force=False):
         try:
             set_form_data(form_data)
             query_context = _create_query_context_from_form(form_data)
             command = ChartDataCommand(query_context)
-            result = command.run(cache=True)
+            with database_concurrency_slot(
+                getattr(query_context.datasource, "database", None), queued_at
+            ):
+                result = command.run(cache=True)
             cache_key = result["cache_key"]
             result_url = f"/api/v1/chart/data/{cache_key}"
             async_query_manager.update_job(
@@ -100,6 +116,14 @@ def load_chart_data_into_cache(
                 async_query_manager.STATUS_DONE,
                 result_url=result_url,
             )
+        except DatabaseConcurrencyLimitExceededException as ex:
+            logger.debug("Deferring chart data job: %s", ex)
+            raise self.retry(
+                args=retry_args,
+                kwargs={"queued_at": queued_at},
+                countdown=current_app.config["DATABASE_CONCURRENCY_RETRY_DELAY"],
+                max_retries=None,
+            ) from ex
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while loading chart data, error: %s", ex)
             raise
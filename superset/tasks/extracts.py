@@ -0,0 +1,61 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import os
+
+from flask import current_app
+
+from superset import db
+from superset.commands.dataset.extract import RefreshDatasetExtractCommand
+from superset.commands.exceptions import CommandException
+from superset.connectors.sqla.models import SqlaTable
+from superset.extensions import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="refresh_dataset_extracts")
+def refresh_dataset_extracts() -> None:
+    """
+    Refresh the extracts that are older than the refresh interval of their dataset,
+    and remove the extracts of the datasets that are no longer extracted.
+    """
+    if not current_app.config["DATASET_EXTRACTS_ENABLED"]:
+        return
+
+    extracted = set()
+    for dataset in (
+        db.session.query(SqlaTable).filter(SqlaTable.extra.contains('"extract"')).all()
+    ):
+        if (settings := dataset.extract_settings) is None:
+            continue
+        extracted.add(os.path.basename(dataset.extract_path))
+        age = dataset.get_extract_age()
+        if age is not None and age < settings["refresh_interval"]:
+            continue
+        try:
+            RefreshDatasetExtractCommand(dataset.id).run()
+        except CommandException:
+            logger.exception("Failed to refresh the extract of dataset %s", dataset.id)
+
+    path = current_app.config["DATASET_EXTRACT_PATH"]
+    if not os.path.isdir(path):
+        return
+    for filename in os.listdir(path):
+        if filename.endswith(".parquet") and filename not in extracted:
+            logger.info("Removing the stale dataset extract %s", filename)
+            os.remove(os.path.join(path, filename))
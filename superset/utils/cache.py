@@ -30,6 +30,8 @@ from werkzeug.wrappers import Response
 from superset import db
 from superset.extensions import cache_manager
 from superset.models.cache import CacheKey
+from superset.utils.cache_index import DatasourceCacheKeyIndex
+from superset.utils.cache_manager import TieredCache
 from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.json import json_int_dttm_ser
 
@@ -64,7 +66,12 @@ def set_and_log_cache(
     try:
         dttm = datetime.utcnow().isoformat().split(".")[0]
         value = {**cache_value, "dttm": dttm}
-        cache_instance.set(cache_key, value, timeout=timeout)
+        if isinstance(cache_instance, TieredCache) and datasource_uid:
+            cache_instance.set_tagged(
+                cache_key, value, timeout=timeout, tags=[datasource_uid]
+            )
+        else:
+            cache_instance.set(cache_key, value, timeout=timeout)
         stats_logger.incr("set_cache_key")
 
         if datasource_uid and config["STORE_CACHE_KEYS_IN_METADATA_DB"]:
@@ -74,6 +81,11 @@ def set_and_log_cache(
                 datasource_uid=datasource_uid,
             )
             db.session.add(ck)
+
+        if datasource_uid and app.config["STORE_CACHE_KEYS_IN_CACHE_BACKEND"]:
+            DatasourceCacheKeyIndex(cache_instance).add(
+                datasource_uid, cache_key, timeout
+            )
     except Exception as ex:  # pylint: disable=broad-except
         # cache.set call can fail if the backend is down or if
         # the key is too large or whatever other reasons
@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Generation counters kept in the data cache backend.
+
+A generation is folded into the cache keys of the values computed from a
+datasource, so that bumping it invalidates all of them at once. The counters are
+created from the current time in milliseconds rather than zero, so that a counter
+evicted from the cache never comes back to a generation that was already used.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+import sqlalchemy as sa
+from flask import current_app
+from sqlalchemy.orm import Session
+
+from superset.extensions import cache_manager
+
+logger = logging.getLogger(__name__)
+
+# The generation of the row level security filters, shared by all datasources
+RLS_GENERATION = "rls"
+
+_SESSION_INFO_KEY = "pending_cache_generations"
+
+
+def _generation_key(name: str) -> str:
+    return f"cache_generation:{name}"
+
+
+def _initial_generation() -> int:
+    return int(time.time() * 1000)
+
+
+def get_generation(name: str) -> int:
+    """
+    Return the current generation of a datasource UID or of ``RLS_GENERATION``.
+    """
+    cache = cache_manager.data_cache.cache
+    key = _generation_key(name)
+    if (generation := cache.get(key)) is None:
+        cache.add(key, _initial_generation(), timeout=0)
+        generation = cache.get(key)
+    return int(generation or 0)
+
+
+def bump_generation(name: str) -> None:
+    """
+    Increment a generation, invalidating the values cached under the previous one.
+    """
+    cache = cache_manager.data_cache.cache
+    key = _generation_key(name)
+    try:
+        cache.add(key, _initial_generation(), timeout=0)
+        cache.inc(key)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Could not bump cache generation %s", name, exc_info=True)
+
+
+def bump_generation_on_commit(
+    session: Session | None,  # pylint: disable=disallowed-name
+    name: str,
+) -> None:
+    """
+    Bump a generation once the current transaction of the session is committed, so
+    that a value computed from the uncommitted state is never cached under the new
+    generation. Does nothing unless ``DATASOURCE_CACHE_GENERATIONS`` is enabled.
+    """
+    if not current_app.config["DATASOURCE_CACHE_GENERATIONS"]:
+        return
+    if session is None:
+        bump_generation(name)
+        return
+    session.info.setdefault(_SESSION_INFO_KEY, set()).add(name)
+
+
+# Pending bumps are kept when a transaction is rolled back: they are then applied by
+# the next commit, which costs a few cache misses but never serves a stale value.
+def _after_commit(session: Session) -> None:  # pylint: disable=disallowed-name
+    for name in session.info.pop(_SESSION_INFO_KEY, ()):
+        bump_generation(name)
+
+
+sa.event.listen(Session, "after_commit", _after_commit)
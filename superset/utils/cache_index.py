@@ -0,0 +1,150 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from flask_caching import Cache
+
+logger = logging.getLogger(__name__)
+
+
+class DatasourceCacheKeyIndex:
+    """
+    An index of the keys cached for each datasource, kept in the cache backend itself.
+
+    With Redis the index of a datasource is a sorted set of cache keys, scored by
+    their expiry time, so that expired keys are trimmed when new ones are added, and
+    the set itself expires with its last member. Other backends store the index as a
+    regular cache value, which is updated without locking and is therefore only
+    suitable for caches that are not shared by several processes.
+    """
+
+    prefix = "cache_key_index:"
+
+    def __init__(self, cache: Cache) -> None:
+        self.cache = cache
+
+    @property
+    def _client(self) -> Any:
+        return getattr(self.cache.cache, "_write_client", None)
+
+    def _index_key(self, datasource_uid: str) -> str:
+        return f"{self.prefix}{datasource_uid}"
+
+    def add(self, datasource_uid: str, cache_key: str, timeout: int) -> None:
+        """
+        Add a cache key to the index of a datasource.
+
+        :param datasource_uid: The UID of the datasource the value was computed from
+        :param cache_key: The cache key of the value
+        :param timeout: The timeout of the value in seconds, 0 if it never expires
+        """
+        if (client := self._client) is not None:
+            self._add_redis(client, datasource_uid, cache_key, timeout)
+            return
+
+        now = time.time()
+        expires_at = now + timeout if timeout > 0 else float("inf")
+        index_key = self._index_key(datasource_uid)
+        index = {
+            key: expiry
+            for key, expiry in (self.cache.cache.get(index_key) or {}).items()
+            if expiry > now
+        }
+        index[cache_key] = expires_at
+        last_expiry = max(index.values())
+        self.cache.cache.set(
+            index_key,
+            index,
+            timeout=0 if last_expiry == float("inf") else int(last_expiry - now) + 1,
+        )
+
+    def _add_redis(
+        self,
+        client: Any,
+        datasource_uid: str,
+        cache_key: str,
+        timeout: int,
+    ) -> None:
+        now = time.time()
+        expires_at = now + timeout if timeout > 0 else float("inf")
+        index_key = self.cache.cache.key_prefix + self._index_key(datasource_uid)
+        pipeline = client.pipeline(transaction=False)
+        pipeline.zadd(index_key, {cache_key: expires_at})
+        pipeline.zremrangebyscore(index_key, "-inf", now)
+        pipeline.zrange(index_key, -1, -1, withscores=True)
+        pipeline.ttl(index_key)
+        *_, last, ttl = pipeline.execute()
+
+        # the TTL is -1 both for a set that was just created and for one that was
+        # persisted, so whether the index may expire is told by its last member
+        last_expiry = last[0][1] if last else expires_at
+        if last_expiry == float("inf"):
+            if ttl != -1:
+                client.persist(index_key)
+        elif ttl == -1 or ttl < last_expiry - now:
+            # Keep the index for twice the remaining life of its last key, so that
+            # its expiry is extended at most once per timeout period
+            client.expire(index_key, int(2 * (last_expiry - now)) + 1)
+
+    def get(self, datasource_uid: str) -> list[str]:
+        """
+        Return the indexed cache keys of a datasource that have not expired.
+        """
+        now = time.time()
+        if (client := self._client) is not None:
+            index_key = self.cache.cache.key_prefix + self._index_key(datasource_uid)
+            return [
+                key.decode() if isinstance(key, bytes) else key
+                for key in client.zrangebyscore(index_key, now, "+inf")
+            ]
+
+        index = self.cache.cache.get(self._index_key(datasource_uid)) or {}
+        return [key for key, expiry in index.items() if expiry > now]
+
+    def invalidate(self, datasource_uids: Iterable[str]) -> int:
+        """
+        Delete the cached values of the datasources and their index.
+
+        :returns: The number of cache keys that were deleted
+        """
+        cache_keys: list[str] = []
+        client = self._client
+        for datasource_uid in datasource_uids:
+            if client is None:
+                cache_keys.extend(self.get(datasource_uid))
+                self.cache.cache.delete(self._index_key(datasource_uid))
+                continue
+
+            # read and drop the index atomically, so that no key added meanwhile
+            # is left out of both the index and the invalidation
+            index_key = self.cache.cache.key_prefix + self._index_key(datasource_uid)
+            pipeline = client.pipeline(transaction=True)
+            pipeline.zrangebyscore(index_key, time.time(), "+inf")
+            pipeline.delete(index_key)
+            keys, _ = pipeline.execute()
+            cache_keys.extend(
+                key.decode() if isinstance(key, bytes) else key for key in keys
+            )
+
+        if cache_keys:
+            self.cache.delete_many(*cache_keys)
+        return len(cache_keys)
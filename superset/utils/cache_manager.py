@@ -15,9 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from typing import Any, Optional, Union
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any, NamedTuple, Optional, Union
 
-from flask import Flask
+from flask import current_app, Flask
 from flask_caching import Cache
 from markupsafe import Markup
 
@@ -49,13 +54,252 @@ class ExploreFormDataCache(Cache):
         return cache
 
 
+class _LocalCacheEntry(NamedTuple):
+    payload: bytes
+    expires_at: float
+    tags: frozenset[str]
+
+
+class LocalLRUCache:
+    """
+    A thread safe in-process LRU cache, bounded by the total size in bytes of the
+    pickled values it holds rather than by a number of entries.
+    """
+
+    def __init__(self, max_bytes: int, max_timeout: int) -> None:
+        self.max_bytes = max_bytes
+        self.max_timeout = max_timeout
+        self.size = 0
+        self._entries: OrderedDict[str, _LocalCacheEntry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.payload
+
+    def set(
+        self,
+        key: str,
+        payload: bytes,
+        timeout: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> bool:
+        """
+        Store a payload for at most ``max_timeout`` seconds, or ``timeout`` if
+        lower. Payloads larger than the whole cache are not stored.
+        """
+        if timeout is None or timeout <= 0 or timeout > self.max_timeout:
+            timeout = self.max_timeout
+        with self._lock:
+            self._pop(key)
+            if len(payload) > self.max_bytes:
+                return False
+            while self._entries and self.size + len(payload) > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+            entry = _LocalCacheEntry(
+                payload, time.monotonic() + timeout, frozenset(tags)
+            )
+            self._entries[key] = entry
+            self.size += len(payload)
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def delete_tagged(self, tag: str) -> int:
+        with self._lock:
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._pop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self.size = 0
+
+    def _pop(self, key: str) -> None:
+        if (entry := self._entries.pop(key, None)) is None:
+            return
+        self.size -= len(entry.payload)
+        for tag in entry.tags:
+            if keys := self._tags.get(tag):
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+def _get_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """
+    The key of a call to ``Cache.get``, ``Cache.set`` or ``Cache.delete``.
+    """
+    return args[0] if args else kwargs["key"]
+
+
+class TieredCache(Cache):
+    """
+    A cache which, when configured, keeps recently used values in an in-process LRU
+    cache (L1) in front of the shared cache backend (L2).
+
+    An L1 hit saves the round trip to L2 and the transfer of the value, but the
+    value is still unpickled on every hit: values are kept pickled in L1, so that
+    callers never share a mutable object. As other processes can delete or
+    overwrite the entries of L2, an L1 entry lives at most as long as the L2 entry
+    it was read from, and at most ``MAX_TIMEOUT`` seconds. With ``VALIDATE_ON_HIT``
+    the existence of the L2 entry is also checked on every L1 hit, which costs a
+    round trip but no transfer.
+
+    Only the values set with ``set_tagged`` are written to L1 directly; other
+    values are cached locally the first time they're read from L2.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.name = "cache"
+        self.local_cache: Optional[LocalLRUCache] = None
+        self.validate_on_hit = False
+
+    def init_local_cache(self, name: str, config: Optional[dict[str, Any]]) -> None:
+        self.name = name
+        self.local_cache = None
+        if config and config.get("MAX_BYTES"):
+            self.local_cache = LocalLRUCache(
+                max_bytes=config["MAX_BYTES"],
+                max_timeout=config.get("MAX_TIMEOUT", 60),
+            )
+            self.validate_on_hit = config.get("VALIDATE_ON_HIT", False)
+
+    def _incr(self, metric: str) -> None:
+        current_app.config["STATS_LOGGER"].incr(f"{self.name}.{metric}")
+
+    def _remaining_timeout(self, key: str) -> Optional[float]:
+        """
+        The remaining life of an L2 entry, when the backend can tell it.
+        """
+        client = getattr(self.cache, "_read_client", None)
+        if client is None:
+            return None
+        try:
+            ttl = client.pttl(getattr(self.cache, "key_prefix", "") + key)
+        except Exception:  # pylint: disable=broad-except
+            return None
+        return ttl / 1000 if ttl and ttl > 0 else None
+
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        if self.local_cache is None:
+            return super().get(*args, **kwargs)
+
+        key = _get_key(args, kwargs)
+        payload = self.local_cache.get(key)
+        if payload is not None:
+            if not self.validate_on_hit or super().has(key):
+                self._incr("l1.hit")
+                return pickle.loads(payload)  # noqa: S301
+            self.local_cache.delete(key)
+        self._incr("l1.miss")
+
+        value = super().get(*args, **kwargs)
+        if value is None:
+            self._incr("l2.miss")
+            return None
+
+        self._incr("l2.hit")
+        self._set_local(key, value, self._remaining_timeout(key))
+        return value
+
+    def set(self, *args: Any, **kwargs: Any) -> Optional[bool]:
+        if self.local_cache is not None:
+            self.local_cache.delete(_get_key(args, kwargs))
+        return super().set(*args, **kwargs)
+
+    def set_tagged(
+        self,
+        key: str,
+        value: Any,
+        timeout: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> Optional[bool]:
+        """
+        Set a value in both tiers. The tags, such as the UID of the datasource the
+        value was computed from, allow ``delete_tagged`` to evict the L1 entry.
+        """
+        result = self.set(key, value, timeout=timeout)
+        if result and self.local_cache is not None:
+            if timeout is None:
+                timeout = self.cache.default_timeout
+            self._set_local(key, value, timeout, tags)
+        return result
+
+    def _set_local(
+        self,
+        key: str,
+        value: Any,
+        timeout: Optional[float],
+        tags: Iterable[str] = (),
+    ) -> None:
+        assert self.local_cache is not None
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not pickle value of key %s", key, exc_info=True)
+            return
+        self.local_cache.set(key, payload, timeout, tags)
+        current_app.config["STATS_LOGGER"].gauge(
+            f"{self.name}.l1.bytes", self.local_cache.size
+        )
+
+    def set_many(self, *args: Any, **kwargs: Any) -> list[Any]:
+        if self.local_cache is not None:
+            mapping = args[0] if args else kwargs.get("mapping", {})
+            for key in mapping:
+                self.local_cache.delete(key)
+        return super().set_many(*args, **kwargs)
+
+    def delete(self, *args: Any, **kwargs: Any) -> bool:
+        if self.local_cache is not None:
+            self.local_cache.delete(_get_key(args, kwargs))
+        return super().delete(*args, **kwargs)
+
+    def delete_many(self, *args: Any, **kwargs: Any) -> list[str]:
+        if self.local_cache is not None:
+            for key in args:
+                self.local_cache.delete(key)
+        return super().delete_many(*args, **kwargs)
+
+    def delete_tagged(self, tag: str) -> int:
+        """
+        Evict the L1 entries with a given tag, in this process only.
+        """
+        if self.local_cache is None:
+            return 0
+        return self.local_cache.delete_tagged(tag)
+
+    def clear(self) -> bool:
+        if self.local_cache is not None:
+            self.local_cache.clear()
+        return super().clear()
+
+
 class CacheManager:
     def __init__(self) -> None:
         super().__init__()
 
         self._cache = Cache()
-        self._data_cache = Cache()
+        self._data_cache = TieredCache()
         self._thumbnail_cache = Cache()
+        # the filter state is mutable, so it's always read from the shared backend
         self._filter_state_cache = Cache()
         self._explore_form_data_cache = ExploreFormDataCache()
 
@@ -86,6 +330,12 @@ class CacheManager:
 
         cache.init_app(app, cache_config)
 
+        if isinstance(cache, TieredCache):
+            cache.init_local_cache(
+                cache_config_key.removesuffix("_CONFIG").lower(),
+                app.config["LOCAL_CACHE_CONFIG"].get(cache_config_key),
+            )
+
     def init_app(self, app: Flask) -> None:
         self._init_cache(app, self._cache, "CACHE_CONFIG")
         self._init_cache(app, self._data_cache, "DATA_CACHE_CONFIG")
@@ -100,6 +350,12 @@ class CacheManager:
             required=True,
         )
 
+    def invalidate_datasource(self, datasource_uid: str) -> None:
+        """
+        Evict the values computed from a datasource from the in-process cache.
+        """
+        self._data_cache.delete_tagged(datasource_uid)
+
     @property
     def data_cache(self) -> Cache:
         return self._data_cache
@@ -17,11 +17,20 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager, ExitStack
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from flask import current_app
 
 from superset.constants import EXAMPLES_DB_UUID
+from superset.distributed_lock import KeyValueDistributedSemaphore
+from superset.exceptions import (
+    CreateKeyValueDistributedLockFailedException,
+    DatabaseConcurrencyLimitExceededException,
+)
+from superset.utils.dates import now_as_float
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import Database
@@ -80,3 +89,59 @@ def remove_database(database: Database) -> None:
 
     db.session.delete(database)
     db.session.flush()
+
+
+def get_database_concurrency_limit(database: Database) -> int | None:
+    """
+    Return the maximum number of queries that can run concurrently on a database
+    from Celery workers, or None if there's no limit.
+    """
+    return current_app.config["DATABASE_CONCURRENCY_LIMITS"].get(
+        database.database_name,
+        current_app.config["DATABASE_CONCURRENCY_LIMIT_DEFAULT"],
+    )
+
+
+@contextmanager
+def database_concurrency_slot(
+    database: Database | None,
+    queued_at: float | None = None,
+) -> Iterator[None]:
+    """
+    Hold one of the query slots of a database for the duration of the context.
+
+    :param database: The database the query runs on; no slot is needed if None or
+        if the database has no concurrency limit
+    :param queued_at: When the query was queued, in milliseconds since the epoch,
+        used to report the time spent waiting for a slot
+    :raises DatabaseConcurrencyLimitExceededException: If all slots are taken
+    """
+    limit = get_database_concurrency_limit(database) if database else None
+    if not database or not limit:
+        yield
+        return
+
+    stats_logger = current_app.config["STATS_LOGGER"]
+    with ExitStack() as stack:
+        try:
+            stack.enter_context(
+                KeyValueDistributedSemaphore(
+                    "database_concurrency",
+                    limit,
+                    lock_expiration=timedelta(
+                        seconds=current_app.config["DATABASE_CONCURRENCY_SLOT_TIMEOUT"]
+                    ),
+                    database_id=database.id,
+                )
+            )
+        except CreateKeyValueDistributedLockFailedException as ex:
+            stats_logger.incr(f"database.{database.id}.throttled")
+            raise DatabaseConcurrencyLimitExceededException(
+                f"All {limit} query slots of database {database.id} are taken"
+            ) from ex
+
+        if queued_at is not None:
+            stats_logger.timing(
+                f"database.{database.id}.wait_time", now_as_float() - queued_at
+            )
+        yield
@@ -16,26 +16,32 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
-from flask import g, request
+from flask import current_app, Flask, g, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
 from superset.extensions import stats_logger_manager
 from superset.utils import json
 from superset.utils.core import get_user_id, LoggerLevel, to_int
+from superset.utils.decorators import stats_timing
 
 if TYPE_CHECKING:
-    pass
+    from superset.models.core import Log
 
 logger = logging.getLogger(__name__)
 
@@ -368,7 +374,7 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
-    def log(  # pylint: disable=too-many-arguments,too-many-locals
+    def log(  # pylint: disable=too-many-arguments
         self,
         user_id: int | None,
         action: str,
@@ -379,11 +385,32 @@ class DBEventLogger(AbstractEventLogger):
         *args: Any,
         **kwargs: Any,
     ) -> None:
+        logs = self.build_logs(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        self.save_logs(logs)
+
+    @staticmethod
+    def build_logs(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[dict[str, Any]],
+    ) -> list[Log]:
         # pylint: disable=import-outside-toplevel
-        from superset import db
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
+        # logs are timestamped when they're built, not when they're inserted
+        dttm = datetime.utcnow()
         logs = []
         for record in records:
             json_string: str | None
@@ -399,8 +426,16 @@ class DBEventLogger(AbstractEventLogger):
                 duration_ms=duration_ms,
                 referrer=referrer,
                 user_id=user_id,
+                dttm=dttm,
             )
             logs.append(log)
+        return logs
+
+    @staticmethod
+    def save_logs(logs: list[Log]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -409,6 +444,138 @@ class DBEventLogger(AbstractEventLogger):
             logging.exception(ex)
 
 
+class AsyncDBEventLogger(DBEventLogger):
+    """
+    Event logger that commits logs to Superset DB from a background thread.
+
+    Logs are put in a bounded in-process queue and inserted in batches, so requests
+    don't wait on a metadata DB transaction. The queue is flushed when it holds
+    ``batch_size`` logs, every ``flush_interval`` seconds and when the process
+    exits. When the queue is full new logs are dropped, and counted in ``dropped``
+    and in the ``event_logger.dropped`` stats counter.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[Log] = queue.Queue(maxsize=max_queue_size)
+        self._app: Flask | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._stop = threading.Event()
+        atexit.register(self.shutdown)
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        logs = self.build_logs(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        self._ensure_worker()
+        for log in logs:
+            try:
+                self._queue.put_nowait(log)
+            except queue.Full:
+                with self._lock:
+                    self.dropped += 1
+                stats_logger_manager.instance.incr("event_logger.dropped")
+
+    def _ensure_worker(self) -> None:
+        """Start the flushing thread, once per process"""
+        if self._pid == os.getpid() and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread and self._thread.is_alive():
+                return
+            if self._pid != os.getpid():
+                # threads and queued logs are not inherited by forked workers
+                self._queue = queue.Queue(maxsize=self.max_queue_size)
+                self._stop.clear()
+            self._pid = os.getpid()
+            self._app = current_app._get_current_object()  # pylint: disable=protected-access
+            self._thread = threading.Thread(
+                target=self._run,
+                name="AsyncDBEventLogger",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        with self._app.app_context():  # type: ignore
+            while not self._stop.is_set():
+                self.flush(timeout=self.flush_interval)
+
+    def _next_batch(self, timeout: float | None) -> list[Log]:
+        batch: list[Log] = []
+        deadline = time.monotonic() + timeout if timeout else None
+        while len(batch) < self.batch_size:
+            try:
+                if deadline is None:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self, timeout: float | None = None) -> int:
+        """
+        Insert the queued logs in batches of ``batch_size``.
+
+        :param timeout: Wait up to this many seconds to fill the first batch
+        :returns: The number of logs inserted
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+
+        count = 0
+        while batch := self._next_batch(timeout if not count else None):
+            with stats_timing("event_logger.flush", stats_logger_manager.instance):
+                self.save_logs(batch)
+            db.session.remove()
+            count += len(batch)
+            if len(batch) < self.batch_size:
+                break
+        return count
+
+    def shutdown(self) -> None:
+        """Stop the flushing thread and insert the remaining logs"""
+        self._stop.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.flush_interval * 2)
+        if self._app and self._pid == os.getpid() and not self._queue.empty():
+            try:
+                with self._app.app_context():
+                    self.flush()
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("AsyncDBEventLogger failed to flush logs on exit")
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
@@ -59,6 +59,7 @@ def compare(  # pylint: disable=too-many-arguments
     if len(source_columns) == 0:
         return df
 
+    diff_dfs = []
     for s_col, c_col in zip(source_columns, compare_columns):
         s_df = df.loc[:, [s_col]]
         s_df.rename(columns={s_col: "__intermediate"}, inplace=True)
@@ -78,7 +79,8 @@ def compare(  # pylint: disable=too-many-arguments
             },
             inplace=True,
         )
-        df = pd.concat([df, diff_df], axis=1)
+        diff_dfs.append(diff_df)
+    df = pd.concat([df, *diff_dfs], axis=1)
 
     if drop_original_columns:
         df = df.drop(source_columns + compare_columns, axis=1)
@@ -29,7 +29,7 @@ from superset.utils.pandas_postprocessing.utils import validate_column_args
 
 
 @validate_column_args("columns")
-def contribution(
+def contribution(  # pylint: disable=too-many-arguments
     df: DataFrame,
     orientation: (
         PostProcessingContributionOrientation | None
@@ -37,6 +37,7 @@ def contribution(
     columns: list[str] | None = None,
     time_shifts: list[str] | None = None,
     rename_columns: list[str] | None = None,
+    inplace: bool = False,
 ) -> DataFrame:
     """
     Calculate cell contribution to row/column total for numeric columns.
@@ -52,9 +53,10 @@ def contribution(
     :param rename_columns: The new labels for the calculated contribution columns.
                            The original columns will not be removed.
     :param orientation: calculate by dividing cell with row/column total
+    :param inplace: Whether to add the contributions to `df` instead of copying it.
     :return: DataFrame with contributions.
     """
-    contribution_df = df.copy()
+    contribution_df = df if inplace else df.copy()
     numeric_df = contribution_df.select_dtypes(include=["number", Decimal])
     numeric_df.fillna(0, inplace=True)
     # verify column selections
@@ -14,16 +14,22 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import hashlib
 import logging
-from typing import Optional, Union
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, Union
 
 import pandas as pd
+from flask import current_app, has_app_context
 from flask_babel import gettext as _
 from pandas import DataFrame
 
 from superset.exceptions import InvalidPostProcessingError
+from superset.extensions import cache_manager
 from superset.utils.core import DTTM_ALIAS
 from superset.utils.decorators import suppress_logging
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.pandas_postprocessing.utils import PROPHET_TIME_GRAIN_MAP
 
 
@@ -77,6 +83,98 @@ def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     return forecast.join(df.set_index("ds"), on="ds").set_index(["ds"])
 
 
+def _prophet_forecast_cache_key(df: DataFrame, **params: Any) -> str:
+    """
+    Compute the cache key of a forecast from the hash of the series history and the
+    parameters passed to the model.
+
+    :param df: DataFrame with the `ds` and `y` columns of a single series
+    :param params: Parameters of the forecast
+    :return: Cache key of the forecast
+    """
+    # hash the hashes of all the rows, since a sum would ignore their order
+    data_hash = hashlib.md5(
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    ).hexdigest()
+    return "prophet_" + md5_sha_from_dict(
+        {"data": data_hash, "rows": len(df), **params},
+        default=str,
+    )
+
+
+def _prophet_forecast_cache_timeout() -> Optional[int]:
+    """
+    Return the cache timeout of forecasts, or `0` if forecasts shouldn't be cached.
+    """
+    if not has_app_context():
+        return 0
+    return current_app.config["PROPHET_FORECAST_CACHE_TIMEOUT"]
+
+
+def _prophet_max_workers() -> int:
+    """
+    Return the number of processes used to fit the series.
+
+    Daemonic processes, like the prefork workers of Celery, can't have children, so
+    the series are fitted sequentially in them.
+    """
+    if not has_app_context() or multiprocessing.current_process().daemon:
+        return 1
+    return max(current_app.config["PROPHET_MAX_WORKERS"], 1)
+
+
+def _prophet_fit_and_predict_many(
+    series: dict[str, DataFrame],
+    **params: Any,
+) -> dict[str, DataFrame]:
+    """
+    Fit and predict multiple series, reusing cached forecasts where the history of
+    the series is unchanged. Series missing from the cache are fitted in a process
+    pool when `PROPHET_MAX_WORKERS` is greater than one.
+
+    :param series: Mapping from column name to the `ds`/`y` DataFrame of the series
+    :param params: Parameters passed to `_prophet_fit_and_predict`
+    :return: Mapping from column name to the forecast of the series
+    """
+    cache_timeout = _prophet_forecast_cache_timeout()
+    cache_keys: dict[str, str] = {}
+    forecasts: dict[str, DataFrame] = {}
+
+    if cache_timeout != 0:
+        cache_keys = {
+            column: _prophet_forecast_cache_key(df, **params)
+            for column, df in series.items()
+        }
+        for column, cache_key in cache_keys.items():
+            forecast = cache_manager.data_cache.get(cache_key)
+            if forecast is not None:
+                forecasts[column] = forecast
+
+    pending = {column: df for column, df in series.items() if column not in forecasts}
+    max_workers = min(_prophet_max_workers(), len(pending))
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                column: executor.submit(_prophet_fit_and_predict, df=df, **params)
+                for column, df in pending.items()
+            }
+            fitted = {column: future.result() for column, future in futures.items()}
+    else:
+        fitted = {
+            column: _prophet_fit_and_predict(df=df, **params)
+            for column, df in pending.items()
+        }
+
+    for column, forecast in fitted.items():
+        if column in cache_keys:
+            cache_manager.data_cache.set(
+                cache_keys[column], forecast, timeout=cache_timeout
+            )
+        forecasts[column] = forecast
+
+    return {column: forecasts[column] for column in series}
+
+
 def prophet(  # pylint: disable=too-many-arguments
     df: DataFrame,
     time_grain: str,
@@ -139,21 +237,21 @@ def prophet(  # pylint: disable=too-many-arguments
 
     target_df = DataFrame()
 
-    for column in [
-        column
-        for column in df.columns
-        if column != index
-        and pd.to_numeric(df[column], errors="coerce").notnull().all()
-    ]:
-        fit_df = _prophet_fit_and_predict(
-            df=df[[index, column]].rename(columns={index: "ds", column: "y"}),
-            confidence_interval=confidence_interval,
-            yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
-            weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
-            daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
-            periods=periods,
-            freq=freq,
-        )
+    forecasts = _prophet_fit_and_predict_many(
+        series={
+            column: df[[index, column]].rename(columns={index: "ds", column: "y"})
+            for column in df.columns
+            if column != index
+            and pd.to_numeric(df[column], errors="coerce").notnull().all()
+        },
+        confidence_interval=confidence_interval,
+        yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
+        weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
+        daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
+        periods=periods,
+        freq=freq,
+    )
+    for column, fit_df in forecasts.items():
         new_columns = [
             f"{column}__yhat",
             f"{column}__yhat_lower",
@@ -16,6 +16,7 @@
 # under the License.
 
 import logging
+from collections.abc import Iterable
 from io import BytesIO
 
 from superset.commands.report.exceptions import ReportSchedulePdfFailedError
@@ -27,22 +28,31 @@ except ModuleNotFoundError:
     logger.info("No PIL installation found")
 
 
-def build_pdf_from_screenshots(snapshots: list[bytes]) -> bytes:
-    images = []
+def build_pdf_from_screenshots(snapshots: Iterable[bytes]) -> bytes:
+    """
+    Build a PDF with one page per screenshot.
 
-    for snap in snapshots:
-        img = Image.open(BytesIO(snap))
-        if img.mode == "RGBA":
-            img = img.convert("RGB")
-        images.append(img)
+    Pages are appended to the document one at a time, so only a single decoded
+    image is held in memory, and ``snapshots`` can be a generator yielding the
+    screenshots as they are captured.
+    """
+    new_pdf = BytesIO()
+    pages = 0
     logger.info("building pdf")
-    try:
-        new_pdf = BytesIO()
-        images[0].save(new_pdf, "PDF", save_all=True, append_images=images[1:])
-        new_pdf.seek(0)
-    except Exception as ex:
-        raise ReportSchedulePdfFailedError(
-            f"Failed converting screenshots to pdf {str(ex)}"
-        ) from ex
+    for snap in snapshots:
+        # errors raised while producing the screenshots are propagated as is
+        try:
+            img = Image.open(BytesIO(snap))
+            if img.mode == "RGBA":
+                img = img.convert("RGB")
+            img.save(new_pdf, "PDF", append=pages > 0)
+            img.close()
+        except Exception as ex:
+            raise ReportSchedulePdfFailedError(
+                f"Failed converting screenshots to pdf {str(ex)}"
+            ) from ex
+        pages += 1
+    if not pages:
+        raise ReportSchedulePdfFailedError("No screenshots to convert to pdf")
 
-    return new_pdf.read()
+    return new_pdf.getvalue()
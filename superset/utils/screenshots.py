@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from io import BytesIO
 from typing import TYPE_CHECKING
 
@@ -254,6 +255,24 @@ class DashboardScreenshot(BaseScreenshot):
         self.window_size = window_size or DEFAULT_DASHBOARD_WINDOW_SIZE
         self.thumb_size = thumb_size or DEFAULT_DASHBOARD_THUMBNAIL_SIZE
 
+    def get_tiled_screenshots(
+        self,
+        user: User,
+        window_size: WindowSize | None = None,
+        tile_height: int | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Capture the dashboard as vertical tiles, yielded from top to bottom as they
+        are captured
+
+        :param user: User Model to login and fetch
+        :param window_size: Override the browser window size
+        :param tile_height: Override the height of each tile, in pixels
+        """
+        tile_height = tile_height or current_app.config["SCREENSHOT_TILE_HEIGHT"]
+        driver = self.driver(window_size)
+        return driver.get_tiled_screenshots(self.url, self.element, user, tile_height)
+
     def cache_key(
         self,
         window_size: bool | WindowSize | None = None,
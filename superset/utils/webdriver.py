@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from enum import Enum
+from math import ceil
 from time import sleep
 from typing import Any, TYPE_CHECKING
 
@@ -67,7 +69,6 @@ class ChartStandaloneMode(Enum):
     SHOW_NAV = 0
 
 
-# pylint: disable=too-few-public-methods
 class WebDriverProxy(ABC):
     def __init__(self, driver_type: str, window: WindowSize | None = None):
         self._driver_type = driver_type
@@ -81,6 +82,22 @@ class WebDriverProxy(ABC):
         Run webdriver and return a screenshot
         """
 
+    def get_tiled_screenshots(
+        self,
+        url: str,
+        element_name: str,
+        user: User,
+        tile_height: int,  # pylint: disable=unused-argument
+    ) -> Iterator[bytes]:
+        """
+        Run webdriver and yield screenshots of the element split in vertical tiles,
+        as they are captured.
+
+        Drivers that can't capture tiles yield a single screenshot of the element.
+        """
+        if img := self.get_screenshot(url, element_name, user):
+            yield img
+
 
 class WebDriverPlaywright(WebDriverProxy):
     @staticmethod
@@ -89,6 +106,24 @@ class WebDriverPlaywright(WebDriverProxy):
             context, user
         )
 
+    def create_context(self, playwright: Any, user: User) -> BrowserContext:
+        browser_args = current_app.config["WEBDRIVER_OPTION_ARGS"]
+        browser = playwright.chromium.launch(args=browser_args)
+        pixel_density = current_app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
+        context = browser.new_context(
+            bypass_csp=True,
+            viewport={
+                "height": self._window[1],
+                "width": self._window[0],
+            },
+            device_scale_factor=pixel_density,
+        )
+        context.set_default_timeout(
+            current_app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+        )
+        self.auth(user, context)
+        return context
+
     @staticmethod
     def find_unexpected_errors(page: Page) -> list[str]:
         error_messages = []
@@ -133,27 +168,9 @@ class WebDriverPlaywright(WebDriverProxy):
 
         return error_messages
 
-    def get_screenshot(  # pylint: disable=too-many-locals, too-many-statements
-        self, url: str, element_name: str, user: User
-    ) -> bytes | None:
+    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
         with sync_playwright() as playwright:
-            browser_args = current_app.config["WEBDRIVER_OPTION_ARGS"]
-            browser = playwright.chromium.launch(args=browser_args)
-            pixel_density = current_app.config["WEBDRIVER_WINDOW"].get(
-                "pixel_density", 1
-            )
-            context = browser.new_context(
-                bypass_csp=True,
-                viewport={
-                    "height": self._window[1],
-                    "width": self._window[0],
-                },
-                device_scale_factor=pixel_density,
-            )
-            context.set_default_timeout(
-                current_app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
-            )
-            self.auth(user, context)
+            context = self.create_context(playwright, user)
             page = context.new_page()
             try:
                 page.goto(
@@ -241,6 +258,75 @@ class WebDriverPlaywright(WebDriverProxy):
                 )
             return img
 
+    def get_tiled_screenshots(  # pylint: disable=too-many-locals
+        self, url: str, element_name: str, user: User, tile_height: int
+    ) -> Iterator[bytes]:
+        """
+        Capture the element as vertical tiles of ``tile_height`` pixels, yielding each
+        tile as soon as it's captured so that callers can stream them.
+
+        The tiles are loaded concurrently in separate pages of the same browser
+        context, at most ``SCREENSHOT_TILED_MAX_PAGES`` at a time, and each page only
+        has to render the charts that are scrolled into its viewport. Errors are
+        raised rather than ending the tiles early, which would truncate the output.
+        """
+        wait_event = current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"]
+        max_pages = max(current_app.config["SCREENSHOT_TILED_MAX_PAGES"], 1)
+        selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+        animation_wait = current_app.config["SCREENSHOT_SELENIUM_ANIMATION_WAIT"]
+        with sync_playwright() as playwright:
+            context = self.create_context(playwright, user)
+            page = context.new_page()
+            try:
+                page.goto(url, wait_until=wait_event)
+                element = page.locator(f".{element_name}")
+                element.wait_for()
+                box = element.bounding_box()
+                if not box:
+                    raise PlaywrightError(f"Element {element_name} is not visible")
+
+                offsets = [
+                    tile * tile_height
+                    for tile in range(ceil(box["height"] / tile_height) or 1)
+                ]
+                logger.debug("Capturing %i tiles of url %s", len(offsets), url)
+                pages = [page] + [
+                    context.new_page() for _ in range(min(max_pages, len(offsets)) - 1)
+                ]
+                for start in range(0, len(offsets), len(pages)):
+                    batch = list(zip(pages, offsets[start : start + len(pages)]))
+                    # the browser loads all the pages of the batch in parallel
+                    for tile_page, _ in batch:
+                        if start or tile_page is not page:
+                            tile_page.goto(url, wait_until="commit")
+                    page.wait_for_timeout(selenium_headstart * 1000)
+                    for tile_page, offset in batch:
+                        tile_page.locator(f".{element_name}").wait_for()
+                        tile_page.evaluate(
+                            "y => window.scrollTo(0, y)", box["y"] + offset
+                        )
+                        for loading_element in tile_page.locator(".loading").all():
+                            loading_element.wait_for(state="detached")
+                    page.wait_for_timeout(animation_wait * 1000)
+                    for tile_page, offset in batch:
+                        yield tile_page.screenshot(
+                            clip={
+                                "x": box["x"],
+                                "y": box["y"] + offset,
+                                "width": box["width"],
+                                "height": min(tile_height, box["height"] - offset),
+                            },
+                            full_page=True,
+                        )
+            except PlaywrightTimeout:
+                logger.exception("Timed out capturing tiles of url %s", url)
+                raise
+            except PlaywrightError:
+                logger.exception(
+                    "Encountered an unexpected error when requesting url %s", url
+                )
+                raise
+
 
 class WebDriverSelenium(WebDriverProxy):
     def create(self) -> WebDriver:
@@ -94,6 +94,7 @@ FRONTEND_CONF_KEYS = (
     "SQLALCHEMY_DOCS_URL",
     "SQLALCHEMY_DISPLAY_TEXT",
     "GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL",
+    "GLOBAL_ASYNC_QUERIES_LONG_POLL_TIMEOUT",
     "DASHBOARD_AUTO_REFRESH_MODE",
     "DASHBOARD_AUTO_REFRESH_INTERVALS",
     "DASHBOARD_VIRTUALIZATION",
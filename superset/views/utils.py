@@ -29,7 +29,7 @@ from flask_babel import _
 from sqlalchemy.exc import NoResultFound
 from werkzeug.wrappers.response import Response
 
-from superset import app, dataframe, db, result_set, viz
+from superset import app, db, result_set, viz
 from superset.common.db_query_status import QueryStatus
 from superset.daos.datasource import DatasourceDAO
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -499,8 +499,18 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    max_rows: Optional[int] = None,
 ) -> dict[str, Any]:
+    """
+    Deserialize the results of a SQL Lab query stored in the results backend.
+
+    msgpack payloads carry the data as an Arrow table, which is converted straight
+    to records, column by column, without going through pandas. When ``max_rows``
+    is set only the rows that can be displayed are converted.
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
@@ -515,17 +525,23 @@ def _deserialize_results_payload(
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
+        if max_rows is not None:
+            pa_table = pa_table.slice(0, max_rows)
+
+        with stats_timing("sqllab.query.results_backend_pa_to_records", stats_logger):
+            ds_payload["data"] = result_set.SupersetResultSet.convert_table_to_records(
+                pa_table
+            )
 
         for column in ds_payload["selected_columns"]:
             if "name" in column:
                 column["column_name"] = column.get("name")
 
         db_engine_spec = query.database.db_engine_spec
-        all_columns, data, expanded_columns = db_engine_spec.expand_data(
-            ds_payload["selected_columns"], ds_payload["data"]
-        )
+        with stats_timing("sqllab.query.results_backend_expand_data", stats_logger):
+            all_columns, data, expanded_columns = db_engine_spec.expand_data(
+                ds_payload["selected_columns"], ds_payload["data"]
+            )
         ds_payload.update(
             {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
         )
@@ -28,6 +28,7 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import (
     SerializationError,
     SupersetErrorException,
+    SupersetErrorsException,
     SupersetSecurityException,
     SupersetTimeoutException,
 )
@@ -35,6 +36,7 @@ from superset.models.core import Database  # noqa: F401
 from superset.models.sql_lab import Query
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.schemas import EstimateQueryCostSchema
+from superset.sqllab.utils import get_partial_results_key
 from superset.utils import core as utils
 from superset.utils.database import get_example_database
 from tests.integration_tests.base_tests import SupersetTestCase
@@ -170,21 +172,43 @@ class TestSqlResultExportCommand(SupersetTestCase):
 
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
-    @patch("superset.models.core.Database.get_df")
-    def test_run_no_results_backend_select_sql(self, get_df_mock: Mock) -> None:
+    @patch("superset.models.core.Database.get_df_chunks")
+    def test_run_no_results_backend_select_sql(self, get_df_chunks_mock: Mock) -> None:
         command = export.SqlResultExportCommand("test")
 
-        get_df_mock.return_value = pd.DataFrame({"foo": [1, 2, 3]})
+        get_df_chunks_mock.return_value = iter(
+            [pd.DataFrame({"foo": [1, 2]}), pd.DataFrame({"foo": [3]})]
+        )
         result = command.run()
 
-        assert result["data"] == "foo\n1\n2\n3\n"
+        assert result["count"] is None
+        assert "".join(result["data"]) == "foo\n1\n2\n3\n"
         assert result["count"] == 3
         assert result["query"].client_id == "test"
+        assert get_df_chunks_mock.call_args[1]["limit"] is None
+
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.models.core.Database.get_df_chunks")
+    def test_run_no_results_backend_error(self, get_df_chunks_mock: Mock) -> None:
+        command = export.SqlResultExportCommand("test")
+
+        def get_df_chunks(*args, **kwargs):
+            raise Exception("no such table: bar")
+            yield  # pylint: disable=unreachable
+
+        get_df_chunks_mock.side_effect = get_df_chunks
+
+        # the error is raised by the command rather than while streaming
+        with pytest.raises(SupersetErrorsException):
+            command.run()
 
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
-    @patch("superset.models.core.Database.get_df")
-    def test_run_no_results_backend_executed_sql(self, get_df_mock: Mock) -> None:
+    @patch("superset.models.core.Database.get_df_chunks")
+    def test_run_no_results_backend_executed_sql(
+        self, get_df_chunks_mock: Mock
+    ) -> None:
         query_obj = db.session.query(Query).filter_by(client_id="test").one()
         query_obj.executed_sql = "select * from bar limit 2"
         query_obj.select_sql = None
@@ -192,18 +216,20 @@ class TestSqlResultExportCommand(SupersetTestCase):
 
         command = export.SqlResultExportCommand("test")
 
-        get_df_mock.return_value = pd.DataFrame({"foo": [1, 2, 3]})
+        get_df_chunks_mock.return_value = iter([pd.DataFrame({"foo": [1, 2]})])
         result = command.run()
 
-        assert result["data"] == "foo\n1\n2\n"
+        assert "".join(result["data"]) == "foo\n1\n2\n"
         assert result["count"] == 2
         assert result["query"].client_id == "test"
+        assert get_df_chunks_mock.call_args[0][0] == "select * from bar limit 2"
+        assert get_df_chunks_mock.call_args[1]["limit"] == 2
 
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
-    @patch("superset.models.core.Database.get_df")
+    @patch("superset.models.core.Database.get_df_chunks")
     def test_run_no_results_backend_executed_sql_limiting_factor(
-        self, get_df_mock: Mock
+        self, get_df_chunks_mock: Mock
     ) -> None:
         query_obj = db.session.query(Query).filter_by(results_key="abc_query").one()
         query_obj.executed_sql = "select * from bar limit 2"
@@ -213,13 +239,15 @@ class TestSqlResultExportCommand(SupersetTestCase):
 
         command = export.SqlResultExportCommand("test")
 
-        get_df_mock.return_value = pd.DataFrame({"foo": [1, 2, 3]})
+        get_df_chunks_mock.return_value = iter([pd.DataFrame({"foo": [1]})])
 
         result = command.run()
 
-        assert result["data"] == "foo\n1\n"
+        assert "".join(result["data"]) == "foo\n1\n"
         assert result["count"] == 1
         assert result["query"].client_id == "test"
+        assert get_df_chunks_mock.call_args[0][0] == "select * from bar limit 1"
+        assert get_df_chunks_mock.call_args[1]["limit"] == 1
 
     @pytest.mark.usefixtures("create_database_and_query")
     @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
@@ -364,3 +392,34 @@ class TestSqlExecutionResultsCommand(SupersetTestCase):
         assert result.get("status") == "success"
         assert result["query"].get("rows") == 104
         assert result.get("data") == data
+
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.commands.sql_lab.results.results_backend_use_msgpack", False)
+    def test_run_partial_results(self) -> None:
+        query = db.session.query(Query).filter_by(client_id="test").one()
+        key = get_partial_results_key(query.id)
+        query.set_extra_json_key("partial_results_key", key)
+        db.session.commit()
+
+        data = [{"col_0": i} for i in range(10)]
+        payload = {
+            "status": QueryStatus.RUNNING,
+            "query": {"rows": 10},
+            "data": data,
+        }
+        serialized_payload = sql_lab._serialize_payload(payload, False)
+        compressed = utils.zlib_compress(serialized_payload)
+
+        results.results_backend = mock.Mock()
+        results.results_backend.get.return_value = compressed
+
+        result = results.SqlExecutionResultsCommand(key, 1000).run()
+        assert result.get("status") == "running"
+        assert result.get("data") == data
+
+        # the partial results of a query are only served under its current key
+        with pytest.raises(SupersetErrorException) as ex_info:
+            results.SqlExecutionResultsCommand(
+                get_partial_results_key(query.id), 1000
+            ).run()
+        assert ex_info.value.status == 404
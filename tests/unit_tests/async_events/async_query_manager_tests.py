@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import threading
 from unittest import mock
 from unittest.mock import ANY, Mock
 
@@ -31,6 +32,7 @@ from superset.async_events.cache_backend import (
     RedisCacheBackend,
     RedisSentinelCacheBackend,
 )
+from superset.utils import json
 
 JWT_TOKEN_SECRET = "some_secret"
 JWT_TOKEN_COOKIE_NAME = "superset_async_jwt"
@@ -169,3 +171,150 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+def test_read_events_long_poll(async_query_manager):
+    event = ("1607477697866-0", {"data": '{"job_id": "job", "status": "done"}'})
+    cache = mock.Mock(spec=redis.Redis)
+    cache.xread.return_value = [["async-events-channel", [event]]]
+    async_query_manager._cache = cache
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._long_poll_timeout = 1000
+    async_query_manager._long_poll_slots = threading.BoundedSemaphore(1)
+
+    events = async_query_manager.read_events("channel", "1607477697865-0", 5000)
+
+    assert events == [{"id": "1607477697866-0", "job_id": "job", "status": "done"}]
+    cache.xread.assert_called_once_with(
+        {"async-events-channel": "1607477697865-0"},
+        AsyncQueryManager.MAX_EVENT_COUNT,
+        1000,
+    )
+    cache.xrange.assert_not_called()
+
+
+def test_read_events_long_poll_no_free_slot(async_query_manager):
+    cache = mock.Mock(spec=redis.Redis)
+    cache.xrange.return_value = []
+    async_query_manager._cache = cache
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._long_poll_timeout = 1000
+    async_query_manager._long_poll_slots = threading.BoundedSemaphore(1)
+    async_query_manager._long_poll_slots.acquire()
+
+    assert async_query_manager.read_events("channel", None, 5000) == []
+    cache.xread.assert_not_called()
+    cache.xrange.assert_called_once_with(
+        "async-events-channel", "-", "+", AsyncQueryManager.MAX_EVENT_COUNT
+    )
+
+
+class FakeRedis:
+    """
+    Minimal in-memory stand-in for the Redis commands used by the in-flight job
+    registry, recording the events added to the streams.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+        self.events = []
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+        return len(self.lists[key])
+
+    def expire(self, key, seconds):
+        return True
+
+    def exists(self, key):
+        return int(key in self.values or key in self.lists)
+
+    def delete(self, key):
+        return int(
+            self.values.pop(key, None) is not None
+            or self.lists.pop(key, None) is not None
+        )
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def lrem(self, key, count, value):
+        self.lists.get(key, []).remove(value)
+        return 1
+
+    def xadd(self, stream_name, event_data, event_id="*", maxlen=None):
+        self.events.append((stream_name, json.loads(event_data["data"])))
+
+    def pipeline(self):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.commands = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.commands.append(
+                    (getattr(client, name), args, kwargs)
+                )
+
+            def execute(self):
+                return [
+                    command(*args, **kwargs) for command, args, kwargs in self.commands
+                ]
+
+        return Pipeline()
+
+
+@mock.patch("superset.is_feature_enabled")
+def test_submit_chart_data_job_dedup(is_feature_enabled_mock, async_query_manager):
+    is_feature_enabled_mock.return_value = True
+    g.user = None
+    cache = FakeRedis()
+    async_query_manager._cache = cache
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._stream_limit = None
+    async_query_manager._stream_limit_firehose = None
+    async_query_manager._job_dedup_timeout = 600
+    job_mock = Mock()
+    async_query_manager._load_chart_data_into_cache_job = job_mock
+
+    first_job = async_query_manager.submit_chart_data_job(
+        "first_channel", {}, dedup_key="key"
+    )
+    second_job = async_query_manager.submit_chart_data_job(
+        "second_channel", {}, dedup_key="key"
+    )
+    other_job = async_query_manager.submit_chart_data_job(
+        "third_channel", {}, dedup_key="other_key"
+    )
+
+    # only the first job for each key is enqueued
+    assert job_mock.delay.call_count == 2
+    task_metadata = job_mock.delay.call_args_list[0].args[0]
+    assert task_metadata == {**first_job, "dedup_key": "key"}
+
+    async_query_manager.update_job(
+        task_metadata, AsyncQueryManager.STATUS_DONE, result_url="/result"
+    )
+
+    # the completion event is sent to the attached job's channel too
+    assert [(stream, event["job_id"]) for stream, event in cache.events] == [
+        ("async-events-first_channel", first_job["job_id"]),
+        ("async-events-full", first_job["job_id"]),
+        ("async-events-second_channel", second_job["job_id"]),
+        ("async-events-full", second_job["job_id"]),
+    ]
+    assert all(event["result_url"] == "/result" for _, event in cache.events)
+    assert all("dedup_key" not in event for _, event in cache.events)
+    assert other_job["job_id"] not in {event["job_id"] for _, event in cache.events}
+
+    # once completed, the same results are computed by a new job
+    async_query_manager.submit_chart_data_job("second_channel", {}, dedup_key="key")
+    assert job_mock.delay.call_count == 3
@@ -16,16 +16,181 @@
 # under the License.
 
 
+import itertools
+
+import numpy as np
 import pandas as pd
 import pytest
-from flask_babel import lazy_gettext as _
+from flask_babel import gettext as __, lazy_gettext as _
 from sqlalchemy.orm.session import Session
 
-from superset.charts.post_processing import apply_post_process, pivot_df, table
+from superset.charts.post_processing import (
+    apply_post_process,
+    get_column_key,
+    pivot_df,
+    pivot_v2_aggfunc_map,
+    table,
+)
 from superset.common.chart_data import ChartDataResultFormat
 from superset.utils.core import GenericDataType
 
 
+def baseline_pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-statements, too-many-branches
+    df: pd.DataFrame,
+    rows: list[str],
+    columns: list[str],
+    metrics: list[str],
+    aggfunc: str = "Sum",
+    transpose_pivot: bool = False,
+    combine_metrics: bool = False,
+    show_rows_total: bool = False,
+    show_columns_total: bool = False,
+    apply_metrics_on_rows: bool = False,
+) -> pd.DataFrame:
+    """
+    A frozen copy of ``pivot_df`` before the totals and subtotals were vectorized.
+    """
+    metric_name = __("Total (%(aggfunc)s)", aggfunc=aggfunc)
+
+    if transpose_pivot:
+        rows, columns = columns, rows
+
+    # to apply the metrics on the rows we pivot the dataframe, apply the
+    # metrics to the columns, and pivot the dataframe back before
+    # returning it
+    if apply_metrics_on_rows:
+        rows, columns = columns, rows
+        axis = {"columns": 0, "rows": 1}
+    else:
+        axis = {"columns": 1, "rows": 0}
+
+    # pivoting with null values will create an empty df
+    df = df.fillna("SUPERSET_PANDAS_NAN")
+
+    # pivot data; we'll compute totals and subtotals later
+    if rows or columns:
+        df = df.pivot_table(
+            index=rows,
+            columns=columns,
+            values=metrics,
+            aggfunc=pivot_v2_aggfunc_map[aggfunc],
+            margins=False,
+        )
+    else:
+        # if there's no rows nor columns we have a single value; update
+        # the index with the metric name so it shows up in the table
+        df.index = pd.Index([*df.index[:-1], metric_name], name="metric")
+
+    # if no rows were passed the metrics will be in the rows, so we
+    # need to move them back to columns
+    if columns and not rows:
+        df = df.stack()
+        if not isinstance(df, pd.DataFrame):
+            df = df.to_frame()
+        df = df.T
+        df = df[metrics]
+        df.index = pd.Index([*df.index[:-1], metric_name], name="metric")
+
+    # combining metrics changes the column hierarchy, moving the metric
+    # from the top to the bottom, eg:
+    #
+    # ('SUM(col)', 'age', 'name') => ('age', 'name', 'SUM(col)')
+    if combine_metrics and isinstance(df.columns, pd.MultiIndex):
+        # move metrics to the lowest level
+        new_order = [*range(1, df.columns.nlevels), 0]
+        df = df.reorder_levels(new_order, axis=1)
+
+        # sort columns, combining metrics for each group
+        decorated_columns = [(col, i) for i, col in enumerate(df.columns)]
+        grouped_columns = sorted(
+            decorated_columns, key=lambda t: get_column_key(t[0], metrics)
+        )
+        indexes = [i for col, i in grouped_columns]
+        df = df[df.columns[indexes]]
+    elif rows:
+        # if metrics were not combined we sort the dataframe by the list
+        # of metrics defined by the user
+        df = df[metrics]
+
+    # compute fractions, if needed
+    if aggfunc.endswith(" as Fraction of Total"):
+        total = df.sum().sum()
+        df = df.astype(total.dtypes) / total
+    elif aggfunc.endswith(" as Fraction of Columns"):
+        total = df.sum(axis=axis["rows"])
+        df = df.astype(total.dtypes).div(total, axis=axis["columns"])
+    elif aggfunc.endswith(" as Fraction of Rows"):
+        total = df.sum(axis=axis["columns"])
+        df = df.astype(total.dtypes).div(total, axis=axis["rows"])
+
+    # convert to a MultiIndex to simplify logic
+    if not isinstance(df.index, pd.MultiIndex):
+        df.index = pd.MultiIndex.from_tuples([(str(i),) for i in df.index])
+    if not isinstance(df.columns, pd.MultiIndex):
+        df.columns = pd.MultiIndex.from_tuples([(str(i),) for i in df.columns])
+
+    if show_rows_total:
+        # add subtotal for each group and overall total; we start from the
+        # overall group, and iterate deeper into subgroups
+        groups = df.columns
+        if not apply_metrics_on_rows:
+            for col in df.columns:
+                # we need to replace the temporary placeholder with either a string
+                # or np.nan, depending on the column type so that they can sum correctly
+                if pd.api.types.is_numeric_dtype(df[col]):
+                    df[col].replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
+                else:
+                    df[col].replace("SUPERSET_PANDAS_NAN", "nan", inplace=True)
+        else:
+            # when we applied metrics on rows, we switched the columns and rows
+            # so checking column type doesn't apply. Replace everything with np.nan
+            df.replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
+        for level in range(df.columns.nlevels):
+            subgroups = {group[:level] for group in groups}
+            for subgroup in subgroups:
+                slice_ = df.columns.get_loc(subgroup)
+                subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
+                depth = df.columns.nlevels - len(subgroup) - 1
+                total = metric_name if level == 0 else __("Subtotal")
+                subtotal_name = tuple([*subgroup, total, *([""] * depth)])
+                # insert column after subgroup
+                df.insert(int(slice_.stop), subtotal_name, subtotal)
+
+    if rows and show_columns_total:
+        # add subtotal for each group and overall total; we start from the
+        # overall group, and iterate deeper into subgroups
+        groups = df.index
+        for level in range(df.index.nlevels):
+            subgroups = {group[:level] for group in groups}
+            for subgroup in subgroups:
+                slice_ = df.index.get_loc(subgroup)
+                subtotal = pivot_v2_aggfunc_map[aggfunc](
+                    df.iloc[slice_, :].apply(pd.to_numeric, errors="coerce"), axis=0
+                )
+                depth = df.index.nlevels - len(subgroup) - 1
+                total = metric_name if level == 0 else __("Subtotal")
+                subtotal.name = tuple([*subgroup, total, *([""] * depth)])
+                # insert row after subgroup
+                df = pd.concat(
+                    [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
+                )
+
+    # if we want to apply the metrics on the rows we need to pivot the
+    # dataframe back
+    if apply_metrics_on_rows:
+        df = df.T
+
+    # replace the remaining temporary placeholder string for np.nan after pivoting
+    df.replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
+    df.rename(
+        index={"SUPERSET_PANDAS_NAN": np.nan},
+        columns={"SUPERSET_PANDAS_NAN": np.nan},
+        inplace=True,
+    )
+
+    return df
+
+
 def test_pivot_df_no_cols_no_rows_single_metric():
     """
     Pivot table when no cols/rows and 1 metric are selected.
@@ -1789,6 +1954,47 @@ def test_pivot_df_complex_null_values():
     )
 
 
+@pytest.mark.parametrize("aggfunc", list(pivot_v2_aggfunc_map))
+@pytest.mark.parametrize("null_metrics", [False, True])
+def test_pivot_df_matches_baseline(aggfunc: str, null_metrics: bool) -> None:
+    """
+    Test that the vectorized totals and subtotals match the original implementation.
+    """
+    rng = np.random.default_rng(42)
+    size = 60
+    df = pd.DataFrame(
+        {
+            "state": rng.choice(["CA", "FL", "NY"], size),
+            "gender": rng.choice(["boy", "girl", None], size),
+            "name": rng.choice(["Amy", "Cindy", "Dawn"], size),
+            "SUM(num)": rng.integers(0, 1000, size),
+            "MAX(num)": rng.random(size) * 100,
+        }
+    )
+    if null_metrics:
+        df.loc[df["gender"] == "boy", "MAX(num)"] = np.nan
+
+    for flags in itertools.product([False, True], repeat=6):
+        kwargs = {
+            "rows": ["state", "gender"],
+            "columns": [] if flags[5] else ["name"],
+            "metrics": ["SUM(num)", "MAX(num)"],
+            "aggfunc": aggfunc,
+            "transpose_pivot": flags[0],
+            "combine_metrics": flags[1],
+            "show_rows_total": flags[2],
+            "show_columns_total": flags[3],
+            "apply_metrics_on_rows": flags[4],
+        }
+        try:
+            expected = baseline_pivot_df(df.copy(), **kwargs)
+        except (AttributeError, TypeError):
+            # some aggregations are broken in the original implementation
+            continue
+
+        pd.testing.assert_frame_equal(pivot_df(df.copy(), **kwargs), expected)
+
+
 def test_table():
     """
     Test that the table reports honor `d3NumberFormat`.
@@ -20,6 +20,7 @@ from typing import Any
 from zipfile import ZipFile
 
 import numpy as np
+import pandas as pd
 import pytest
 from werkzeug.datastructures import FileStorage
 
@@ -251,3 +252,30 @@ def test_columnar_reader_metadata_invalid_file():
         "Parsing error: Parquet file size is 2 bytes, "
         "smaller than the minimum file footer (8 bytes)"
     )
+
+
+def test_columnar_reader_file_to_dataframe_chunks():
+    buffer = io.BytesIO()
+    pd.DataFrame(COLUMNAR_DATA).to_parquet(buffer, index=False, row_group_size=2)
+    buffer.seek(0)
+    file = FileStorage(stream=buffer, filename="test.parquet")
+
+    reader = ColumnarReader(options=ColumnarReaderOptions(columns_read=["Name"]))
+    chunks = list(reader.file_to_dataframe_chunks(file))
+    assert [chunk.values.tolist() for chunk in chunks] == [
+        [["name1"], ["name2"]],
+        [["name3"]],
+    ]
+
+
+def test_columnar_reader_file_to_dataframe_chunks_empty():
+    buffer = io.BytesIO()
+    pd.DataFrame(COLUMNAR_DATA).head(0).to_parquet(buffer, index=False)
+    buffer.seek(0)
+    file = FileStorage(stream=buffer, filename="test.parquet")
+
+    reader = ColumnarReader(options=ColumnarReaderOptions(columns_read=["Name"]))
+    chunks = list(reader.file_to_dataframe_chunks(file))
+    assert len(chunks) == 1
+    assert chunks[0].columns.tolist() == ["Name"]
+    assert chunks[0].empty
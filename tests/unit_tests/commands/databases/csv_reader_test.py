@@ -18,6 +18,7 @@ import io
 from datetime import datetime
 
 import numpy as np
+import pandas as pd
 import pytest
 from werkzeug.datastructures import FileStorage
 
@@ -371,3 +372,81 @@ def test_csv_reader_file_metadata_invalid_file():
         "Parsing error: Error tokenizing data. C error:"
         " Expected 3 fields in line 3, saw 7\n"
     )
+
+
+def test_csv_reader_file_to_dataframe_chunks(mocker):
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.READ_CSV_CHUNK_SIZE", 2
+    )
+    reader = CSVReader(options=CSVReaderOptions(columns_read=["Name", "Age"]))
+    chunks = list(reader.file_to_dataframe_chunks(create_csv_file(CSV_DATA)))
+    assert [chunk.values.tolist() for chunk in chunks] == [
+        [["name1", 30], ["name2", 25]],
+        [["name3", 20]],
+    ]
+
+
+def test_csv_reader_read_streams_chunks(mocker):
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.READ_CSV_CHUNK_SIZE", 2
+    )
+    database = mocker.MagicMock()
+    reader = CSVReader(options=CSVReaderOptions(already_exists="replace"))
+    report = reader.read(create_csv_file(CSV_DATA), database, "table", None)
+
+    calls = database.db_engine_spec.df_to_sql.call_args_list
+    assert [len(call.args[2]) for call in calls] == [2, 1]
+    assert [call.kwargs["to_sql_kwargs"]["if_exists"] for call in calls] == [
+        "replace",
+        "append",
+    ]
+    assert report["chunks"] == 2
+    assert report["rows"] == 3
+
+
+def test_csv_reader_read_without_append(mocker):
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.READ_CSV_CHUNK_SIZE", 2
+    )
+    database = mocker.MagicMock()
+    database.db_engine_spec.supports_file_upload_append = False
+    reader = CSVReader(options=CSVReaderOptions(already_exists="replace"))
+    report = reader.read(create_csv_file(CSV_DATA), database, "table", None)
+
+    calls = database.db_engine_spec.df_to_sql.call_args_list
+    assert [len(call.args[2]) for call in calls] == [3]
+    assert calls[0].kwargs["to_sql_kwargs"]["if_exists"] == "replace"
+    assert report["chunks"] == 1
+    assert report["rows"] == 3
+
+
+@pytest.mark.parametrize(
+    "already_exists, dropped",
+    [("replace", True), ("fail", True), ("append", False)],
+)
+def test_csv_reader_read_drops_partial_table(mocker, already_exists, dropped):
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.READ_CSV_CHUNK_SIZE", 2
+    )
+    drop_table = mocker.patch.object(CSVReader, "_drop_table")
+    database = mocker.MagicMock()
+    database.db_engine_spec.df_to_sql.side_effect = [None, Exception("boom")]
+    reader = CSVReader(options=CSVReaderOptions(already_exists=already_exists))
+
+    with pytest.raises(DatabaseUploadFailed):
+        reader.read(create_csv_file(CSV_DATA), database, "table", None)
+    if dropped:
+        drop_table.assert_called_once_with(database, "table", None)
+    else:
+        drop_table.assert_not_called()
+
+
+def test_csv_reader_coerce_chunk():
+    dtypes = pd.Series({"a": np.dtype("int64"), "b": np.dtype("int64")})
+    df = pd.DataFrame({"a": [1.0, None], "b": ["1", "x"]})
+
+    df = CSVReader._coerce_chunk(df, dtypes)
+    assert str(df["a"].dtype) == "Int64"
+    assert df["a"].tolist() == [1, pd.NA]
+    assert df["b"].dtype == object
+    assert df["b"].tolist() == ["1", "x"]
@@ -0,0 +1,194 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+
+from superset import db
+from superset.commands.dataset.exceptions import (
+    DatasetExtractNotAllowedError,
+    DatasetExtractRefreshFailedError,
+)
+from superset.commands.dataset.extract import RefreshDatasetExtractCommand
+from superset.connectors.sqla.models import SqlaTable, TableColumn
+from superset.models.core import Database
+from superset.utils import json
+
+
+@pytest.fixture
+def extract_path(mocker: MockerFixture, tmp_path: Path) -> Path:
+    path = tmp_path / "extracts"
+    mocker.patch.dict(
+        "superset.connectors.sqla.models.config",
+        {
+            "DATASET_EXTRACTS_ENABLED": True,
+            "DATASET_EXTRACT_PATH": str(path),
+        },
+    )
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {
+            "DATASET_EXTRACTS_ENABLED": True,
+            "DATASET_EXTRACT_PATH": str(path),
+            "DATASET_EXTRACT_CHUNK_SIZE": 2,
+        },
+    )
+    return path
+
+
+@pytest.fixture
+def database(session: None, tmp_path: Path) -> Database:
+    uri = f"sqlite:///{tmp_path / 'source.db'}"
+    engine = create_engine(uri)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE sales (region TEXT, amount INTEGER)")
+        conn.exec_driver_sql(
+            "INSERT INTO sales VALUES ('east', 1), ('west', 2), ('east', 3)"
+        )
+
+    SqlaTable.metadata.create_all(db.session.get_bind())
+    database = Database(database_name="source", sqlalchemy_uri=uri)
+    extra = json.dumps({"extract": {"refresh_interval": 60}})
+    db.session.add_all(
+        [
+            database,
+            SqlaTable(table_name="sales", database=database, extra=extra),
+            SqlaTable(
+                table_name="east",
+                database=database,
+                extra=extra,
+                sql="SELECT * FROM sales WHERE region = 'east'",
+            ),
+            SqlaTable(
+                table_name="templated",
+                database=database,
+                extra=extra,
+                sql="SELECT * FROM sales WHERE region = '{{ url_param('r') }}'",
+            ),
+            SqlaTable(table_name="live", database=database),
+        ]
+    )
+    db.session.commit()
+    return database
+
+
+def _get_dataset(table_name: str) -> SqlaTable:
+    return db.session.query(SqlaTable).filter_by(table_name=table_name).one()
+
+
+def test_refresh_extract(extract_path: Path, database: Database) -> None:
+    dataset = _get_dataset("sales")
+
+    assert RefreshDatasetExtractCommand(dataset.id).run() == 3
+    assert os.listdir(extract_path) == [f"{dataset.uuid}.parquet"]
+    assert pd.read_parquet(dataset.extract_path).to_dict("records") == [
+        {"region": "east", "amount": 1},
+        {"region": "west", "amount": 2},
+        {"region": "east", "amount": 3},
+    ]
+    assert dataset.get_extract_age() is not None
+
+
+def test_refresh_extract_virtual(extract_path: Path, database: Database) -> None:
+    dataset = _get_dataset("east")
+
+    assert RefreshDatasetExtractCommand(dataset.id).run() == 2
+    assert pd.read_parquet(dataset.extract_path)["amount"].tolist() == [1, 3]
+
+
+def test_refresh_extract_sparse_column(extract_path: Path, database: Database) -> None:
+    """
+    Test columns that only have nulls in the first chunk, which take the type of
+    the dataset column, or are stored as strings.
+    """
+    with create_engine(database.sqlalchemy_uri).begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE sparse (id INTEGER, note TEXT, num REAL)")
+        conn.exec_driver_sql(
+            "INSERT INTO sparse VALUES (1, NULL, NULL), (2, NULL, NULL), (3, 'x', 1.5)"
+        )
+    dataset = SqlaTable(
+        table_name="sparse",
+        database=database,
+        extra=json.dumps({"extract": {"refresh_interval": 60}}),
+        columns=[TableColumn(column_name="num", type="REAL")],
+    )
+    db.session.add(dataset)
+    db.session.commit()
+
+    assert RefreshDatasetExtractCommand(dataset.id).run() == 3
+    df = pd.read_parquet(dataset.extract_path)
+    assert df["id"].tolist() == [1, 2, 3]
+    assert df["note"].tolist() == [None, None, "x"]
+    assert df["num"].dtype == "float64"
+    assert df["num"].fillna(0).tolist() == [0, 0, 1.5]
+
+
+@pytest.mark.parametrize("table_name", ["templated", "live"])
+def test_refresh_extract_not_allowed(
+    extract_path: Path,
+    database: Database,
+    table_name: str,
+) -> None:
+    with pytest.raises(DatasetExtractNotAllowedError):
+        RefreshDatasetExtractCommand(_get_dataset(table_name).id).run()
+
+
+def test_refresh_extract_failed(
+    mocker: MockerFixture,
+    extract_path: Path,
+    database: Database,
+) -> None:
+    """
+    A failed refresh keeps the previous extract and removes the temporary file.
+    """
+    dataset = _get_dataset("sales")
+    RefreshDatasetExtractCommand(dataset.id).run()
+    mocker.patch.object(Database, "get_df_chunks", side_effect=Exception("boom"))
+
+    with pytest.raises(DatasetExtractRefreshFailedError):
+        RefreshDatasetExtractCommand(dataset.id).run()
+    assert os.listdir(extract_path) == [f"{dataset.uuid}.parquet"]
+    assert len(pd.read_parquet(dataset.extract_path)) == 3
+
+
+def test_refresh_dataset_extracts(
+    mocker: MockerFixture,
+    extract_path: Path,
+    database: Database,
+) -> None:
+    from superset.tasks.extracts import refresh_dataset_extracts
+
+    sales = _get_dataset("sales")
+    stale = extract_path / "deleted.parquet"
+    extract_path.mkdir()
+    stale.touch()
+    run = mocker.spy(RefreshDatasetExtractCommand, "run")
+
+    refresh_dataset_extracts()
+    assert run.call_count == 3
+    assert sorted(os.listdir(extract_path)) == sorted(
+        [f"{sales.uuid}.parquet", f"{_get_dataset('east').uuid}.parquet"]
+    )
+
+    # fresh extracts are not refreshed
+    run.reset_mock()
+    refresh_dataset_extracts()
+    assert run.call_count == 1
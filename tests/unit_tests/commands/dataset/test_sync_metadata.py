@@ -0,0 +1,120 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+
+from superset import db
+from superset.commands.dataset.sync_metadata import SyncDatasetsMetadataCommand
+from superset.connectors.sqla.models import SqlaTable, TableColumn
+from superset.db_engine_specs.sqlite import SqliteEngineSpec
+from superset.models.core import Database
+
+
+@pytest.fixture
+def database(session: None, tmp_path: Path) -> Database:
+    uri = f"sqlite:///{tmp_path / 'sync.db'}"
+    engine = create_engine(uri)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t1 (a INTEGER, b TEXT, ds TIMESTAMP)")
+        conn.exec_driver_sql("CREATE TABLE t2 (c REAL)")
+        conn.exec_driver_sql("CREATE VIEW v1 AS SELECT a FROM t1")
+
+    SqlaTable.metadata.create_all(db.session.get_bind())
+    database = Database(database_name="sync_db", sqlalchemy_uri=uri)
+    t1 = SqlaTable(
+        table_name="t1",
+        database=database,
+        columns=[
+            TableColumn(column_name="a", type="TEXT"),
+            TableColumn(column_name="dropped", type="TEXT"),
+            TableColumn(column_name="twice_a", expression="a * 2"),
+        ],
+    )
+    db.session.add_all(
+        [
+            database,
+            t1,
+            SqlaTable(table_name="t2", database=database),
+            SqlaTable(table_name="v1", database=database),
+            SqlaTable(table_name="gone", database=database),
+            SqlaTable(table_name="virtual", database=database, sql="SELECT 1"),
+        ]
+    )
+    db.session.commit()
+    return database
+
+
+def _columns(table_name: str) -> dict[str, str | None]:
+    dataset = db.session.query(SqlaTable).filter_by(table_name=table_name).one()
+    return {column.column_name: column.type for column in dataset.columns}
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_sync_datasets_metadata(
+    mocker: MockerFixture,
+    database: Database,
+    bulk: bool,
+) -> None:
+    get_columns = mocker.spy(SqliteEngineSpec, "get_columns")
+    if not bulk:
+        mocker.patch.object(SqliteEngineSpec, "get_schema_columns", return_value=None)
+
+    result = SyncDatasetsMetadataCommand(database.id, batch_size=2).run()
+
+    assert result.synced == 3
+    assert result.modified == 3
+    assert result.missing == ["gone"]
+    assert result.failed == []
+    assert get_columns.call_count == (0 if bulk else 3)
+
+    assert _columns("t1") == {
+        "a": "INTEGER",
+        "b": "TEXT",
+        "ds": "TIMESTAMP",
+        "twice_a": None,
+    }
+    assert _columns("t2") == {"c": "REAL"}
+    assert _columns("v1") == {"a": "INTEGER"}
+    assert _columns("virtual") == {}
+    assert (
+        db.session.query(SqlaTable).filter_by(table_name="t1").one().main_dttm_col
+        == "ds"
+    )
+
+
+def test_sync_datasets_metadata_failure(
+    mocker: MockerFixture,
+    database: Database,
+) -> None:
+    mocker.patch.object(SqliteEngineSpec, "get_schema_columns", return_value=None)
+    get_columns = SqliteEngineSpec.get_columns
+
+    def fail_t2(inspector, table, options=None):
+        if table.table == "t2":
+            raise Exception("boom")
+        return get_columns(inspector, table, options)
+
+    mocker.patch.object(SqliteEngineSpec, "get_columns", side_effect=fail_t2)
+
+    result = SyncDatasetsMetadataCommand(database.id, max_workers=2).run()
+
+    assert result.synced == 2
+    assert result.failed == ["t2"]
+    assert _columns("t2") == {}
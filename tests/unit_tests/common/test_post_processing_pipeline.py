@@ -0,0 +1,172 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+from superset.common.utils.post_processing_pipeline import (
+    plan_post_processing,
+    PostProcessingPipeline,
+)
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.exceptions import InvalidPostProcessingError
+from superset.models.helpers import QueryResult
+from superset.utils import pandas_postprocessing
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "dttm": pd.date_range("2021-01-01", periods=6, freq="D"),
+            "a": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+            "b": [6.0, 5.0, 4.0, 3.0, 2.0, 1.0],
+        }
+    )
+
+
+def run_sequentially(df: pd.DataFrame, post_processing: list) -> pd.DataFrame:
+    for post_process in post_processing:
+        operation = getattr(pandas_postprocessing, post_process["operation"])
+        df = operation(df, **post_process.get("options", {}))
+    return df
+
+
+def test_plan_invalid_operations() -> None:
+    with pytest.raises(InvalidPostProcessingError):
+        plan_post_processing([{"options": {}}])
+    with pytest.raises(InvalidPostProcessingError):
+        plan_post_processing([{"operation": "foo"}])
+
+
+def test_plan_skips_noop_steps() -> None:
+    steps = plan_post_processing(
+        [
+            {"operation": "sort", "options": {}},
+            {"operation": "rename", "options": {"columns": {}}},
+            {"operation": "select", "options": {"columns": []}},
+            {"operation": "sort", "options": {"by": ["a"]}},
+        ]
+    )
+    assert [(step.operation, step.options) for step in steps] == [
+        ("sort", {"by": ["a"]})
+    ]
+
+
+def test_plan_fuses_column_mappings() -> None:
+    steps = plan_post_processing(
+        [
+            {"operation": "cum", "options": {"operator": "sum", "columns": {"a": "a"}}},
+            {"operation": "cum", "options": {"operator": "sum", "columns": {"b": "b"}}},
+            # different operator
+            {"operation": "cum", "options": {"operator": "max", "columns": {"b": "b"}}},
+            # reads the column written by the previous step
+            {"operation": "diff", "options": {"columns": {"a": "a2"}}},
+            {"operation": "diff", "options": {"columns": {"a2": "a3"}}},
+        ]
+    )
+    assert [(step.operation, step.fused) for step in steps] == [
+        ("cum", 2),
+        ("cum", 1),
+        ("diff", 1),
+        ("diff", 1),
+    ]
+    assert steps[0].options["columns"] == {"a": "a", "b": "b"}
+
+
+def test_pipeline_matches_sequential_execution(df: pd.DataFrame) -> None:
+    post_processing = [
+        {"operation": "sort", "options": {}},
+        {"operation": "cum", "options": {"operator": "sum", "columns": {"a": "a"}}},
+        {"operation": "cum", "options": {"operator": "sum", "columns": {"b": "b"}}},
+        {
+            "operation": "rolling",
+            "options": {"rolling_type": "mean", "window": 2, "columns": {"a": "a"}},
+        },
+        {"operation": "diff", "options": {"columns": {"a": "a_diff"}}},
+        {"operation": "diff", "options": {"columns": {"b": "b_diff"}}},
+        {
+            "operation": "compare",
+            "options": {
+                "source_columns": ["a"],
+                "compare_columns": ["b"],
+                "compare_type": "difference",
+            },
+        },
+        {
+            "operation": "compare",
+            "options": {
+                "source_columns": ["b"],
+                "compare_columns": ["a"],
+                "compare_type": "difference",
+            },
+        },
+        {"operation": "contribution", "options": {"columns": ["a", "b"]}},
+        {"operation": "rename", "options": {"columns": {"a": "A"}}},
+    ]
+    original = df.copy()
+
+    pipeline = PostProcessingPipeline(post_processing)
+    result = pipeline.execute(df)
+
+    pd.testing.assert_frame_equal(result, run_sequentially(df.copy(), post_processing))
+    # the input DataFrame is left untouched
+    pd.testing.assert_frame_equal(df, original)
+    assert [stat["operation"] for stat in pipeline.stats] == [
+        "cum",
+        "rolling",
+        "diff",
+        "compare",
+        "contribution",
+        "rename",
+    ]
+    assert pipeline.stats[0]["fused"] == 2
+    assert all(stat["memory_bytes"] > 0 for stat in pipeline.stats)
+    assert pipeline.stats[-1]["columns"] == len(result.columns)
+
+
+def test_stats_not_served_from_cache(
+    app_context: None,
+    mocker: MockerFixture,
+    df: pd.DataFrame,
+) -> None:
+    """
+    Test that the stats are only returned when the post processing runs.
+    """
+    cache = Cache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    query_result = QueryResult(df, "SELECT 1", timedelta(seconds=1))
+    query_result.post_processing_stats = [{"operation": "sort"}]
+
+    QueryCacheManager().set_query_result(
+        key="key",
+        query_result=query_result,
+        region=CacheRegion.DATA,
+    )
+    query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+
+    assert query_cache.is_cached
+    assert query_cache.post_processing_stats == []
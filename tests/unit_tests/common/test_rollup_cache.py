@@ -0,0 +1,280 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name, unused-argument
+from datetime import timedelta
+from typing import Any
+
+import pandas as pd
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+from superset.common.query_object import QueryObject
+from superset.common.utils.rollup_cache import (
+    can_roll_up_time_grain,
+    get_filter_mask,
+    get_metric_identity,
+    RollupCache,
+)
+from superset.models.helpers import QueryResult
+
+SUM_NUM = {
+    "expressionType": "SIMPLE",
+    "aggregate": "SUM",
+    "column": {"column_name": "num"},
+    "label": "SUM(num)",
+}
+TIME_RANGE = {"col": "ds", "op": "TEMPORAL_RANGE", "val": "Last year"}
+
+
+def time_column(time_grain: str) -> dict[str, Any]:
+    return {
+        "columnType": "BASE_AXIS",
+        "expressionType": "SQL",
+        "label": "ds",
+        "sqlExpression": "ds",
+        "timeGrain": time_grain,
+    }
+
+
+@pytest.fixture
+def rollup_cache(app_context: None, mocker: MockerFixture) -> RollupCache:
+    cache = Cache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    mocker.patch(
+        "superset.common.utils.rollup_cache.cache_manager",
+        data_cache=cache,
+    )
+    datasource = mocker.MagicMock(uid="1__table")
+    datasource.metrics = [mocker.MagicMock(expression="COUNT(*)")]
+    datasource.metrics[0].metric_name = "count"
+    datasource.has_extra_cache_key_calls.return_value = False
+    return RollupCache(
+        datasource,
+        lambda query_object: query_object.cache_key(datasource="1__table"),
+    )
+
+
+@pytest.fixture
+def cached_result(rollup_cache: RollupCache) -> None:
+    """
+    Cache a daily result by gender and state.
+    """
+    df = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(
+                ["2024-01-01", "2024-01-02", "2024-01-02", "2024-02-01", "2024-02-01"]
+            ),
+            "gender": ["boy", "girl", "boy", "boy", None],
+            "state": ["CA", "CA", "NY", "CA", "CA"],
+            "SUM(num)": [1.0, 2.0, 4.0, 8.0, None],
+            "count": [1, 2, 3, 4, 5],
+        }
+    )
+    query_object = QueryObject(
+        columns=[time_column("P1D"), "gender", "state"],
+        metrics=[SUM_NUM, "count"],
+        filters=[TIME_RANGE],
+        row_limit=100,
+    )
+    rollup_cache.add(
+        query_object,
+        QueryResult(df=df, query="SELECT ...", duration=timedelta(0)),
+    )
+
+
+def test_get_metric_identity() -> None:
+    """
+    Test which metrics can be re-aggregated.
+    """
+    saved_metrics = {"count": "COUNT(*)", "avg": "AVG(num)"}
+    assert get_metric_identity(SUM_NUM, saved_metrics) == ["SUM", "num"]
+    assert get_metric_identity("count", saved_metrics) == ["COUNT", "*"]
+    assert get_metric_identity("avg", saved_metrics) is None
+    assert get_metric_identity(
+        {"expressionType": "SQL", "sqlExpression": "max(num)", "label": "m"},
+        saved_metrics,
+    ) == ["MAX", "num"]
+    assert get_metric_identity({**SUM_NUM, "aggregate": "AVG"}, saved_metrics) is None
+    assert (
+        get_metric_identity(
+            {"expressionType": "SQL", "sqlExpression": "COUNT(DISTINCT a)"},
+            saved_metrics,
+        )
+        is None
+    )
+
+
+def test_can_roll_up_time_grain() -> None:
+    assert can_roll_up_time_grain("P1D", "P1D")
+    assert can_roll_up_time_grain("P1D", "P1M")
+    assert can_roll_up_time_grain(None, "P1Y")
+    assert not can_roll_up_time_grain("P1M", "P1D")
+    assert not can_roll_up_time_grain("P1D", "P1W")
+    assert not can_roll_up_time_grain("P1W", "P1M")
+
+
+def test_get_filter_mask() -> None:
+    """
+    Test that filters are only applied when the semantics match SQL.
+    """
+    series = pd.Series(["a", "b", None])
+    assert get_filter_mask(series, {"op": "IN", "val": ["a"]}).tolist() == [
+        True,
+        False,
+        False,
+    ]
+    assert get_filter_mask(series, {"op": "!=", "val": "a"}).tolist() == [
+        False,
+        True,
+        False,
+    ]
+    assert get_filter_mask(series, {"op": "IS NULL"}).tolist() == [False, False, True]
+    assert get_filter_mask(series, {"op": "==", "val": 1}) is None
+    assert get_filter_mask(series, {"op": "LIKE", "val": "a%"}) is None
+    assert get_filter_mask(pd.Series([1, 2]), {"op": "IN", "val": ["1"]}) is None
+
+
+def test_rollup(rollup_cache: RollupCache, cached_result: None) -> None:
+    """
+    Test rolling up a cached result to fewer dimensions and a coarser time grain.
+    """
+    query_object = QueryObject(
+        columns=[time_column("P1M"), "gender"],
+        metrics=[{**SUM_NUM, "label": "total"}, "count"],
+        filters=[TIME_RANGE],
+        orderby=[("count", False)],
+        row_limit=10,
+    )
+
+    result = rollup_cache.get(query_object)
+
+    assert result is not None
+    assert result.query.startswith("-- Rolled up from cached result rollup:")
+    assert result.query.endswith("SELECT ...")
+    assert result.df.fillna(-1).to_dict(orient="list") == {
+        "ds": [pd.Timestamp("2024-02-01"), pd.Timestamp("2024-01-01")]
+        + [pd.Timestamp("2024-02-01"), pd.Timestamp("2024-01-01")],
+        "gender": [-1, "boy", "boy", "girl"],
+        "total": [-1, 5.0, 8.0, 2.0],
+        "count": [5, 4, 4, 2],
+    }
+    assert result.df["gender"][0] is None
+
+
+def test_rollup_extra_filters(rollup_cache: RollupCache, cached_result: None) -> None:
+    """
+    Test rolling up a cached result with stricter filters and no dimensions.
+    """
+    query_object = QueryObject(
+        metrics=["count"],
+        filters=[TIME_RANGE, {"col": "state", "op": "IN", "val": ["CA"]}],
+    )
+
+    result = rollup_cache.get(query_object)
+
+    assert result is not None
+    assert result.df.to_dict(orient="list") == {"count": [12]}
+    assert result.applied_filter_columns == ["state"]
+
+
+@pytest.mark.parametrize(
+    "query_object",
+    [
+        # finer time grain
+        QueryObject(
+            columns=[time_column("PT1H")], metrics=["count"], filters=[TIME_RANGE]
+        ),
+        # dimension that is not cached
+        QueryObject(columns=["name"], metrics=["count"], filters=[TIME_RANGE]),
+        # metric that is not cached
+        QueryObject(
+            metrics=[{**SUM_NUM, "column": {"column_name": "x"}}], filters=[TIME_RANGE]
+        ),
+        # looser filters
+        QueryObject(metrics=["count"]),
+        # filter on a column that is not cached
+        QueryObject(
+            metrics=["count"],
+            filters=[TIME_RANGE, {"col": "name", "op": "==", "val": "Bob"}],
+        ),
+        # different signature
+        QueryObject(
+            metrics=["count"],
+            filters=[TIME_RANGE],
+            extras={"where": "num > 1"},
+        ),
+        # metric that is not additive
+        QueryObject(metrics=[{**SUM_NUM, "aggregate": "AVG"}], filters=[TIME_RANGE]),
+    ],
+)
+def test_rollup_miss(
+    rollup_cache: RollupCache,
+    cached_result: None,
+    query_object: QueryObject,
+) -> None:
+    """
+    Test queries that cannot be rolled up from the cached result.
+    """
+    assert rollup_cache.get(query_object) is None
+
+
+def test_add_truncated_result(rollup_cache: RollupCache) -> None:
+    """
+    Test that results truncated by the row limit are not cached.
+    """
+    query_object = QueryObject(columns=["gender"], metrics=["count"], row_limit=2)
+    df = pd.DataFrame({"gender": ["boy", "girl"], "count": [1, 2]})
+    rollup_cache.add(
+        query_object,
+        QueryResult(df=df, query="SELECT ...", duration=timedelta(0)),
+    )
+
+    assert rollup_cache.get(QueryObject(metrics=["count"])) is None
+
+
+def test_query_datasource_rollup(
+    rollup_cache: RollupCache,
+    cached_result: None,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that the query context processor only queries the datasource on a miss.
+    """
+    from superset.common.query_context_processor import QueryContextProcessor
+
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"ROLLUP_CACHE_ENABLED": True},
+    )
+    mocker.patch(
+        "superset.common.query_context_processor.RollupCache",
+        return_value=rollup_cache,
+    )
+    query_context = mocker.MagicMock(force=False)
+    processor = QueryContextProcessor(query_context)
+
+    result = processor._query_datasource(
+        QueryObject(metrics=["count"], filters=[TIME_RANGE])
+    )
+    assert result.df.to_dict(orient="list") == {"count": [15]}
+    query_context.datasource.query.assert_not_called()
+
+    query_context.force = True
+    processor._query_datasource(QueryObject(metrics=["count"], filters=[TIME_RANGE]))
+    query_context.datasource.query.assert_called_once()
@@ -15,19 +15,27 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import os
+import time
+from importlib.util import find_spec
+from pathlib import Path
+from uuid import uuid4
+
 import pandas as pd
 import pytest
 from pytest_mock import MockerFixture
-from sqlalchemy import create_engine
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.orm.session import Session
 
-from superset.connectors.sqla.models import SqlaTable, TableColumn
+from superset.common.db_query_status import QueryStatus
+from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
 from superset.daos.dataset import DatasetDAO
 from superset.exceptions import OAuth2RedirectError
 from superset.models.core import Database
 from superset.sql_parse import Table
 from superset.superset_typing import QueryObjectDict
+from superset.utils import json
 
 
 def test_query_bubbles_errors(mocker: MockerFixture) -> None:
@@ -287,3 +295,118 @@ def test_normalize_prequery_result_type_custom_sql() -> None:
         sqla_table._normalize_prequery_result_type(row, dimension, columns_by_name)
         == "Car"
     )
+
+
+def get_extract_table(mocker: MockerFixture, tmp_path: Path) -> SqlaTable:
+    mocker.patch.dict(
+        "superset.connectors.sqla.models.config",
+        {"DATASET_EXTRACTS_ENABLED": True, "DATASET_EXTRACT_PATH": str(tmp_path)},
+    )
+    return SqlaTable(
+        id=1,
+        uuid=uuid4(),
+        table_name="my_sqla_table",
+        columns=[TableColumn(column_name="ds", is_dttm=True, type="TIMESTAMP")],
+        metrics=[SqlMetric(metric_name="count", expression="COUNT(*)")],
+        main_dttm_col="ds",
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+        extra=json.dumps({"extract": {"refresh_interval": 60}}),
+    )
+
+
+def test_get_extract_datasource(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test that a dataset with a fresh extract is copied to read it with DuckDB.
+    """
+    mocker.patch("superset.connectors.sqla.models.has_duckdb", return_value=True)
+    sqla_table = get_extract_table(mocker, tmp_path)
+    assert sqla_table.extract_settings == {"refresh_interval": 60, "max_age": 120}
+    assert sqla_table.get_extract_datasource() is None
+
+    Path(sqla_table.extract_path).touch()
+    extract = sqla_table.get_extract_datasource()
+    assert extract is not None
+    assert extract.id == 1
+    assert extract.sql == "SELECT * FROM superset_extract"
+    assert extract.setup_statements == (
+        "CREATE VIEW superset_extract AS "
+        f"SELECT * FROM read_parquet('{sqla_table.extract_path}')",
+        f"SET allowed_paths = ['{sqla_table.extract_path}']",
+        "SET enable_external_access = false",
+        "SET lock_configuration = true",
+    )
+    assert sqla_table.setup_statements == ()
+    assert extract.database.sqlalchemy_uri == "duckdb:///:memory:"
+    assert extract.main_dttm_col == "ds"
+    assert [(col.column_name, col.is_dttm) for col in extract.columns] == [("ds", True)]
+    assert [metric.expression for metric in extract.metrics] == ["COUNT(*)"]
+    assert extract.extract_settings is None
+    assert sqla_table.columns[0].table is sqla_table
+
+    # stale extract
+    os.utime(sqla_table.extract_path, (time.time() - 121, time.time() - 121))
+    assert sqla_table.get_extract_datasource() is None
+
+
+@pytest.mark.skipif(not find_spec("duckdb_engine"), reason="requires duckdb")
+def test_extract_file_access(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test that queries on an extract cannot read other files, e.g. in adhoc metrics.
+    """
+    sqla_table = get_extract_table(mocker, tmp_path)
+    pd.DataFrame({"ds": [pd.Timestamp("2024-01-01")]}).to_parquet(
+        sqla_table.extract_path
+    )
+    extract = sqla_table.get_extract_datasource()
+    assert extract is not None
+
+    engine = create_engine(extract.database.sqlalchemy_uri)
+    with engine.connect() as conn:
+        for statement in extract.setup_statements:
+            conn.execute(text(statement))
+        assert conn.execute(text(f"SELECT COUNT(*) FROM ({extract.sql})")).scalar() == 1
+        with pytest.raises(DBAPIError):
+            conn.execute(
+                text(
+                    "SELECT MAX(LENGTH(read_text('/etc/hosts'))) AS metric "
+                    f"FROM ({extract.sql}) AS virtual_table"
+                )
+            )
+        with pytest.raises(DBAPIError):
+            conn.execute(text("SET enable_external_access = true"))
+
+
+@pytest.mark.parametrize("extract_status", [QueryStatus.SUCCESS, QueryStatus.FAILED])
+def test_query_extract(mocker: MockerFixture, extract_status: QueryStatus) -> None:
+    """
+    Test that queries are answered from the extract, falling back to the database.
+    """
+    database = mocker.MagicMock()
+    database.get_df.return_value = pd.DataFrame({"a": [1]})
+    sqla_table = SqlaTable(
+        table_name="my_sqla_table",
+        columns=[],
+        metrics=[],
+        database=database,
+    )
+    mocker.patch.object(
+        sqla_table,
+        "get_query_str_extended",
+        return_value=mocker.MagicMock(sql="SELECT a FROM my_sqla_table"),
+    )
+    extract = mocker.MagicMock()
+    extract.query.return_value.status = extract_status
+    mocker.patch.object(
+        sqla_table,
+        "get_extract_datasource",
+        return_value=extract,
+    )
+
+    result = sqla_table.query({})  # type: ignore
+    if extract_status == QueryStatus.SUCCESS:
+        assert result is extract.query.return_value
+        database.get_df.assert_not_called()
+    else:
+        assert result.status == QueryStatus.SUCCESS
+        assert result.query == "SELECT a FROM my_sqla_table"
+        assert database.get_df.call_args[0][0] == "SELECT a FROM my_sqla_table"
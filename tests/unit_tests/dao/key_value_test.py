@@ -393,3 +393,74 @@ def test_delete_entry_missing(
     from superset.daos.key_value import KeyValueDAO
 
     assert KeyValueDAO.delete_entry(resource=RESOURCE, key=12345678) is False
+
+
+def test_get_values(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    missing_key = UUID("00000000-0000-0000-0000-000000000000")
+    assert KeyValueDAO.get_values(
+        resource=RESOURCE,
+        keys=[UUID_KEY, missing_key],
+        codec=JSON_CODEC,
+    ) == {UUID_KEY: JSON_VALUE}
+
+
+def test_upsert_entries(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    new_key = UUID("5f4b7f5e-5ab1-4f9f-a0c6-08f51d6f0b3e")
+    KeyValueDAO.upsert_entries(
+        resource=RESOURCE,
+        values={UUID_KEY: NEW_VALUE, new_key: JSON_VALUE},
+        codec=JSON_CODEC,
+    )
+    assert KeyValueDAO.get_values(
+        resource=RESOURCE,
+        keys=[UUID_KEY, new_key],
+        codec=JSON_CODEC,
+    ) == {UUID_KEY: NEW_VALUE, new_key: JSON_VALUE}
+
+
+def test_delete_entries(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    assert KeyValueDAO.delete_entries(resource=RESOURCE, keys=[UUID_KEY]) == 1
+    assert KeyValueDAO.get_entry(resource=RESOURCE, key=UUID_KEY) is None
+    assert KeyValueDAO.delete_entries(resource=RESOURCE, keys=[]) == 0
+
+
+def test_delete_expired_entries_batched(
+    app_context: AppContext,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+    from superset.key_value.models import KeyValueEntry
+
+    expired = datetime.now() - timedelta(days=1)
+    for expires_on in (expired, expired, expired, None):
+        db.session.add(
+            KeyValueEntry(
+                resource=RESOURCE,
+                value=JSON_CODEC.encode(JSON_VALUE),
+                expires_on=expires_on,
+            )
+        )
+    db.session.flush()
+
+    assert KeyValueDAO.delete_expired_entries(RESOURCE, batch_size=2) == 2
+    assert KeyValueDAO.delete_expired_entries(RESOURCE, batch_size=2) == 1
+    assert KeyValueDAO.delete_expired_entries(RESOURCE, batch_size=2) == 0
+    assert db.session.query(KeyValueEntry).filter_by(resource=RESOURCE).count() == 1
@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+from typing import Any
+
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset import db, security_manager
+
+
+def test_get_bootstrap(
+    session: Session,
+    client: Any,
+    full_api_access: None,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test the bootstrap payload and its conditional requests.
+    """
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.dashboards.filters import DashboardAccessFilter
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+    from superset.utils import json
+
+    mocker.patch.object(
+        DashboardAccessFilter, "apply", lambda self, query, value: query
+    )
+    mocker.patch.object(Dashboard, "raise_for_access")
+    mocker.patch.object(security_manager, "get_rls_cache_key", return_value=[])
+    Dashboard.metadata.create_all(db.session.get_bind())
+
+    dataset = SqlaTable(
+        table_name="my_table",
+        columns=[
+            TableColumn(column_name="a", type="INTEGER"),
+            TableColumn(column_name="b", type="INTEGER"),
+        ],
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+    )
+    db.session.add(dataset)
+    db.session.flush()
+    chart = Slice(
+        slice_name="my_chart",
+        datasource_type="table",
+        datasource_id=dataset.id,
+        viz_type="table",
+        params=json.dumps({"groupby": ["a"]}),
+    )
+    dashboard = Dashboard(
+        dashboard_title="my_dashboard",
+        slug="my_dashboard",
+        slices=[chart],
+        published=True,
+    )
+    db.session.add(dashboard)
+    db.session.flush()
+
+    response = client.get("/api/v1/dashboard/my_dashboard/bootstrap")
+    assert response.status_code == 200
+    result = response.json["result"]
+    assert result["dashboard"]["dashboard_title"] == "my_dashboard"
+    assert [chart["slice_name"] for chart in result["charts"]] == ["my_chart"]
+    assert [column["column_name"] for column in result["datasets"][0]["columns"]] == [
+        "a"
+    ]
+    assert result["tabs"] == {}
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        "/api/v1/dashboard/my_dashboard/bootstrap",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    # changing a chart invalidates the ETag
+    chart.changed_on = datetime(2100, 1, 1)
+    db.session.flush()
+    response = client.get(
+        "/api/v1/dashboard/my_dashboard/bootstrap",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    etag = response.headers["ETag"]
+
+    # so do changes to the RLS filters of the user
+    mocker.patch.object(security_manager, "get_rls_cache_key", return_value=["a=1"])
+    response = client.get(
+        "/api/v1/dashboard/my_dashboard/bootstrap",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # the datasources are loaded once for the ETag and the payload; the thumbnail
+    # digest loads them separately
+    mocker.patch.object(Dashboard, "digest", new_callable=mocker.PropertyMock)
+    datasources = mocker.patch.object(
+        Dashboard,
+        "datasources",
+        new_callable=mocker.PropertyMock,
+        return_value={dataset},
+    )
+    response = client.get("/api/v1/dashboard/my_dashboard/bootstrap")
+    assert response.status_code == 200
+    result = response.json["result"]
+    assert [column["column_name"] for column in result["datasets"][0]["columns"]] == [
+        "a"
+    ]
+    datasources.assert_called_once()
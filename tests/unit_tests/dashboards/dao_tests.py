@@ -16,8 +16,11 @@
 # under the License.
 
 from collections.abc import Iterator
+from datetime import datetime
 
 import pytest
+from flask import Flask
+from pytest_mock import MockerFixture
 from sqlalchemy.orm.session import Session
 
 
@@ -73,3 +76,72 @@ def test_remove_favorite(session: Session) -> None:
 
     DashboardDAO.remove_favorite(dashboard)
     assert len(DashboardDAO.favorited_ids([dashboard])) == 0
+
+
+def test_datasets_trimmed_for_slices_cached(
+    app: Flask, session: Session, mocker: MockerFixture
+) -> None:
+    from flask_caching import Cache
+
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+    from superset.utils import json
+
+    engine = session.get_bind()
+    Dashboard.metadata.create_all(engine)  # pylint: disable=no-member
+
+    sqla_table = SqlaTable(
+        table_name="my_table",
+        columns=[
+            TableColumn(column_name="a", type="INTEGER"),
+            TableColumn(column_name="b", type="INTEGER"),
+            TableColumn(column_name="c", type="INTEGER"),
+        ],
+        metrics=[
+            SqlMetric(metric_name="count", expression="COUNT(*)"),
+            SqlMetric(metric_name="unused", expression="MAX(c)"),
+        ],
+        database=Database(database_name="my_database", sqlalchemy_uri="sqlite://"),
+    )
+    session.add(sqla_table)
+    session.flush()
+    slices = [
+        Slice(
+            slice_name=f"chart_{column}",
+            datasource_type="table",
+            datasource_id=sqla_table.id,
+            viz_type="table",
+            params=json.dumps({"groupby": [column], "metrics": ["count"]}),
+        )
+        for column in ["a", "b"]
+    ]
+    dashboard = Dashboard(dashboard_title="dashboard", slices=slices)
+    session.add(dashboard)
+    session.flush()
+
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch("superset.extensions.cache_manager._cache", cache)
+    data_for_slices = mocker.spy(SqlaTable, "data_for_slices")
+
+    result = dashboard.datasets_trimmed_for_slices()
+    assert len(result) == 1
+    assert {column["column_name"] for column in result[0]["columns"]} == {"a", "b"}
+    assert [metric["metric_name"] for metric in result[0]["metrics"]] == ["count"]
+
+    assert dashboard.datasets_trimmed_for_slices() == result
+    assert data_for_slices.call_count == 1
+
+    # the payload is recomputed when one of the charts changes
+    slices[1].changed_on = datetime(2024, 1, 1)
+    dashboard.datasets_trimmed_for_slices()
+    assert data_for_slices.call_count == 2
+
+    # and for users with other roles
+    mocker.patch(
+        "superset.models.dashboard.security_manager.get_roles_cache_key",
+        return_value="roles-1",
+    )
+    dashboard.datasets_trimmed_for_slices()
+    assert data_for_slices.call_count == 3
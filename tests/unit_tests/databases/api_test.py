@@ -941,7 +941,8 @@ def test_csv_upload(
     """
     init_mock = mocker.patch.object(UploadCommand, "__init__")
     init_mock.return_value = None
-    _ = mocker.patch.object(UploadCommand, "run")
+    report = {"chunks": 1, "rows": 3, "duration_ms": 1.5, "rows_per_second": 2000.0}
+    _ = mocker.patch.object(UploadCommand, "run", return_value=report)
     reader_mock = mocker.patch.object(CSVReader, "__init__")
     reader_mock.return_value = None
     response = client.post(
@@ -950,7 +951,7 @@ def test_csv_upload(
         content_type="multipart/form-data",
     )
     assert response.status_code == 201
-    assert response.json == {"message": "OK"}
+    assert response.json == {"message": "OK", "result": report}
     init_mock.assert_called_with(*upload_called_with)
     reader_mock.assert_called_with(*reader_called_with)
 
@@ -1283,7 +1284,8 @@ def test_excel_upload(
     """
     init_mock = mocker.patch.object(UploadCommand, "__init__")
     init_mock.return_value = None
-    _ = mocker.patch.object(UploadCommand, "run")
+    report = {"chunks": 1, "rows": 3, "duration_ms": 1.5, "rows_per_second": 2000.0}
+    _ = mocker.patch.object(UploadCommand, "run", return_value=report)
     reader_mock = mocker.patch.object(ExcelReader, "__init__")
     reader_mock.return_value = None
     response = client.post(
@@ -1292,7 +1294,7 @@ def test_excel_upload(
         content_type="multipart/form-data",
     )
     assert response.status_code == 201
-    assert response.json == {"message": "OK"}
+    assert response.json == {"message": "OK", "result": report}
     init_mock.assert_called_with(*upload_called_with)
     reader_mock.assert_called_with(*reader_called_with)
 
@@ -1489,7 +1491,8 @@ def test_columnar_upload(
     """
     init_mock = mocker.patch.object(UploadCommand, "__init__")
     init_mock.return_value = None
-    _ = mocker.patch.object(UploadCommand, "run")
+    report = {"chunks": 1, "rows": 3, "duration_ms": 1.5, "rows_per_second": 2000.0}
+    _ = mocker.patch.object(UploadCommand, "run", return_value=report)
     reader_mock = mocker.patch.object(ColumnarReader, "__init__")
     reader_mock.return_value = None
     response = client.post(
@@ -1498,7 +1501,7 @@ def test_columnar_upload(
         content_type="multipart/form-data",
     )
     assert response.status_code == 201
-    assert response.json == {"message": "OK"}
+    assert response.json == {"message": "OK", "result": report}
     init_mock.assert_called_with(*upload_called_with)
     reader_mock.assert_called_with(*reader_called_with)
 
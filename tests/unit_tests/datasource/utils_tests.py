@@ -0,0 +1,135 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name, unused-argument
+
+from typing import Any
+
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+from superset.datasource.utils import (
+    get_column_values,
+    index_column_values,
+    search_column_values,
+)
+
+
+@pytest.fixture
+def datasource(app_context: None, mocker: MockerFixture) -> Any:
+    cache = Cache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    mocker.patch("superset.datasource.utils.cache_manager", data_cache=cache)
+    mocker.patch(
+        "superset.datasource.utils.security_manager",
+        new=mocker.MagicMock(**{"get_rls_cache_key.return_value": []}),
+    )
+    mocker.patch.dict(current_app.config, {"FILTER_SELECT_CACHE_TIMEOUT": 60})
+
+    datasource = mocker.MagicMock(
+        uid="1__table",
+        changed_on=None,
+        fetch_values_predicate=None,
+    )
+    datasource.has_extra_cache_key_calls.return_value = False
+    name = mocker.MagicMock(column_name="name", is_string=True)
+    num = mocker.MagicMock(column_name="num", is_string=False)
+    datasource.columns = [name, num]
+    return datasource
+
+
+def test_search_column_values() -> None:
+    values = [None, "alice", "Alan", "bob", 10, 1]
+    keys, indexes = index_column_values(values)
+    assert keys == ["", "1", "10", "alan", "alice", "bob"]
+    assert indexes == [0, 5, 4, 2, 1, 3]
+    assert search_column_values(values, keys, indexes, "al", 10) == ["alice", "Alan"]
+    assert search_column_values(values, keys, indexes, "AL", 1) == ["alice"]
+    assert search_column_values(values, keys, indexes, "1", 10) == [10, 1]
+    assert search_column_values(values, keys, indexes, "c", 10) == []
+
+
+def test_get_column_values_cached(datasource: Any) -> None:
+    """
+    Test that the values are cached in the order of the database, and searched from
+    the cache.
+    """
+    datasource.values_for_column.return_value = ["bob", "Alice", None, "alan"]
+
+    assert get_column_values(datasource, "name", 10) == ["bob", "Alice", None, "alan"]
+    assert get_column_values(datasource, "name", 10) == ["bob", "Alice", None, "alan"]
+    assert get_column_values(datasource, "name", 10, search="AL") == ["Alice", "alan"]
+    datasource.values_for_column.assert_called_once_with(
+        column_name="name",
+        limit=10,
+        denormalize_column=False,
+        search=None,
+    )
+
+
+def test_get_column_values_truncated(datasource: Any) -> None:
+    """
+    Test that searches are pushed down when the cached values are truncated.
+    """
+    datasource.values_for_column.return_value = ["alan", "bob"]
+    get_column_values(datasource, "name", 2)
+
+    datasource.values_for_column.return_value = ["alan", "Alice"]
+    assert get_column_values(datasource, "name", 2, search="al") == ["alan", "Alice"]
+    datasource.values_for_column.assert_called_with(
+        column_name="name",
+        limit=2,
+        denormalize_column=False,
+        search="al",
+    )
+
+    # the result of a shorter prefix is incomplete as well
+    datasource.values_for_column.return_value = ["Alice"]
+    assert get_column_values(datasource, "name", 2, search="ali") == ["Alice"]
+    assert datasource.values_for_column.call_count == 3
+
+    # but a complete result of a shorter prefix is used
+    assert get_column_values(datasource, "name", 2, search="alic") == ["Alice"]
+    assert datasource.values_for_column.call_count == 3
+
+
+def test_get_column_values_not_string(datasource: Any) -> None:
+    """
+    Test that searches are not pushed down for columns that are not strings.
+    """
+    datasource.values_for_column.return_value = [10, 1, 2]
+
+    assert get_column_values(datasource, "num", 10, search="1") == [10, 1]
+    datasource.values_for_column.assert_called_with(
+        column_name="num",
+        limit=10,
+        denormalize_column=False,
+        search=None,
+    )
+
+
+def test_get_column_values_not_cached(datasource: Any) -> None:
+    """
+    Test that values depending on the user or the request are not cached.
+    """
+    datasource.has_extra_cache_key_calls.return_value = True
+    datasource.values_for_column.return_value = ["a"]
+
+    get_column_values(datasource, "name", 10)
+    get_column_values(datasource, "name", 10)
+    assert datasource.values_for_column.call_count == 2
@@ -489,3 +489,21 @@ def test_adjust_engine_params_no_catalog() -> None:
         catalog="other-project",
     )[0]
     assert str(uri) == "bigquery://other-project/"
+
+
+def test_get_tablesample_clause() -> None:
+    """
+    Test that the sampled percentage is followed by `PERCENT`.
+    """
+    from sqlalchemy import column, table
+
+    from superset.db_engine_specs.bigquery import BigQueryEngineSpec
+
+    tbl = table("t", column("a"))
+    qry = select([column("a")]).select_from(
+        BigQueryEngineSpec.get_tablesample_clause(tbl, 10)
+    )
+    assert (
+        str(qry.compile(dialect=BigQueryDialect()))
+        == "SELECT `a` \nFROM `t` AS `t` TABLESAMPLE SYSTEM(10.0 PERCENT)"
+    )
@@ -182,6 +182,26 @@ def test_fetch_data() -> None:
             assert result == "converted"
 
 
+def test_fetch_data_chunks() -> None:
+    """
+    Test that the rows fetched in batches are converted to tuples too.
+    """
+    from superset.db_engine_specs.mssql import MssqlEngineSpec
+
+    class Row(list[Any]):
+        """
+        Stands in for ``pyodbc.Row``.
+        """
+
+    cursor = mock.MagicMock()
+    cursor.description = [("a", None), ("b", None)]
+    cursor.fetchmany.side_effect = [[Row([1, "foo"]), Row([2, "bar"])], []]
+
+    assert list(MssqlEngineSpec.fetch_data_chunks(cursor, 2)) == [
+        [(1, "foo"), (2, "bar")]
+    ]
+
+
 @pytest.mark.parametrize(
     "original,expected",
     [
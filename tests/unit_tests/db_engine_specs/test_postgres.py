@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import re
 from datetime import datetime
 from typing import Any, Optional
 
@@ -243,3 +244,77 @@ def test_timegrain_expressions(time_grain: str, expected_result: str) -> None:
         spec.get_timestamp_expr(col=column("col"), pdf=None, time_grain=time_grain)
     )
     assert actual == expected_result
+
+
+def test_get_bulk_load_method(mocker: MockerFixture) -> None:
+    database = mocker.MagicMock()
+    database.driver = "psycopg2"
+    assert spec.get_bulk_load_method(database) == spec._copy_from_stdin
+
+    database.driver = "psycopg"
+    assert spec.get_bulk_load_method(database) is None
+
+
+def test_copy_from_stdin(mocker: MockerFixture) -> None:
+    from sqlalchemy import Column, Integer, MetaData, String, Table
+    from sqlalchemy.dialects.postgresql import dialect
+
+    pd_table = mocker.MagicMock()
+    pd_table.table = Table(
+        "my table",
+        MetaData(),
+        Column("a", Integer),
+        Column("b", String),
+        schema="public",
+    )
+    conn = mocker.MagicMock()
+    conn.dialect = dialect()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    buffers = []
+    cursor.copy_expert.side_effect = lambda sql, buffer: buffers.append(
+        buffer.getvalue()
+    )
+
+    rows = [(1, "x,y"), (2, None), (3, ""), (4, "\\N"), (5, 'say "hi"')]
+    spec._copy_from_stdin(pd_table, conn, ["a", "b"], iter(rows))
+
+    cursor.copy_expert.assert_called_once()
+    assert cursor.copy_expert.call_args[0][0] == (
+        'COPY public."my table" (a, b) FROM STDIN WITH (FORMAT csv)'
+    )
+    assert buffers == ['"1","x,y"\n"2",\n"3",""\n"4","\\N"\n"5","say ""hi"""\n']
+    assert read_copy_csv(buffers[0]) == [
+        ("1", "x,y"),
+        ("2", None),
+        ("3", ""),
+        ("4", "\\N"),
+        ("5", 'say "hi"'),
+    ]
+
+
+def read_copy_csv(data: str) -> list[tuple[Optional[str], ...]]:
+    """
+    Read rows like `COPY ... WITH (FORMAT csv)` does, where only unquoted empty
+    values are nulls.
+    """
+    return [
+        tuple(
+            None if value == "" else value[1:-1].replace('""', '"')
+            for value in re.findall(r'(?:^|,)("(?:[^"]|"")*"|[^,]*)', line)
+        )
+        for line in data.splitlines()
+    ]
+
+
+def test_get_server_side_cursor(mocker: MockerFixture) -> None:
+    """
+    Test that a named cursor is used, falling back to a regular cursor for drivers
+    without named cursors.
+    """
+    connection = mocker.MagicMock()
+    assert spec.get_server_side_cursor(connection) == connection.cursor.return_value
+    assert connection.cursor.call_args[1]["name"].startswith("superset_")
+
+    connection.cursor.side_effect = [TypeError(), mocker.sentinel.cursor]
+    assert spec.get_server_side_cursor(connection) == mocker.sentinel.cursor
+    connection.cursor.assert_called_with()
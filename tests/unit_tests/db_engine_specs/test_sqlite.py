@@ -129,3 +129,55 @@ def test_time_grain_expressions(dttm: str, grain: str, expected: str) -> None:
     sql = f"SELECT {expression} FROM t"
     result = connection.execute(sql).scalar()
     assert result == expected
+
+
+def test_df_to_sql_bulk_load(tmp_path) -> None:
+    import pandas as pd
+
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.models.core import Database
+    from superset.sql.parse import Table
+
+    database = Database(
+        database_name="db",
+        sqlalchemy_uri=f"sqlite:///{tmp_path / 'upload.db'}",
+    )
+    df = pd.DataFrame({"a": range(2000), "b": ["x", None] * 1000})
+
+    SqliteEngineSpec.df_to_sql(
+        database,
+        Table("t"),
+        df,
+        to_sql_kwargs={"chunksize": 1000, "if_exists": "fail", "index": False},
+    )
+
+    engine = create_engine(database.sqlalchemy_uri)
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql(
+            "SELECT COUNT(*), COUNT(b), SUM(a) FROM t"
+        ).fetchone() == (2000, 1000, sum(range(2000)))
+
+
+def test_get_schema_columns() -> None:
+    from sqlalchemy import inspect
+
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.sql_parse import Table
+
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE t (a INTEGER PRIMARY KEY, b VARCHAR(10) NOT NULL, c)"
+        )
+        conn.exec_driver_sql("CREATE VIEW v AS SELECT a, b FROM t")
+
+    inspector = inspect(engine)
+    schema_columns = SqliteEngineSpec.get_schema_columns(inspector, None)
+
+    assert schema_columns is not None
+    assert set(schema_columns) == {"t", "v"}
+    for table_name, columns in schema_columns.items():
+        expected = SqliteEngineSpec.get_columns(inspector, Table(table_name))
+        assert [(col["column_name"], str(col["type"])) for col in columns] == [
+            (col["column_name"], str(col["type"])) for col in expected
+        ]
@@ -25,7 +25,10 @@ from freezegun import freeze_time
 from sqlalchemy.orm import Session, sessionmaker
 
 from superset import db
-from superset.distributed_lock import KeyValueDistributedLock
+from superset.distributed_lock import (
+    KeyValueDistributedLock,
+    KeyValueDistributedSemaphore,
+)
 from superset.distributed_lock.types import LockValue
 from superset.distributed_lock.utils import get_key
 from superset.exceptions import CreateKeyValueDistributedLockFailedException
@@ -99,3 +102,33 @@ def test_key_value_distributed_lock_expired() -> None:
                 assert _get_lock(MAIN_KEY, session) is None
 
         assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_key_value_distributed_semaphore() -> None:
+    """
+    Test acquiring and releasing the slots of a distributed semaphore.
+    """
+    session = _get_other_session()
+    first_key = get_key("ns", a=1, slot=0)
+    second_key = get_key("ns", a=1, slot=1)
+
+    with freeze_time("2021-01-01"):
+        with KeyValueDistributedSemaphore("ns", 2, a=1) as key:
+            assert key == first_key
+            with KeyValueDistributedSemaphore("ns", 2, a=1) as key:
+                assert key == second_key
+                assert _get_lock(first_key, session) == LOCK_VALUE
+                assert _get_lock(second_key, session) == LOCK_VALUE
+
+                with pytest.raises(CreateKeyValueDistributedLockFailedException):
+                    with KeyValueDistributedSemaphore("ns", 2, a=1):
+                        pass
+
+            assert _get_lock(second_key, session) is None
+
+        # slots are released when the context exits with an error
+        with pytest.raises(ValueError):
+            with KeyValueDistributedSemaphore("ns", 2, a=1):
+                raise ValueError()
+
+        assert _get_lock(first_key, session) is None
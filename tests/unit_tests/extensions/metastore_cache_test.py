@@ -0,0 +1,91 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=unused-argument, import-outside-toplevel
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from flask.ctx import AppContext
+from freezegun import freeze_time
+
+from superset.extensions import db
+from superset.key_value.types import (
+    JsonKeyValueCodec,
+    KeyValueResource,
+    MsgpackKeyValueCodec,
+    ZstdKeyValueCodec,
+)
+from tests.unit_tests.fixtures.common import after_each  # noqa: F401
+
+NAMESPACE = UUID("ee173d1b-ccf3-40aa-941c-985c15224496")
+
+
+def test_get_set_delete_many(
+    app_context: AppContext,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.extensions.metastore_cache import SupersetMetastoreCache
+
+    cache = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        default_timeout=600,
+        codec=ZstdKeyValueCodec(MsgpackKeyValueCodec()),
+    )
+    cache.set("foo", {"value": 1})
+    assert cache.set_many({"foo": {"value": 2}, "bar": [1, 2]}) == ["foo", "bar"]
+    assert cache.get_many("foo", "bar", "baz") == [{"value": 2}, [1, 2], None]
+    assert cache.get_dict("foo", "bar") == {"foo": {"value": 2}, "bar": [1, 2]}
+
+    cache.delete_many("foo", "baz")
+    assert cache.get_many("foo", "bar") == [None, [1, 2]]
+    cache.delete_many("bar")
+
+
+def test_prune_expired_entries(
+    app_context: AppContext,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.commands.key_value.prune import KeyValuePruneExpiredCommand
+    from superset.extensions.metastore_cache import SupersetMetastoreCache
+    from superset.key_value.models import KeyValueEntry
+
+    cache = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        default_timeout=600,
+        codec=JsonKeyValueCodec(),
+    )
+    dttm = datetime(2024, 1, 1)
+    with freeze_time(dttm):
+        cache.set_many({f"key{i}": i for i in range(5)}, timeout=60)
+        cache.set("forever", "value", timeout=0)
+
+    with freeze_time(dttm + timedelta(minutes=2)):
+        assert cache.get_many("key0", "forever") == [None, "value"]
+        deleted = KeyValuePruneExpiredCommand(
+            KeyValueResource.METASTORE_CACHE,
+            batch_size=2,
+        ).run()
+
+    assert deleted == 5
+    keys = [cache.get_key(key) for key in (*(f"key{i}" for i in range(5)), "forever")]
+    assert [
+        entry.uuid
+        for entry in db.session.query(KeyValueEntry).filter(
+            KeyValueEntry.uuid.in_(keys)
+        )
+    ] == [cache.get_key("forever")]
@@ -18,14 +18,18 @@ from contextlib import nullcontext
 from typing import Any
 
 import pytest
+from flask import current_app
 from marshmallow import Schema
+from pytest_mock import MockerFixture
 
 from superset.dashboards.permalink.schemas import DashboardPermalinkSchema
 from superset.key_value.exceptions import KeyValueCodecEncodeException
 from superset.key_value.types import (
     JsonKeyValueCodec,
     MarshmallowKeyValueCodec,
+    MsgpackKeyValueCodec,
     PickleKeyValueCodec,
+    ZstdKeyValueCodec,
 )
 
 
@@ -120,3 +124,52 @@ def test_pickle_codec(input_: Any, expected_result: Any):
     codec = PickleKeyValueCodec()
     encoded_value = codec.encode(input_)
     assert expected_result == codec.decode(encoded_value)
+
+
+@pytest.mark.parametrize(
+    "input_,expected_result",
+    [
+        (
+            {"foo": "bar", "baz": [1, 2.5, None, True]},
+            {"foo": "bar", "baz": [1, 2.5, None, True]},
+        ),
+        (
+            {"foo": (1, 2, 3)},
+            {"foo": [1, 2, 3]},
+        ),
+        (
+            object(),
+            KeyValueCodecEncodeException(),
+        ),
+    ],
+)
+def test_msgpack_codec(input_: Any, expected_result: Any):
+    cm = (
+        pytest.raises(type(expected_result))
+        if isinstance(expected_result, Exception)
+        else nullcontext()
+    )
+    with cm:
+        codec = MsgpackKeyValueCodec()
+        encoded_value = codec.encode(input_)
+        assert expected_result == codec.decode(encoded_value)
+
+
+def test_zstd_codec(app_context: None, mocker: MockerFixture):
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+    value = {"foo": "bar" * 1000}
+
+    codec = ZstdKeyValueCodec(JsonKeyValueCodec())
+    encoded_value = codec.encode(value)
+    assert len(encoded_value) < len(JsonKeyValueCodec().encode(value))
+    assert codec.decode(encoded_value) == value
+    stats_logger.gauge.assert_any_call(
+        "key_value.codec.raw_size", len(JsonKeyValueCodec().encode(value))
+    )
+    stats_logger.gauge.assert_any_call(
+        "key_value.codec.compressed_size", len(encoded_value)
+    )
+
+    # values written before switching to the compressed codec are still readable
+    assert codec.decode(JsonKeyValueCodec().encode(value)) == value
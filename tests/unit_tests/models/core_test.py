@@ -577,3 +577,76 @@ def test_engine_context_manager(mocker: MockerFixture) -> None:
         source=None,
         sqlalchemy_uri="trino://",
     )
+
+
+def test_get_df_chunks(mocker: MockerFixture, app_context: None, tmp_path) -> None:
+    """
+    Test that ``get_df_chunks`` fetches the results of the last statement in
+    batches, stopping at the limit.
+    """
+    database = Database(
+        database_name="my_db",
+        sqlalchemy_uri=f"sqlite:///{tmp_path / 'chunks.db'}",
+    )
+    fetchmany = mocker.spy(database.db_engine_spec, "fetch_data_chunks")
+
+    chunks = list(
+        database.get_df_chunks(
+            "CREATE TABLE t AS SELECT 1 AS a UNION ALL SELECT 2 UNION ALL SELECT 3 "
+            "UNION ALL SELECT 4 UNION ALL SELECT 5; SELECT a FROM t ORDER BY a",
+            chunk_size=2,
+            limit=4,
+        )
+    )
+
+    assert [chunk["a"].tolist() for chunk in chunks] == [[1, 2], [3, 4]]
+    fetchmany.assert_called_once()
+
+    chunks = list(database.get_df_chunks("SELECT a FROM t WHERE a > 5"))
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert chunks[0].columns.tolist() == ["a"]
+
+
+def test_get_df_chunks_closes_cursors(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the cursor of the previous statements is closed when the last one
+    runs on a server-side cursor.
+    """
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    cursors = [mocker.MagicMock(), mocker.MagicMock()]
+    cursors[1].fetchmany.return_value = []
+    cursors[1].description = [("a",)]
+    conn = mocker.MagicMock()
+    conn.cursor.side_effect = cursors
+    get_raw_connection = mocker.patch.object(Database, "get_raw_connection")
+    get_raw_connection.return_value.__enter__.return_value = conn
+
+    chunks = list(database.get_df_chunks("SELECT 1; SELECT 2 AS a"))
+
+    assert chunks[0].columns.tolist() == ["a"]
+    cursors[0].close.assert_called_once()
+    cursors[1].close.assert_called_once()
+
+
+def test_get_df_chunks_no_result_set(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that nothing is fetched when the last statement has no result set.
+    """
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    cursor = mocker.MagicMock()
+    cursor.description = None
+    conn = mocker.MagicMock()
+    conn.cursor.return_value = cursor
+    get_raw_connection = mocker.patch.object(Database, "get_raw_connection")
+    get_raw_connection.return_value.__enter__.return_value = conn
+    fetch_data_chunks = mocker.spy(database.db_engine_spec, "fetch_data_chunks")
+
+    chunks = list(database.get_df_chunks("DELETE FROM t"))
+
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    fetch_data_chunks.assert_not_called()
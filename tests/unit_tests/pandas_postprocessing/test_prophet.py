@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 from datetime import datetime
+from importlib import import_module
 from importlib.util import find_spec
 
 import pandas as pd
@@ -184,3 +185,88 @@ def test_prophet_incorrect_time_grain():
             periods=10,
             confidence_interval=0.8,
         )
+
+
+@pytest.mark.skipif(not find_spec("prophet"), reason="requires prophet")
+def test_prophet_forecast_cache(app, mocker):
+    from flask_caching import Cache
+
+    prophet_module = import_module("superset.utils.pandas_postprocessing.prophet")
+
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.object(prophet_module.cache_manager, "_data_cache", cache)
+    fit_and_predict = mocker.spy(prophet_module, "_prophet_fit_and_predict")
+
+    first = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    assert fit_and_predict.call_count == 2
+
+    second = prophet(
+        df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+    )
+    assert fit_and_predict.call_count == 2
+    pd.testing.assert_frame_equal(first, second)
+
+    # changing the forecast parameters or the history of a series refits it
+    prophet(df=prophet_df, time_grain="P1M", periods=4, confidence_interval=0.9)
+    assert fit_and_predict.call_count == 4
+
+    changed_df = prophet_df.copy()
+    changed_df["a"] = changed_df["a"] + 1
+    prophet(df=changed_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    assert fit_and_predict.call_count == 5
+
+
+def test_prophet_forecast_cache_key():
+    _prophet_forecast_cache_key = import_module(
+        "superset.utils.pandas_postprocessing.prophet"
+    )._prophet_forecast_cache_key
+    df = pd.DataFrame({"ds": [datetime(2022, 1, 1), datetime(2022, 1, 2)], "y": [1, 2]})
+    key = _prophet_forecast_cache_key(df, periods=1, confidence_interval=0.8)
+    assert key == _prophet_forecast_cache_key(
+        df.copy(), periods=1, confidence_interval=0.8
+    )
+    assert key != _prophet_forecast_cache_key(df, periods=2, confidence_interval=0.8)
+    assert key != _prophet_forecast_cache_key(
+        df.assign(y=[1, 3]), periods=1, confidence_interval=0.8
+    )
+    assert key != _prophet_forecast_cache_key(
+        df.iloc[::-1], periods=1, confidence_interval=0.8
+    )
+
+
+@pytest.mark.parametrize("app", [{"PROPHET_MAX_WORKERS": 2}], indirect=True)
+def test_prophet_max_workers_daemon(app, mocker):
+    prophet_module = import_module("superset.utils.pandas_postprocessing.prophet")
+
+    with app.app_context():
+        assert prophet_module._prophet_max_workers() == 2
+
+        # daemonic processes can't start a process pool
+        mocker.patch.object(
+            prophet_module.multiprocessing,
+            "current_process",
+            return_value=mocker.MagicMock(daemon=True),
+        )
+        assert prophet_module._prophet_max_workers() == 1
+
+
+@pytest.mark.skipif(not find_spec("prophet"), reason="requires prophet")
+@pytest.mark.parametrize("app", [{"PROPHET_MAX_WORKERS": 2}], indirect=True)
+def test_prophet_process_pool(app, mocker):
+    prophet_module = import_module("superset.utils.pandas_postprocessing.prophet")
+
+    executor = mocker.spy(prophet_module, "ProcessPoolExecutor")
+    df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    executor.assert_called_once_with(max_workers=2)
+    assert list(df.columns) == [
+        DTTM_ALIAS,
+        "a__yhat",
+        "a__yhat_lower",
+        "a__yhat_upper",
+        "a",
+        "b__yhat",
+        "b__yhat_lower",
+        "b__yhat_upper",
+        "b",
+    ]
+    assert len(df) == 7
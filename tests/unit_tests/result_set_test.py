@@ -21,6 +21,7 @@ from datetime import datetime, timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
@@ -164,3 +165,82 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_convert_table_to_records() -> None:
+    """
+    Test that records built from the Arrow table serialize to the same JSON as the
+    records built through pandas.
+    """
+    from datetime import date, timedelta
+    from decimal import Decimal
+
+    from superset.dataframe import df_to_records
+    from superset.utils import json
+
+    data = [
+        (
+            1,
+            2**60,
+            None,
+            1.5,
+            "a",
+            datetime(2020, 1, 1),
+            datetime(2020, 1, 1, tzinfo=timezone.utc),
+            date(2020, 1, 2),
+            Decimal("1.20"),
+            True,
+            datetime(2020, 1, 1, 1, 2, 3, 120000, tzinfo=timezone(timedelta(hours=2))),
+        ),
+        (None, -(2**60), 3, float("nan"), None, None, None, None, None, None, None),
+        (
+            3,
+            5,
+            4,
+            None,
+            "=x",
+            datetime(2021, 5, 6, 7, 8, 9, 1),
+            datetime(2021, 5, 6, 7, 8, 9, 999999, tzinfo=timezone.utc),
+            date(1900, 1, 1),
+            Decimal("3"),
+            False,
+            datetime(2021, 5, 6, tzinfo=timezone(timedelta(hours=2))),
+        ),
+    ]
+    description = [(name, None, None, None, None, None, None) for name in "abcdefghijk"]
+    table = SupersetResultSet(data, description, BaseEngineSpec).pa_table
+
+    def dumps(records: list[dict[str, object]]) -> str:
+        return json.dumps(
+            records,
+            default=json.pessimistic_json_iso_dttm_ser,
+            ignore_nan=True,
+        )
+
+    records = SupersetResultSet.convert_table_to_records(table)
+
+    assert records[0]["b"] == str(2**60)
+    assert records[2]["f"] == "2021-05-06T07:08:09.000001"
+    assert records[0]["g"] == "2020-01-01T00:00:00+00:00"
+    assert dumps(records[:1] + records[2:]) == dumps(
+        df_to_records(SupersetResultSet.convert_table_to_df(table))[:1]
+        + df_to_records(SupersetResultSet.convert_table_to_df(table))[2:]
+    )
+    assert SupersetResultSet.convert_table_to_records(table.slice(0, 0)) == []
+
+
+def test_convert_table_to_records_unsigned() -> None:
+    """
+    Test that big unsigned integers are converted to strings.
+    """
+    table = pa.table({"a": pa.array([1, 2**60, None, 2**64 - 1], pa.uint64())})
+
+    assert SupersetResultSet.convert_table_to_records(table) == [
+        {"a": 1},
+        {"a": str(2**60)},
+        {"a": None},
+        {"a": str(2**64 - 1)},
+    ]
+
+    table = pa.table({"a": pa.array([1, 255], pa.uint8())})
+    assert SupersetResultSet.convert_table_to_records(table) == [{"a": 1}, {"a": 255}]
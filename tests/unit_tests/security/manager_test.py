@@ -979,3 +979,22 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_roles_cache_key(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that `get_rls_roles_cache_key` is made of the roles, not the filters.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    get_rls_filters = mocker.patch.object(sm, "get_rls_filters")
+    mocker.patch.object(sm, "get_guest_rls_filters_str", return_value=[])
+    datasource = mocker.MagicMock(is_rls_supported=True)
+    user = User(roles=[Role(id=3), Role(id=1)])
+
+    with override_user(user):
+        assert sm.get_rls_roles_cache_key(datasource) == ["roles-1,3"]
+
+        datasource.is_rls_supported = False
+        assert sm.get_rls_roles_cache_key(datasource) == []
+
+    get_rls_filters.assert_not_called()
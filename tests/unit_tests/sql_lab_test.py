@@ -125,6 +125,104 @@ def test_execute_sql_statement_with_rls(
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_sql_statement_progressive_fetch(
+    mocker: MockerFixture,
+    app: None,
+) -> None:
+    """
+    Test that `execute_sql_statement` reports the rows as they are fetched.
+    """
+    from superset.sql_lab import execute_sql_statement
+
+    mocker.patch.dict(
+        "superset.sql_lab.config",
+        {"SQLLAB_PROGRESSIVE_FETCH_BATCH_SIZE": 2},
+    )
+    query = mocker.MagicMock()
+    query.limit = 3
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    database.mutate_sql_based_on_config.return_value = "SELECT a FROM t LIMIT 4"
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_chunks.return_value = iter([[(1,), (2,)], [(3,), (4,)]])
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")
+    fetched: list[int] = []
+
+    execute_sql_statement(
+        "SELECT a FROM t",
+        query,
+        cursor=cursor,
+        log_params={},
+        on_fetch=lambda rows, _: fetched.append(len(rows)),
+    )
+
+    assert fetched == [2, 4]
+    db_engine_spec.fetch_data_chunks.assert_called_with(cursor, 2, 4)
+    db_engine_spec.fetch_data.assert_not_called()
+    SupersetResultSet.assert_called_with(
+        [(1,), (2,), (3,)], cursor.description, db_engine_spec
+    )
+
+
+def test_partial_results_publisher(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that partial results are republished each time the rows double.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sql_lab import PartialResultsPublisher
+    from superset.utils.core import zlib_decompress
+
+    mocker.patch("superset.sql_lab.db")
+    mocker.patch("superset.sql_lab.results_backend_use_msgpack", False)
+    results_backend = mocker.patch("superset.sql_lab.results_backend")
+    query = mocker.MagicMock()
+    query.id = 1
+    query.limit = 4
+    query.database.db_engine_spec = BaseEngineSpec
+    query.database.cache_timeout = 60
+    query.to_dict.return_value = {}
+    description = [("a", "INTEGER", None, None, None, None, None)]
+
+    publisher = PartialResultsPublisher(query, expand_data=False)
+    assert publisher.results_key.startswith("partial:1:")
+    publisher([(1,)], description)
+    publisher([(1,)], description)
+    publisher([(1,), (2,), (3,)], description)
+    publisher([(1,), (2,), (3,), (4,), (5,)], description)
+
+    assert results_backend.set.call_count == 2
+    key, value, timeout = results_backend.set.call_args[0]
+    assert (key, timeout) == (publisher.results_key, 60)
+    payload = json.loads(zlib_decompress(value))
+    assert payload["status"] == QueryStatus.RUNNING
+    assert payload["query"]["state"] == QueryStatus.RUNNING
+    assert payload["data"] == [{"a": 1}, {"a": 2}, {"a": 3}]
+    query.set_extra_json_key.assert_any_call(
+        "partial_results_key", publisher.results_key
+    )
+    assert query.rows == 3
+    assert query.progress == 75
+
+    publisher.discard()
+    query.set_extra_json_key.assert_called_with("partial_results_key", None)
+    results_backend.delete.assert_called_with(publisher.results_key)
+
+
+def test_get_partial_results_query_id() -> None:
+    from superset.sqllab.utils import (
+        get_partial_results_key,
+        get_partial_results_query_id,
+    )
+
+    assert get_partial_results_query_id(get_partial_results_key(42)) == 42
+    assert get_partial_results_query_id("abc") is None
+    assert get_partial_results_query_id("partial:abc:def") is None
+
+
 def test_sql_lab_insert_rls_as_subquery(
     mocker: MockerFixture,
     session: Session,
@@ -53,3 +53,39 @@ def test_load_chart_data_into_cache_with_error(
     mock_async_query_manager.update_job.assert_called_once_with(
         job_metadata, "error", errors=expected_errors
     )
+
+
+@mock.patch("superset.tasks.async_queries.database_concurrency_slot")
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+def test_load_chart_data_into_cache_throttled(
+    mock_query_context_schema_cls,
+    mock_async_query_manager,
+    mock_security_manager,
+    mock_database_concurrency_slot,
+    app_context,
+):
+    """Test that the task is retried when the database has no free query slot"""
+    from superset.exceptions import DatabaseConcurrencyLimitExceededException
+    from superset.tasks.async_queries import load_chart_data_into_cache
+
+    job_metadata = {"user_id": 1}
+    form_data = {}
+    mock_database_concurrency_slot.side_effect = (
+        DatabaseConcurrencyLimitExceededException()
+    )
+
+    with mock.patch.object(
+        load_chart_data_into_cache, "retry", side_effect=RuntimeError
+    ) as mock_retry:
+        with pytest.raises(RuntimeError):
+            load_chart_data_into_cache(job_metadata, form_data, queued_at=1.0)
+
+    mock_retry.assert_called_once_with(
+        args=(job_metadata, form_data),
+        kwargs={"queued_at": 1.0},
+        countdown=5,
+        max_retries=None,
+    )
+    mock_async_query_manager.update_job.assert_not_called()
@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument, redefined-outer-name
+
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.utils.cache_generation import (
+    bump_generation,
+    bump_generation_on_commit,
+    get_generation,
+    RLS_GENERATION,
+)
+
+
+@pytest.fixture
+def data_cache(app_context: None, mocker: MockerFixture) -> Cache:
+    cache = Cache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    mocker.patch(
+        "superset.utils.cache_generation.cache_manager",
+        data_cache=cache,
+    )
+    mocker.patch(
+        "superset.utils.cache_generation.time.time",
+        return_value=1000,
+    )
+    return cache
+
+
+def test_generation(data_cache: Cache) -> None:
+    """
+    Test that generations start from the current time and are incremented.
+    """
+    assert get_generation("1__table") == 1_000_000
+    bump_generation("1__table")
+    assert get_generation("1__table") == 1_000_001
+    assert get_generation(RLS_GENERATION) == 1_000_000
+
+    bump_generation("2__table")
+    assert get_generation("2__table") == 1_000_001
+
+
+def test_bump_generation_on_commit(
+    data_cache: Cache,
+    session: Session,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that generations are bumped once the transaction is committed.
+    """
+    mocker.patch.dict(current_app.config, {"DATASOURCE_CACHE_GENERATIONS": True})
+    get_generation("1__table")
+
+    bump_generation_on_commit(session, "1__table")
+    bump_generation_on_commit(session, "1__table")
+    assert get_generation("1__table") == 1_000_000
+
+    session.commit()
+    assert get_generation("1__table") == 1_000_001
+
+
+def test_bump_generation_on_commit_disabled(
+    data_cache: Cache,
+    session: Session,
+) -> None:
+    """
+    Test that generations are not bumped unless enabled.
+    """
+    get_generation("1__table")
+    bump_generation_on_commit(session, "1__table")
+    session.commit()
+    assert get_generation("1__table") == 1_000_000
+
+
+def test_query_cache_key_generation(data_cache: Cache, mocker: MockerFixture) -> None:
+    """
+    Test that the generations replace the datasource and RLS inputs of the key.
+    """
+    from superset.common.query_context_processor import QueryContextProcessor
+
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"DATASOURCE_CACHE_GENERATIONS": True},
+    )
+    security_manager = mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        new=mocker.MagicMock(),
+    )
+    security_manager.get_rls_roles_cache_key.return_value = ["roles-1,2"]
+    query_context = mocker.MagicMock()
+    query_context.datasource.uid = "1__table"
+    query_context.datasource.get_extra_cache_keys.return_value = []
+    query_obj = mocker.MagicMock()
+    processor = QueryContextProcessor(query_context)
+
+    processor.query_cache_key(query_obj)
+    bump_generation("1__table")
+    processor.query_cache_key(query_obj)
+
+    first, second = (call.kwargs for call in query_obj.cache_key.call_args_list)
+    assert first == {
+        "datasource": "1__table",
+        "extra_cache_keys": [],
+        "rls": ["roles-1,2"],
+        "generation": 1_000_000,
+        "rls_generation": 1_000_000,
+    }
+    assert second["generation"] == 1_000_001
+    security_manager.get_rls_cache_key.assert_not_called()
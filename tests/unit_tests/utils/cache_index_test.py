@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument
+
+from flask import current_app
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+from superset.utils.cache_index import DatasourceCacheKeyIndex
+
+
+def test_cache_key_index(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test indexing and invalidating cache keys in a non-Redis backend.
+    """
+    cache = Cache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    index = DatasourceCacheKeyIndex(cache)
+    time = mocker.patch("superset.utils.cache_index.time.time", return_value=1000)
+
+    for key in ("a", "b"):
+        cache.set(key, 1)
+        index.add("1__table", key, 60)
+    cache.set("c", 1)
+    index.add("1__table", "c", 10)
+    cache.set("d", 1)
+    index.add("2__table", "d", 0)
+
+    time.return_value = 1020
+    assert index.get("1__table") == ["a", "b"]
+    assert index.get("2__table") == ["d"]
+
+    assert index.invalidate(["1__table", "3__table"]) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("d") == 1
+    assert index.get("1__table") == []
+
+
+def test_cache_key_index_redis(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test indexing and invalidating cache keys with Redis sorted sets.
+    """
+    cache = mocker.MagicMock()
+    cache.cache.key_prefix = "superset_"
+    client = cache.cache._write_client
+    pipeline = client.pipeline.return_value
+    mocker.patch("superset.utils.cache_index.time.time", return_value=1000)
+    index = DatasourceCacheKeyIndex(cache)
+
+    # the index was just created
+    pipeline.execute.return_value = [1, 0, [(b"a", 1060.0)], -1]
+    index.add("1__table", "a", 60)
+    client.expire.assert_called_with("superset_cache_key_index:1__table", 121)
+    client.persist.assert_not_called()
+
+    # the index expires before the new key
+    client.expire.reset_mock()
+    pipeline.execute.return_value = [1, 0, [(b"a", 1060.0)], 30]
+    index.add("1__table", "a", 60)
+    pipeline.zadd.assert_called_with("superset_cache_key_index:1__table", {"a": 1060})
+    pipeline.zremrangebyscore.assert_called_with(
+        "superset_cache_key_index:1__table", "-inf", 1000
+    )
+    client.expire.assert_called_with("superset_cache_key_index:1__table", 121)
+
+    # the index outlives the new key
+    client.expire.reset_mock()
+    pipeline.execute.return_value = [1, 0, [(b"b", 1060.0)], 100]
+    index.add("1__table", "b", 60)
+    client.expire.assert_not_called()
+
+    # the new key never expires
+    pipeline.execute.return_value = [1, 0, [(b"c", float("inf"))], 100]
+    index.add("1__table", "c", 0)
+    client.persist.assert_called_with("superset_cache_key_index:1__table")
+
+    # the index is persisted as long as it has a key that never expires
+    client.persist.reset_mock()
+    pipeline.execute.return_value = [1, 0, [(b"c", float("inf"))], -1]
+    index.add("1__table", "d", 60)
+    client.expire.assert_not_called()
+    client.persist.assert_not_called()
+
+    pipeline.execute.return_value = [[b"a", b"b", b"c"], 1]
+    assert index.invalidate(["1__table"]) == 3
+    client.pipeline.assert_called_with(transaction=True)
+    pipeline.zrangebyscore.assert_called_with(
+        "superset_cache_key_index:1__table", 1000, "+inf"
+    )
+    cache.delete_many.assert_called_with("a", "b", "c")
+
+
+def test_set_and_log_cache_index(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that cached values are indexed instead of stored in the metadata database.
+    """
+    from superset.utils.cache import set_and_log_cache
+
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "STORE_CACHE_KEYS_IN_CACHE_BACKEND": True,
+            "STORE_CACHE_KEYS_IN_METADATA_DB": False,
+        },
+    )
+    db = mocker.patch("superset.utils.cache.db")
+    cache = Cache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+
+    set_and_log_cache(cache, "key", {"df": 1}, 60, datasource_uid="1__table")
+
+    assert DatasourceCacheKeyIndex(cache).get("1__table") == ["key"]
+    db.session.add.assert_not_called()
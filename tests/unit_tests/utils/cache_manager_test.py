@@ -0,0 +1,203 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument
+
+from typing import Any
+
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.utils.cache_manager import LocalLRUCache, TieredCache
+
+
+def test_local_lru_cache_bytes_bound() -> None:
+    """
+    Test that the local cache evicts the least recently used entries by size.
+    """
+    cache = LocalLRUCache(max_bytes=10, max_timeout=60)
+
+    assert cache.set("a", b"1234")
+    assert cache.set("b", b"1234")
+    assert cache.get("a") == b"1234"
+    assert cache.set("c", b"1234")
+    assert cache.size == 8
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+
+    assert not cache.set("d", b"12345678901")
+    assert cache.get("d") is None
+
+
+def test_local_lru_cache_timeout(mocker: MockerFixture) -> None:
+    """
+    Test that local cache entries expire at the lowest of the two timeouts.
+    """
+    monotonic = mocker.patch("superset.utils.cache_manager.time.monotonic")
+    monotonic.return_value = 0
+    cache = LocalLRUCache(max_bytes=100, max_timeout=60)
+    cache.set("a", b"1", timeout=10)
+    cache.set("b", b"1", timeout=3600)
+
+    monotonic.return_value = 30
+    assert cache.get("a") is None
+    assert cache.get("b") == b"1"
+
+    monotonic.return_value = 61
+    assert cache.get("b") is None
+    assert cache.size == 0
+
+
+def test_local_lru_cache_tags() -> None:
+    """
+    Test evicting the local cache entries with a given tag.
+    """
+    cache = LocalLRUCache(max_bytes=100, max_timeout=60)
+    cache.set("a", b"1", tags=["1__table"])
+    cache.set("b", b"1", tags=["1__table", "2__table"])
+    cache.set("c", b"1", tags=["2__table"])
+
+    assert cache.delete_tagged("1__table") == 2
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == b"1"
+    assert cache.delete_tagged("1__table") == 0
+
+
+def get_tiered_cache(**config: Any) -> TieredCache:
+    cache = TieredCache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    cache.init_local_cache("data_cache", {"MAX_BYTES": 1024, **config})
+    return cache
+
+
+def test_tiered_cache(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that values are read from the local cache and reported per tier.
+    """
+    stats_logger = mocker.patch.dict(
+        current_app.config, {"STATS_LOGGER": mocker.MagicMock()}
+    )["STATS_LOGGER"]
+    cache = get_tiered_cache()
+    assert cache.get("foo") is None
+
+    cache.cache.set("foo", {"a": [1, 2]})
+    value = cache.get("foo")
+    assert value == {"a": [1, 2]}
+
+    # the local cache holds a copy, not the returned object
+    value["a"].append(3)
+    cache.cache.delete("foo")
+    assert cache.get("foo") == {"a": [1, 2]}
+
+    assert [call.args[0] for call in stats_logger.incr.call_args_list] == [
+        "data_cache.l1.miss",
+        "data_cache.l2.miss",
+        "data_cache.l1.miss",
+        "data_cache.l2.hit",
+        "data_cache.l1.hit",
+    ]
+
+
+def test_tiered_cache_validate_on_hit(app_context: None) -> None:
+    """
+    Test that entries deleted from the shared cache are not read locally.
+    """
+    cache = get_tiered_cache(VALIDATE_ON_HIT=True)
+    cache.set("foo", "bar")
+    assert cache.get("foo") == "bar"
+
+    cache.cache.delete("foo")
+    assert cache.get("foo") is None
+    assert cache.local_cache is not None
+    assert cache.local_cache.get("foo") is None
+
+
+def test_tiered_cache_invalidation(app_context: None) -> None:
+    """
+    Test that writes, deletes and tags invalidate the local cache.
+    """
+    cache = get_tiered_cache()
+    assert cache.local_cache is not None
+
+    cache.set_tagged("foo", "bar", tags=["1__table"])
+    cache.set_many({"foo": "baz"})
+    assert cache.local_cache.get("foo") is None
+    assert cache.get("foo") == "baz"
+
+    cache.delete(key="foo")
+    assert cache.get("foo") is None
+
+    cache.set_tagged("foo", "bar", tags=["1__table"])
+    assert cache.delete_tagged("1__table") == 1
+    assert cache.local_cache.get("foo") is None
+    assert cache.get("foo") == "bar"
+
+
+def test_tiered_cache_remaining_timeout(
+    app_context: None, mocker: MockerFixture
+) -> None:
+    """
+    Test that local entries read from Redis expire with the Redis entry.
+    """
+    cache = get_tiered_cache(MAX_TIMEOUT=300)
+    cache.cache.key_prefix = "superset_"
+    cache.cache._read_client = mocker.MagicMock()
+    cache.cache._read_client.pttl.return_value = 5000
+    assert cache._remaining_timeout("foo") == 5
+    cache.cache._read_client.pttl.assert_called_with("superset_foo")
+
+    cache.cache._read_client.pttl.return_value = -1
+    assert cache._remaining_timeout("foo") is None
+
+
+def test_tiered_cache_disabled(app_context: None) -> None:
+    """
+    Test that the cache behaves as a regular cache without a local config.
+    """
+    cache = TieredCache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    cache.init_local_cache("data_cache", None)
+
+    cache.set_tagged("foo", "bar", tags=["1__table"])
+    assert cache.local_cache is None
+    assert cache.get("foo") == "bar"
+    assert cache.delete_tagged("1__table") == 0
+
+
+def test_filter_state_cache_not_tiered(mocker: MockerFixture, app: Any) -> None:
+    """
+    Test that the filter state cache never keeps values in the local cache.
+    """
+    from superset.utils.cache_manager import CacheManager
+
+    mocker.patch.dict(
+        app.config,
+        {
+            "FILTER_STATE_CACHE_CONFIG": {"CACHE_TYPE": "SimpleCache"},
+            "LOCAL_CACHE_CONFIG": {
+                "DATA_CACHE_CONFIG": {"MAX_BYTES": 1024},
+                "FILTER_STATE_CACHE_CONFIG": {"MAX_BYTES": 1024},
+            },
+        },
+    )
+    manager = CacheManager()
+    manager.init_app(app)
+
+    assert isinstance(manager.data_cache, TieredCache)
+    assert not isinstance(manager.filter_state_cache, TieredCache)
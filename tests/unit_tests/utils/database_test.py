@@ -0,0 +1,59 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.exceptions import DatabaseConcurrencyLimitExceededException
+from superset.utils.database import database_concurrency_slot
+
+
+@pytest.mark.parametrize(
+    "app",
+    [
+        {
+            "DATABASE_CONCURRENCY_LIMITS": {"slow": 1},
+            "DATABASE_CONCURRENCY_LIMIT_DEFAULT": None,
+        }
+    ],
+    indirect=True,
+)
+def test_database_concurrency_slot(app_context: None, mocker: MockerFixture) -> None:
+    from superset.models.core import Database
+
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+    slow = Database(id=1, database_name="slow")
+    fast = Database(id=2, database_name="fast")
+
+    with database_concurrency_slot(slow, queued_at=0):
+        with pytest.raises(DatabaseConcurrencyLimitExceededException):
+            with database_concurrency_slot(slow):
+                pass
+
+        # databases without a limit don't need a slot
+        with database_concurrency_slot(fast):
+            with database_concurrency_slot(fast):
+                pass
+
+    with database_concurrency_slot(slow):
+        pass
+
+    stats_logger.incr.assert_called_once_with("database.1.throttled")
+    stats_logger.timing.assert_called_once_with("database.1.wait_time", mocker.ANY)
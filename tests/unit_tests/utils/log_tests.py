@@ -16,7 +16,11 @@
 # under the License.
 
 
-from superset.utils.log import get_logger_from_status
+import threading
+
+from pytest_mock import MockerFixture
+
+from superset.utils.log import AsyncDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +39,60 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_async_db_event_logger_flush_in_batches(mocker: MockerFixture) -> None:
+    """
+    Test that queued logs are inserted in batches of ``batch_size``.
+    """
+    save_logs = mocker.patch.object(AsyncDBEventLogger, "save_logs")
+    mocker.patch.object(AsyncDBEventLogger, "_ensure_worker")
+    event_logger = AsyncDBEventLogger(batch_size=2)
+
+    event_logger.log(
+        1, "action", None, 10, None, None, records=[{"a": i} for i in range(5)]
+    )
+    assert save_logs.call_count == 0
+
+    assert event_logger.flush() == 5
+    assert [len(call.args[0]) for call in save_logs.call_args_list] == [2, 2, 1]
+    # the logs are timestamped when they're queued, not when they're inserted
+    assert all(
+        log.dttm is not None
+        for call in save_logs.call_args_list
+        for log in call.args[0]
+    )
+    assert event_logger.flush() == 0
+
+
+def test_async_db_event_logger_drop_when_full(mocker: MockerFixture) -> None:
+    """
+    Test that logs are dropped and counted when the queue is full.
+    """
+    mocker.patch.object(AsyncDBEventLogger, "_ensure_worker")
+    incr = mocker.patch("superset.utils.log.stats_logger_manager.instance.incr")
+    event_logger = AsyncDBEventLogger(max_queue_size=2)
+
+    event_logger.log(1, "action", None, 10, None, None, records=[{}, {}, {}])
+
+    assert event_logger.dropped == 1
+    incr.assert_called_once_with("event_logger.dropped")
+
+
+def test_async_db_event_logger_background_thread(mocker: MockerFixture) -> None:
+    """
+    Test that logs are inserted from the background thread.
+    """
+    flushed = threading.Event()
+    save_logs = mocker.patch.object(
+        AsyncDBEventLogger, "save_logs", side_effect=lambda logs: flushed.set()
+    )
+    event_logger = AsyncDBEventLogger(flush_interval=0.01)
+
+    event_logger.log(1, "action", None, 10, None, None, records=[{"a": 1}])
+
+    assert flushed.wait(timeout=5)
+    event_logger.shutdown()
+    (logs,) = save_logs.call_args.args
+    assert [log.json for log in logs] == ['{"a": 1}']
+    assert logs[0].action == "action"
@@ -0,0 +1,77 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from io import BytesIO
+
+import pytest
+from PIL import Image, PdfParser
+
+from superset.commands.report.exceptions import (
+    ReportSchedulePdfFailedError,
+    ReportScheduleScreenshotFailedError,
+)
+from superset.utils.pdf import build_pdf_from_screenshots
+
+
+def _png(size: tuple[int, int], mode: str = "RGBA") -> bytes:
+    buf = BytesIO()
+    Image.new(mode, size).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def test_build_pdf_from_screenshots() -> None:
+    """
+    Test that every screenshot becomes a page of the PDF.
+    """
+    snapshots = [_png((800, 600)), _png((800, 300), mode="RGB"), _png((800, 100))]
+    pdf = build_pdf_from_screenshots(snapshots)
+
+    assert pdf.startswith(b"%PDF")
+    assert len(PdfParser.PdfParser(buf=pdf).pages) == 3
+
+
+def test_build_pdf_from_screenshots_generator() -> None:
+    """
+    Test that screenshots can be streamed from a generator.
+    """
+    pdf = build_pdf_from_screenshots(_png((100, 100)) for _ in range(5))
+
+    assert len(PdfParser.PdfParser(buf=pdf).pages) == 5
+
+
+def test_build_pdf_from_screenshots_errors() -> None:
+    """
+    Test that empty or invalid screenshots raise the report exception.
+    """
+    with pytest.raises(ReportSchedulePdfFailedError):
+        build_pdf_from_screenshots([])
+
+    with pytest.raises(ReportSchedulePdfFailedError):
+        build_pdf_from_screenshots([b"not an image"])
+
+
+def test_build_pdf_from_screenshots_capture_error() -> None:
+    """
+    Test that errors raised while capturing the screenshots are not masked.
+    """
+
+    def snapshots() -> Iterator[bytes]:
+        yield _png((100, 100))
+        raise ReportScheduleScreenshotFailedError()
+
+    with pytest.raises(ReportScheduleScreenshotFailedError):
+        build_pdf_from_screenshots(snapshots())
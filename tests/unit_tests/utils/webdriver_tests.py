@@ -0,0 +1,88 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from superset.utils.webdriver import WebDriverPlaywright, WebDriverSelenium
+
+
+def test_get_tiled_screenshots_playwright(mocker: MockerFixture) -> None:
+    """
+    Test that the dashboard is captured in concurrent pages, one clip per tile.
+    """
+    mocker.patch("superset.utils.webdriver.sync_playwright", create=True)
+    mocker.patch(
+        "superset.utils.webdriver.PlaywrightTimeout",
+        type("PlaywrightTimeout", (Exception,), {}),
+        create=True,
+    )
+    mocker.patch(
+        "superset.utils.webdriver.PlaywrightError",
+        type("PlaywrightError", (Exception,), {}),
+        create=True,
+    )
+    pages = []
+
+    def new_page() -> MagicMock:
+        page = MagicMock()
+        page.locator.return_value.bounding_box.return_value = {
+            "x": 0,
+            "y": 50,
+            "width": 1600,
+            "height": 4500,
+        }
+        page.locator.return_value.all.return_value = []
+        page.screenshot.side_effect = lambda clip, full_page: clip["y"]
+        pages.append(page)
+        return page
+
+    context = MagicMock()
+    context.new_page.side_effect = new_page
+    mocker.patch.object(WebDriverPlaywright, "create_context", return_value=context)
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {
+            "SCREENSHOT_TILED_MAX_PAGES": 2,
+            "SCREENSHOT_SELENIUM_HEADSTART": 0,
+            "SCREENSHOT_SELENIUM_ANIMATION_WAIT": 0,
+        },
+    )
+
+    driver = WebDriverPlaywright("chrome", (1600, 2000))
+    tiles = driver.get_tiled_screenshots(
+        "http://host/", "standalone", MagicMock(), 2000
+    )
+
+    # the tiles are yielded as they are captured
+    assert next(tiles) == 50
+    assert len(pages) == 2
+    assert list(tiles) == [2050, 4050]
+    last_clip = pages[0].screenshot.call_args_list[-1].kwargs["clip"]
+    assert last_clip["height"] == 500
+
+
+def test_get_tiled_screenshots_fallback(mocker: MockerFixture) -> None:
+    """
+    Test that drivers without tile support return a single screenshot.
+    """
+    mocker.patch.object(WebDriverSelenium, "get_screenshot", return_value=b"img")
+    driver = WebDriverSelenium("firefox", (1600, 2000))
+
+    assert list(
+        driver.get_tiled_screenshots("http://host/", "standalone", None, 2000)
+    ) == [b"img"]